@@ -15,7 +15,6 @@ Key Features:
 
 Dependencies:
 - pylone
-- whitenoise
 - demo (custom application modules)
 
 Usage:
@@ -31,27 +30,64 @@ import logging
 import signal
 import threading
 import sys
-import asyncio
 
-from whitenoise import WhiteNoise
 from typing import Callable, Dict, Any  # Add this import
 from pylone.app import App
 from pylone.app_proxy import AppProxy
+from pylone.accesslog import AccessLogWriter
+from pylone.static import AssetManifest, StaticFiles, set_manifest
+from pylone.session import session_manager, SignedCookieSession, SQLiteSession
+from pylone.template import configure_templates
+from pylone.shared_cache import SharedCache
+from pylone.fragment_cache import fragment_cache
 from demo.routes import router
+from demo.database import db
 from demo.middlewares.logging_middleware import LoggingMiddleware
 from demo.middlewares.auth_middleware import AuthMiddleware
 from demo.middlewares.staticfile_middleware import StaticFileMiddleware
+from demo.middlewares.capture_middleware import CaptureMiddleware
 from demo.settings import config
 
 from wsgiref.simple_server import make_server
-#nlp test
-from pylone.chat_handler import ChatHandler  # Import the ChatHandler
-import spacy  # Import SpaCy for NLP
-from pylone.chatbot import FluwdChatBot
+
+logger = logging.getLogger("demo.app")
 
 # Determine the path to the static directory
 static_dir = os.path.join(os.path.dirname(__file__), 'static')
-logging.info(f"Static directory: {static_dir}")
+logger.info("Static directory: %s", static_dir)
+
+# Load the fingerprint manifest written by `run.py --build-assets`, re-hashing
+# only files changed since, so templates can link to cache-forever URLs
+manifest_path = config.STATIC_MANIFEST or os.path.join(static_dir, "manifest.json")
+manifest = AssetManifest.load_or_build(static_dir, manifest_path)
+set_manifest(manifest)
+logger.info("Fingerprinted %d static files", len(manifest.assets))
+
+# One static file engine, shared by the middleware and the router
+static_files = StaticFiles(static_dir, manifest=manifest, preload=False)  # Preloaded by the warm-up
+router.mount_static(static_files)
+
+# Templates: skip per-render change checks and keep bytecode across restarts when configured
+configure_templates(auto_reload=config.TEMPLATE_AUTO_RELOAD, bytecode_cache_dir=config.TEMPLATE_CACHE_DIR)
+
+# Keep sessions in signed cookies instead of this process's memory when
+# SESSION_BACKEND=cookie, so any number of workers can validate them
+if config.SESSION_BACKEND == "cookie":
+    session_manager.use(SignedCookieSession([config.SECRET_KEY, *config.SECRET_KEY_FALLBACKS],
+                                            encrypt=config.SESSION_ENCRYPT))
+    logger.info("Sessions: signed cookies")
+elif config.SESSION_BACKEND == "sqlite":
+    # Revocable sessions shared by the workers on this host
+    session_manager.use(SQLiteSession(config.SESSION_DB))
+    logger.info("Sessions: shared SQLite store %s", config.SESSION_DB)
+
+# Share cached responses and template fragments between the workers on this
+# host, so each page is rendered once per TTL for all of them
+if config.SHARED_CACHE:
+    shared_cache = SharedCache(config.SHARED_CACHE)
+    router.response_cache.use_shared(shared_cache)
+    fragment_cache.use_shared(shared_cache)
+    logger.info("Shared response cache: %s", config.SHARED_CACHE)
 
 # Create the base app
 base_app = App(router)
@@ -71,26 +107,58 @@ base_app.add_websocket_route("/chat", chat_handler)
 '''
 
 
-# Load a SpaCy model
-nlp = spacy.load("en_core_web_sm")
+# The chatbot loads spaCy and a spell checker on first use, so it is created
+# on the first WebSocket connection instead of at import time. HTTP-only
+# workers (--no-ws) never pay for it.
+chat_handler_instance = None
+
+def get_chat_handler():
+    """Return the shared chatbot, creating it on first use."""
+    global chat_handler_instance
+    if chat_handler_instance is None:
+        from pylone.chatbot import FluwdChatBot  # Also keeps asyncio out of HTTP-only startup
 
-# Initialize the ChatHandler with a greeting and the NLP model
-# original chat_handler_instance = ChatHandler(greeting=config.CHAT_GREETING, nlp_model=nlp)
-chat_handler_instance =FluwdChatBot(greeting=config.CHAT_GREETING)
+        chat_handler_instance = FluwdChatBot(greeting=config.CHAT_GREETING)
+    return chat_handler_instance
 
-# Define a WebSocket route using the ChatHandler instance
+# Define a WebSocket route using the chatbot instance
 async def chat_route(websocket):
-    await chat_handler_instance.handle_chat(websocket)
+    await get_chat_handler().handle_chat(websocket)
+
+def warm_chatbot():
+    """Load the chatbot's spaCy model and spell checker and run them once."""
+    chatbot = get_chat_handler()
+    chatbot.correct_spelling("hello")
+    chatbot.extract_entities("hello")
 
 
 
 # Add the WebSocket route to the base app
 base_app.add_websocket_route("/chat", chat_route)
 
+# Write a batched access log from a background thread when ACCESS_LOG is set
+access_log = None
+if config.ACCESS_LOG:
+    access_log = AccessLogWriter(config.ACCESS_LOG, fmt=config.ACCESS_LOG_FORMAT, sample=config.ACCESS_LOG_SAMPLE)
+
 # Wrap the app with middlewares for WSGI processing
-wsgi_app = LoggingMiddleware(base_app)
-wsgi_app = StaticFileMiddleware(wsgi_app, static_dir=static_dir)
+wsgi_app = base_app if access_log else LoggingMiddleware(base_app)
+wsgi_app = StaticFileMiddleware(wsgi_app, static_files=static_files)
 wsgi_app = AuthMiddleware(wsgi_app)
 
+# The access log sits outermost so static files and redirects are logged too
+if access_log:
+    wsgi_app = LoggingMiddleware(wsgi_app, access_log=access_log)
+
+# Record traffic for replay when CAPTURE_FILE is set
+if config.CAPTURE_FILE:
+    wsgi_app = CaptureMiddleware(wsgi_app, capture_file=config.CAPTURE_FILE)
+
+# Warm-up steps run before the HTTP server accepts traffic
+base_app.warmup.add_templates()  # Every shared engine, see pylone.template.get_template_engine()
+base_app.warmup.add_step("static", static_files.preload)
+base_app.warmup.add_step("database", db.prime)
+base_app.warmup.add_requests(wsgi_app, config.WARMUP_REQUESTS)
+
 # Create the proxy app
 app = AppProxy(base_app, wsgi_app)
@@ -0,0 +1,182 @@
+"""
+End-to-end Benchmarks for the Demo Application.
+
+This module drives the real demo application stack (middlewares, router and
+controllers from demo/app.py) in-process through the WSGI interface using
+pylone.bench. No sockets are opened. Each scenario reports requests/sec,
+p50/p99 latency and allocations per request, and the run is compared
+against a stored baseline so that a regression past the threshold fails
+with a non-zero exit status.
+
+Scenarios:
+    static_css, static_js: Static files served by StaticFileMiddleware.
+    login_page: GET /login rendering the login template.
+    demo_page: GET /demo, served from the full-page response cache.
+    login_post: POST /login with valid JSON credentials.
+    dashboard: GET /dashboard with an authenticated session.
+    ajax_data, test_json: The AJAX JSON endpoints.
+    not_found: An authenticated request for an unknown path (404).
+
+Session scaling (--session-scaling) drives pylone.session.Session directly
+from 1 to 16 threads, with a single shard (one lock) and with the default 16
+shards, and reports the aggregate throughput of a 90% lookup / 10%
+create-and-delete mix.
+
+Usage:
+    python -m demo.benchmarks                      # Run and compare against the baseline
+    python -m demo.benchmarks --save-baseline      # Run and store a new baseline
+    python -m demo.benchmarks -s dashboard -n 5000 # Run a single scenario
+    python -m demo.benchmarks --session-scaling    # Session store throughput per thread count
+
+ Author: Agile Creative Labs Inc.
+ Version: 1.0.0
+ Date: 10/18/2026
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import threading
+
+from pylone.log import configure_logging
+from pylone.bench import (
+    Scenario,
+    run_benchmarks,
+    load_baseline,
+    save_baseline,
+    compare_to_baseline,
+    format_report,
+)
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "bench_baseline.json")
+BENCH_USERNAME = "bench@pylone.local"
+BENCH_PASSWORD = "bench-password"
+
+
+def build_scenarios():
+    """Create the benchmark user and session, and return the demo scenarios."""
+    from demo.database import db
+    from pylone.session import session_manager
+    from pylone.static import make_etag
+
+    db.add_user(BENCH_USERNAME, BENCH_PASSWORD)
+    user = db.get_user(BENCH_USERNAME)
+    session_cookie = {"Cookie": f"session_id={session_manager.create_session(user[0])}"}
+    credentials = json.dumps({"username": BENCH_USERNAME, "password": BENCH_PASSWORD})
+    style_etag = make_etag(os.stat(os.path.join(os.path.dirname(__file__), "static", "css", "style.css")))
+
+    return [
+        Scenario("static_css", "GET", "/static/css/style.css"),
+        Scenario("static_js", "GET", "/static/js/app.js"),
+        Scenario("static_304", "GET", "/static/css/style.css", {"If-None-Match": style_etag}, expect_status=304),
+        Scenario("login_page", "GET", "/login"),
+        Scenario("demo_page", "GET", "/demo"),
+        Scenario("login_post", "POST", "/login", {"Content-Type": "application/json"}, credentials),
+        Scenario("dashboard", "GET", "/dashboard", session_cookie),
+        Scenario("ajax_data", "GET", "/ajax/data"),
+        Scenario("test_json", "GET", "/test-json"),
+        Scenario("not_found", "GET", "/no-such-page", session_cookie, expect_status=404),
+    ]
+
+
+def session_throughput(store, threads, operations, session_ids):
+    """Run `operations` session operations on each of `threads` threads and return operations/sec."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        lookups = [rng.choice(session_ids) for _ in range(operations)]
+        barrier.wait()
+        for i, session_id in enumerate(lookups):
+            if i % 10:
+                store.get_session(session_id)
+            else:
+                store.delete_session(store.create_session(i))
+
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * operations / (time.perf_counter() - started)
+
+
+def session_scaling(thread_counts=(1, 2, 4, 8, 16), operations=50000, shard_counts=(1, 16), live_sessions=10000):
+    """Print session store throughput for each thread count and shard count."""
+    from pylone.session import Session
+
+    print(f"{'threads':>8}" + "".join(f"{f'{n} shard' + ('s' if n > 1 else ''):>14}" for n in shard_counts))
+    for threads in thread_counts:
+        row = f"{threads:>8}"
+        for shards in shard_counts:
+            store = Session(shards=shards, sweep_interval=None)
+            session_ids = [store.create_session(i) for i in range(live_sessions)]
+            row += f"{session_throughput(store, threads, operations, session_ids):>14,.0f}"
+        print(row + "  ops/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the demo application in-process.")
+    parser.add_argument("-n", "--iterations", type=int, default=2000, help="Timed requests per scenario (default: 2000)")
+    parser.add_argument("--warmup", type=int, default=200, help="Untimed requests per scenario (default: 200)")
+    parser.add_argument("--alloc-iterations", type=int, default=200, help="Requests traced for allocations (default: 200)")
+    parser.add_argument("-s", "--scenario", action="append", help="Only run the named scenario (repeatable)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline file (default: demo/bench_baseline.json)")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed regression as a fraction (default: 0.15)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--db", help="SQLite database to use (default: a temporary file)")
+    parser.add_argument("--session-scaling", action="store_true",
+                        help="Measure session store throughput from 1 to 16 threads instead")
+    args = parser.parse_args(argv)
+
+    if args.session_scaling:
+        session_scaling()
+        return 0
+
+    # The demo database is chosen at import time, so point it at a scratch
+    # file before any demo module is loaded.
+    os.environ["DB_NAME"] = args.db or os.path.join(tempfile.mkdtemp(prefix="pylone-bench-"), "bench.db")
+
+    from demo.app import app
+
+    # Request logging would dominate the measurements.
+    configure_logging("benchmark")
+
+    scenarios = build_scenarios()
+    if args.scenario:
+        unknown = set(args.scenario) - {s.name for s in scenarios}
+        if unknown:
+            parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+        scenarios = [s for s in scenarios if s.name in args.scenario]
+
+    results = run_benchmarks(app, scenarios, args.iterations, args.warmup, args.alloc_iterations)
+    baseline = None if args.save_baseline else load_baseline(args.baseline)
+    print(format_report(results, baseline))
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nPERFORMANCE REGRESSION (threshold {args.threshold:.0%}):", file=sys.stderr)
+        for regression in regressions:
+            print(f"  - {regression}", file=sys.stderr)
+        return 1
+
+    print(f"\nNo regressions against baseline (threshold {args.threshold:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
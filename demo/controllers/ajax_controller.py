@@ -9,7 +9,7 @@ Imports:
     demo.database.db: The database instance from the demo application.
     pylone.response.Response: The response object for creating HTTP responses.
     pylone.session.session_manager: The session manager for handling user sessions.
-    pylone.template.TemplateEngine: The template engine for rendering HTML templates.
+    pylone.template.get_template_engine: The shared template engine for rendering HTML templates.
     logging: For logging messages.
     os: For interacting with the operating system (e.g., file paths).
     json: For encoding and decoding JSON data.
@@ -27,17 +27,16 @@ Functions:
 from demo.database import db  # Import the database instance
 from pylone.response import Response
 from pylone.session import session_manager
-from pylone.template import TemplateEngine  # Import the template engine
+from pylone.template import get_template_engine  # Import the template engine
 import logging
 import os
 import json
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("demo.controllers.ajax")
 
-# Initialize TemplateEngine with the templates directory
+# Get the shared TemplateEngine for the templates directory
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "../templates/")
-template_engine = TemplateEngine(TEMPLATES_DIR)
+template_engine = get_template_engine(TEMPLATES_DIR)
 
 class AjaxController:
     def __init__(self):
@@ -46,17 +45,17 @@ class AjaxController:
 
     def test_json_response(self, request):
         """Test JSON response."""
-        logging.debug("AjaxController: Handling /ajax/test-json request")
+        logger.debug("AjaxController: Handling /ajax/test-json request")
         try:
             data = {
                 'message': 'Test JSON response',
                 'status': 'success',
             }
             response = self.json_response(data)
-            logging.debug(f"AjaxController: Response -> {response}")
+            logger.debug("AjaxController: Response -> %s", response)
             return response
         except Exception as e:
-            logging.error(f"AjaxController: Error in test_json_response -> {e}")
+            logger.error("AjaxController: Error in test_json_response -> %s", e)
             raise
 
     def json_response(self, data, status=200):
@@ -78,17 +77,17 @@ class AjaxController:
 
     def get_data(self, request):
         """Handle AJAX data requests."""
-        logging.debug("AjaxController: Handling /ajax/data request")
+        logger.debug("AjaxController: Handling /ajax/data request")
         try:
             data = {
                 'message': 'Hello from Pylone!',
                 'status': 'success',
             }
             response = self.json_response(data)
-            logging.debug(f"AjaxController: Response -> {response}")
+            logger.debug("AjaxController: Response -> %s", response)
             return response
         except Exception as e:
-            logging.error(f"AjaxController: Error in get_data -> {e}")
+            logger.error("AjaxController: Error in get_data -> %s", e)
             raise
 
     def ajax_demo(self, request):
@@ -9,7 +9,7 @@ Imports:
     demo.database.db: The database instance for user management.
     pylone.response.Response: The response object for creating HTTP responses.
     pylone.session.session_manager: The session manager for handling user sessions.
-    pylone.template.TemplateEngine: The template engine for rendering HTML templates.
+    pylone.template.get_template_engine: The shared template engine for rendering HTML templates.
     logging: For logging messages.
     os: For interacting with the operating system (e.g., file paths).
 
@@ -28,18 +28,17 @@ Functions:
 from demo.database import db  # Import the database instance
 from pylone.response import Response
 from pylone.session import session_manager
-from pylone.template import TemplateEngine  # Import the template engine
+from pylone.template import get_template_engine  # Import the template engine
 import logging
 import os
 import json
 import traceback
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("demo.controllers.auth")
 
-# Initialize TemplateEngine with the templates directory
+# Get the shared TemplateEngine for the templates directory
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "../templates/")
-template_engine = TemplateEngine(TEMPLATES_DIR)
+template_engine = get_template_engine(TEMPLATES_DIR)
 
 
 class AuthController:
@@ -48,7 +47,7 @@ class AuthController:
 
     def demo(self, request):
         """Simulates rendering mock data into a list view."""
-        logging.debug("Handling demo page request")
+        logger.debug("Handling demo page request")
 
         # Mock data: A list of dictionaries
         mock_data = [
@@ -73,20 +72,20 @@ class AuthController:
 
     def xregister(self, request):
         """Handles the registration page."""
-        logging.debug("Handling register request")
+        logger.debug("Handling register request")
 
         if request.method == "POST":
-            logging.debug("Processing POST request for registration")
+            logger.debug("Processing POST request for registration")
             username = request.get("username")
             password = request.get("password")
 
             try:
                 # Save user to DB
                 result = db.add_user(username, password)
-                logging.debug(f"db.add_user returned: {result}")
+                logger.debug("db.add_user returned: %s", result)
 
                 if result:  # Ensure db.add_user() explicitly returns True on success
-                    logging.info(f"New user registered: {username}")
+                    logger.info("New user registered: %s", username)
                     return Response(
                         self.template_engine.render(
                             "public/register.html",
@@ -97,7 +96,7 @@ class AuthController:
                         status=200,
                     )
                 else:
-                    logging.error(
+                    logger.error(
                         "Failed to register user (possible duplicate username)"
                     )
                     return Response(
@@ -111,7 +110,7 @@ class AuthController:
                     )
 
             except Exception as e:
-                logging.error(f"Exception during registration: {e}")
+                logger.error("Exception during registration: %s", e)
                 return Response(
                     self.template_engine.render(
                         "public/register.html",
@@ -121,14 +120,14 @@ class AuthController:
                 )
 
             # Render the register form for GET request
-        logging.debug("Rendering register form")
+        logger.debug("Rendering register form")
         return Response(
             self.template_engine.render("public/register.html", {}), status=200
         )
 
     def logout(self, request):
         """Handles user logout."""
-        logging.debug("Handling logout request")
+        logger.debug("Handling logout request")
         session_id = request.cookies.get("session_id")
 
         if session_id:
@@ -199,7 +198,7 @@ class AuthController:
                 request_data = request.body
 
                 if not isinstance(request_data, dict) or not request_data:
-                    logging.warning("Invalid or empty request body for login")
+                    logger.warning("Invalid or empty request body for login")
                     return self.json_response(
                         {"error": "Invalid request format"}, status=400
                     )
@@ -209,8 +208,8 @@ class AuthController:
 
                 # Validate required fields
                 if not username or not password:
-                    logging.warning(
-                        f"Missing credentials: username={bool(username)}, password={bool(password)}"
+                    logger.warning(
+                        "Missing credentials: username=%s, password=%s", bool(username), bool(password)
                     )
                     return self.json_response(
                         {"error": "Username and password are required"}, status=400
@@ -218,11 +217,11 @@ class AuthController:
 
                 # Get user and validate credentials
                 user = db.get_user(username)
-                logging.debug(f"User lookup result: {user is not None}")
+                logger.debug("User lookup result: %s", user is not None)
 
                 if not user:
-                    logging.warning(
-                        f"Login attempt with non-existent username: {username}"
+                    logger.warning(
+                        "Login attempt with non-existent username: %s", username
                     )
                     # Use generic error message for security
                     return self.json_response(
@@ -230,18 +229,18 @@ class AuthController:
                     )
 
                 if len(user) < 3:
-                    logging.error(f"Invalid user data structure for {username}")
+                    logger.error("Invalid user data structure for %s", username)
                     return self.json_response({"error": "System error"}, status=500)
 
                 if not self.verify_password(password, user[2]):
-                    logging.warning(f"Failed login attempt for user: {username}")
+                    logger.warning("Failed login attempt for user: %s", username)
                     # Use generic error message for security
                     return self.json_response(
                         {"error": "Invalid credentials"}, status=401
                     )
 
                 # Authentication successful
-                logging.info(f"Successful login for user: {username}")
+                logger.info("Successful login for user: %s", username)
 
                 # Create session
                 session_id = session_manager.create_session(user[0])
@@ -271,7 +270,7 @@ class AuthController:
                 return response
 
             except Exception as e:
-                logging.error(f"Login error: {e}", exc_info=True)
+                logger.error("Login error: %s", e, exc_info=True)
                 return self.json_response(
                     {"error": "An unexpected error occurred"}, status=500
                 )
@@ -286,10 +285,10 @@ class AuthController:
 
     def register(self, request):
         """Handles the registration process."""
-        logging.debug("Handling register request")
+        logger.debug("Handling register request")
 
         if request.method == "POST":
-            logging.debug("Processing POST request for registration")
+            logger.debug("Processing POST request for registration")
 
             try:
                 # Get email and password directly from request.body which is already a dict
@@ -298,10 +297,10 @@ class AuthController:
 
                 # Attempt to save the new user to the database
                 result = db.add_user(email, password)
-                logging.debug(f"db.add_user returned: {result}")
+                logger.debug("db.add_user returned: %s", result)
 
                 if result:
-                    logging.info(f"New user successfully registered: {email}")
+                    logger.info("New user successfully registered: %s", email)
                     # Assuming your Response class doesn't take content_type parameter
                     return Response(
                         json.dumps(
@@ -310,7 +309,7 @@ class AuthController:
                         status=200,
                     )
                 else:
-                    logging.warning("Registration failed - possible duplicate email")
+                    logger.warning("Registration failed - possible duplicate email")
                     return Response(
                         json.dumps(
                             {
@@ -321,7 +320,7 @@ class AuthController:
                     )
 
             except Exception as e:
-                logging.error(f"An exception occurred during registration: {e}")
+                logger.error("An exception occurred during registration: %s", e)
                 return Response(
                     json.dumps(
                         {
@@ -332,7 +331,7 @@ class AuthController:
                 )
 
         # Handle GET requests (render registration form)
-        logging.debug("Rendering registration form")
+        logger.debug("Rendering registration form")
         return Response(self.template_engine.render("public/register.html", {}), status=200)
 
 
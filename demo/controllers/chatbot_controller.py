@@ -2,22 +2,21 @@
 from demo.database import db
 from pylone.response import Response
 from pylone.session import session_manager
-from pylone.template import TemplateEngine
+from pylone.template import get_template_engine
 import logging
 import os
 import json
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("demo.controllers.chatbot")
 
-# Initialize TemplateEngine with the templates directory
+# Get the shared TemplateEngine for the templates directory
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "../templates/")
-template_engine = TemplateEngine(TEMPLATES_DIR)
+template_engine = get_template_engine(TEMPLATES_DIR)
 
 class ChatController:
     def index(self, request):
         """Serve the chat interface."""
-        logging.debug("ChatController: Serving chat interface")
+        logger.debug("ChatController: Serving chat interface")
         
         # Get user from session if authenticated
         #user_id = session_manager.get(request, 'user_id')
@@ -38,7 +37,7 @@ class ChatController:
     
     def get_messages(self, request):
         """API endpoint to get recent messages."""
-        logging.debug("ChatController: Getting recent messages")
+        logger.debug("ChatController: Getting recent messages")
         
         # You would implement this to fetch recent messages from your database
         # For example:
@@ -9,7 +9,7 @@ Imports:
     logging: For logging messages.
     pylone.response.Response: The response object for creating HTTP responses.
     pylone.session.session_manager: The session manager for handling user sessions.
-    pylone.template.TemplateEngine: The template engine for rendering HTML templates.
+    pylone.template.get_template_engine: The shared template engine for rendering HTML templates.
     os: For interacting with the operating system (e.g., file paths).
     demo.database.db: The database instance for user management.
 
@@ -26,40 +26,47 @@ Functions:
 import logging
 from pylone.response import Response
 from pylone.session import session_manager
-from pylone.template import TemplateEngine   # Ensure this imports Jinja2 template engine
-import logging
+from pylone.template import get_template_engine   # Ensure this imports Jinja2 template engine
+from demo.database import db  # Import the database instance
 import os
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("demo.controllers.dashboard")
 
-# Initialize TemplateEngine with the templates directory
+# Get the shared TemplateEngine for the templates directory
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "../templates/")
-template_engine = TemplateEngine(TEMPLATES_DIR)
+template_engine = get_template_engine(TEMPLATES_DIR)
 
 class DashboardController:
     def __init__(self, template_engine):
         self.template_engine = template_engine
 
     def dashboard(self, request):
-        """Handles the dashboard page."""
-        logging.debug("Handling dashboard request")
+        """
+        Handles the dashboard page.
+
+        The page lists every user from the database, so it is streamed with
+        TemplateEngine.stream(): the head (and its CSS/JS links) reaches the
+        browser before the user table is rendered, and the table is never
+        held in memory as a single string.
+        """
+        logger.debug("Handling dashboard request")
 
         # Get user session
         session_id = request.cookies.get("session_id")
         user_id = session_manager.get_session(session_id)
 
         if not user_id:
-            logging.debug("No active session, redirecting to login.")
+            logger.debug("No active session, redirecting to login.")
             return Response("", status=302, headers={"Location": "/login"})
 
         # Mock user details (In real case, fetch from DB)
         user_data = {"id": user_id, "username": "JohnDoe"}
 
-        return Response(self.template_engine.render("private/dashboard.html", {
+        return Response(self.template_engine.stream("private/dashboard.html", {
             "title": "Dashboard",
-            "user": user_data
-        }), status=200)
+            "user": user_data,
+            "users": db.get_all_users()
+        }), status=200, headers=[("Content-Type", "text/html; charset=utf-8")])
 
     def add_user_page(self, request):
         """Handles the add user page."""
@@ -31,8 +31,7 @@ import logging
 import threading
 from demo.settings import config
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("demo.database")
 
 # Thread-local storage
 local = threading.local()
@@ -49,9 +48,9 @@ class Database:
         if not hasattr(local, 'conn') or local.conn is None:
             try:
                 local.conn = sqlite3.connect(self.db_file)
-                logging.debug(f"Thread {threading.get_ident()}: New SQLite connection created")
+                logger.debug("Thread %s: New SQLite connection created", threading.get_ident())
             except Error as e:
-                logging.error(f"Thread {threading.get_ident()}: Error connecting to SQLite DB: {e}")
+                logger.error("Thread %s: Error connecting to SQLite DB: %s", threading.get_ident(), e)
         return local.conn
 
     def create_table(self):
@@ -67,9 +66,9 @@ class Database:
                 );
             """)
             conn.commit()
-            logging.debug("Users table created or already exists")
+            logger.debug("Users table created or already exists")
         except Error as e:
-            logging.error(f"Error creating users table: {e}")
+            logger.error("Error creating users table: %s", e)
     
     def add_user(self, username, password):
         """Add a new user to the database."""
@@ -78,10 +77,10 @@ class Database:
             cursor = conn.cursor()
             cursor.execute("INSERT INTO users (username, password) VALUES (?, ?)", (username, password))
             conn.commit()
-            logging.debug(f"User '{username}' added successfully")
+            logger.debug("User '%s' added successfully", username)
             return True
         except Error as e:
-            logging.error(f"Error adding user: {e}")
+            logger.error("Error adding user: %s", e)
             return False
 
     def get_user(self, username):
@@ -89,13 +88,13 @@ class Database:
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
-            logging.debug(f"Executing query: SELECT * FROM users WHERE username = ?")
+            logger.debug("Executing query: SELECT * FROM users WHERE username = ?")
             cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
             user = cursor.fetchone()
-            logging.debug(f"Retrieved user: {user}")
+            logger.debug("Retrieved user: %s", user)
             return user
         except Error as e:
-            logging.error(f"Error retrieving user: {e}")
+            logger.error("Error retrieving user: %s", e)
             return None
     
     def get_user_by_id(self, user_id):
@@ -103,13 +102,13 @@ class Database:
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
-            logging.debug(f"Executing query: SELECT * FROM users WHERE id = {user_id}")
+            logger.debug("Executing query: SELECT * FROM users WHERE id = %s", user_id)
             cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
             user = cursor.fetchone()
-            logging.debug(f"Retrieved user: {user}")
+            logger.debug("Retrieved user: %s", user)
             return user
         except Error as e:
-            logging.error(f"Error retrieving user: {e}")
+            logger.error("Error retrieving user: %s", e)
             return None
 
     def get_all_users(self):
@@ -119,10 +118,10 @@ class Database:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM users")
             users = cursor.fetchall()
-            logging.debug(f"Retrieved {len(users)} users")
+            logger.debug("Retrieved %s users", len(users))
             return users
         except Error as e:
-            logging.error(f"Error retrieving users: {e}")
+            logger.error("Error retrieving users: %s", e)
             return []
 
     def update_user(self, user_id, username, password):
@@ -132,9 +131,9 @@ class Database:
             cursor = conn.cursor()
             cursor.execute("UPDATE users SET username = ?, password = ? WHERE id = ?", (username, password, user_id))
             conn.commit()
-            logging.debug(f"User {user_id} updated successfully")
+            logger.debug("User %s updated successfully", user_id)
         except Error as e:
-            logging.error(f"Error updating user: {e}")
+            logger.error("Error updating user: %s", e)
 
     def delete_user(self, user_id):
         """Delete a user from the database."""
@@ -143,16 +142,32 @@ class Database:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
             conn.commit()
-            logging.debug(f"User {user_id} deleted successfully")
+            logger.debug("User %s deleted successfully", user_id)
         except Error as e:
-            logging.error(f"Error deleting user: {e}")
+            logger.error("Error deleting user: %s", e)
+
+    def prime(self):
+        """
+        Open this thread's connection and prepare the common statements.
+
+        sqlite3 caches prepared statements per connection, so running each
+        query once here means the first real requests skip the parse step.
+        Call it from the thread that will serve requests.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM users WHERE username = ?", ("",))
+        cursor.execute("SELECT * FROM users WHERE id = ?", (0,))
+        cursor.execute("SELECT * FROM users")
+        cursor.fetchall()
+        return 3
 
     def close(self):
         """Close the database connection for the current thread."""
         if hasattr(local, 'conn') and local.conn:
             local.conn.close()
             local.conn = None
-            logging.debug(f"Thread {threading.get_ident()}: Database connection closed")
+            logger.debug("Thread %s: Database connection closed", threading.get_ident())
 
 # Initialize the database when this module is imported
 db = Database()
\ No newline at end of file
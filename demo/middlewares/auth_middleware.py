@@ -4,11 +4,17 @@ Authentication Middleware for Pylone Web Framework.
 This module provides the AuthMiddleware class, which handles user
 authentication for a WSGI application. It checks for a valid session ID
 in the request cookies and redirects unauthenticated users to the login
-page. It also defines a list of allowed paths that do not require
-authentication.
+page.
+
+Which paths need a session is decided by a compiled
+pylone.policy.AccessPolicy. By default it is built from the demo router's
+routes (those added with public=True need no session) plus the /static/
+prefix. Public paths never touch the session store; for protected paths the
+session is looked up once and left in environ["pylone.session"].
 
 Imports:
-    pylone.session.session_manager: The session manager for handling user sessions.
+    pylone.session: The session manager and session cookie parsing.
+    pylone.policy.AccessPolicy: The compiled access policy.
     logging: For logging messages.
 
 Classes:
@@ -22,22 +28,27 @@ Functions:
  Date: 02/23/2024
 """
 
-from pylone.session import session_manager
-from demo.settings import config
+from pylone.session import session_manager, session_id_from_environ
+from pylone.policy import AccessPolicy
 import logging
 
+logger = logging.getLogger("demo.middlewares.auth")
+
 class AuthMiddleware:
-    def __init__(self, app):
+    def __init__(self, app, policy=None):
         """
         Initialize the authentication middleware.
 
         Args:
             app: The WSGI application to wrap.
+            policy: An AccessPolicy (defaults to one built from demo.routes).
         """
         self.app = app
-        # List of paths that do not require authentication
-        self.allowed_paths = config.ALLOWED_PATHS
-        logging.debug(f"AuthMiddleware: Public paths has been loaded..")
+        if policy is None:
+            from demo.routes import router
+            policy = AccessPolicy.from_router(router).allow_prefix("/static/")
+        self.policy = policy
+        logger.debug("AuthMiddleware: Access policy has been loaded..")
 
     def __call__(self, environ, start_response):
         """
@@ -51,32 +62,26 @@ class AuthMiddleware:
             The response body as an iterable.
         """
         path = environ["PATH_INFO"]
-        logging.debug(f"AuthMiddleware: Checking access for path -> {path}")
+        logger.debug("AuthMiddleware: Checking access for path -> %s", path)
 
-        # Skip authentication for allowed paths
-        if path in self.allowed_paths:
-            logging.debug(f"AuthMiddleware: Allowing access to path -> {path}")
-            return self.app(environ, start_response)
-        # Allow access to static files without authentication
-        if path.startswith("/static/"):
-            logging.debug(f"AuthMiddleware: Allowing access to static file -> {path}")
-            return self.app(environ, start_response)
-        # Check if the user is authenticated
-        cookies = environ.get("HTTP_COOKIE", "")
-        session_id = None
+        requires = self.policy.requirement(path)
 
-        # Extract session_id from cookies
-        if "session_id=" in cookies:
-            session_id = cookies.split("session_id=")[-1].split(";")[0]
+        # Skip authentication for public paths
+        if requires == "public":
+            logger.debug("AuthMiddleware: Allowing access to path -> %s", path)
+            return self.app(environ, start_response)
 
+        # Check if the user is authenticated
+        session_id = session_id_from_environ(environ)
         session = session_manager.get_session(session_id) if session_id else None
 
-        if not session:
+        if not session or (callable(requires) and not requires(session)):
             # Redirect to login if not authenticated
-            logging.debug(f"AuthMiddleware: Redirecting to login -> {path}")
+            logger.debug("AuthMiddleware: Redirecting to login -> %s", path)
             start_response("302 Found", [("Location", "/login")])
             return [b"Redirecting to login..."]
 
         # User is authenticated, proceed to the next middleware or app
-        logging.debug(f"AuthMiddleware: Allowing access for authenticated user -> {path}")
+        logger.debug("AuthMiddleware: Allowing access for authenticated user -> %s", path)
+        environ["pylone.session"] = session
         return self.app(environ, start_response)
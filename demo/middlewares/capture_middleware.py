@@ -0,0 +1,208 @@
+"""
+Traffic Capture Middleware for a Python WSGI Application.
+
+This module provides a middleware class, CaptureMiddleware, that records
+sanitized request metadata and bodies, together with the response status and
+timing, to a JSON lines file. The capture can be fed back through the
+application with pylone.replay to benchmark against production-shaped
+traffic.
+
+Each line is one request:
+    {"t": 1.234567, "ts": "2026-10-18T12:00:00", "client": "5f2b9c1e",
+     "method": "POST", "path": "/login", "query": "",
+     "headers": {"Content-Type": "application/json", "Cookie": "[REDACTED]"},
+     "body": "{\\"username\\": \\"demo\\", \\"password\\": \\"[REDACTED]\\"}",
+     "body_encoding": "utf-8", "body_truncated": false,
+     "status": 200, "duration_ms": 1.82, "response_bytes": 63}
+
+    t: Seconds since the capture started (monotonic), used for pacing.
+    client: A salted hash of the client address, stable within one capture.
+
+Sanitization:
+    - Credential headers (Cookie, Authorization, ...) are replaced by [REDACTED].
+    - Sensitive fields (password, csrf_token, ...) in the query string and in
+      JSON and form bodies are replaced by [REDACTED]; other fields are kept.
+    - Bodies are truncated to max_body bytes; binary bodies are base64 encoded.
+    - Synthetic warm-up requests (pylone/warmup.py) are not recorded.
+
+Classes:
+    CaptureMiddleware: A WSGI middleware that records traffic to JSON lines.
+
+ Author: Agile Creative Labs Inc.
+ Version: 1.0.0
+ Date: 10/18/2026
+"""
+import io
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode
+
+logger = logging.getLogger("demo.middlewares.capture")
+
+REDACTED = "[REDACTED]"
+
+
+class CaptureMiddleware:
+    REDACT_HEADERS = {"Cookie", "Authorization", "Proxy-Authorization", "X-Api-Key", "X-Csrf-Token"}
+    REDACT_FIELDS = {"password", "csrf_token", "token", "secret", "api_key"}
+
+    def __init__(self, app, capture_file="capture.jsonl", max_body=65536, redact_headers=None, redact_fields=None):
+        """
+        Initialize the capture middleware.
+
+        Args:
+            app: The WSGI application to wrap.
+            capture_file: The JSON lines file to append records to.
+            max_body: Maximum number of request body bytes to record.
+            redact_headers: Header names whose values are never recorded.
+            redact_fields: Body field names whose values are never recorded.
+        """
+        self.app = app
+        self.capture_file = capture_file
+        self.max_body = max_body
+        self.redact_headers = {h.title() for h in (redact_headers or self.REDACT_HEADERS)}
+        self.redact_fields = {f.lower() for f in (redact_fields or self.REDACT_FIELDS)}
+        self.salt = os.urandom(8)
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        self.file = open(capture_file, "a", encoding="utf-8")
+        logger.info("CaptureMiddleware: Recording traffic to %s", capture_file)
+
+    def __call__(self, environ, start_response):
+        """
+        Middleware interface: makes the middleware callable.
+
+        Args:
+            environ: The WSGI environment dictionary.
+            start_response: The WSGI start_response function.
+
+        Returns:
+            The response body as an iterable.
+        """
+        if environ.get("pylone.warmup"):
+            return self.app(environ, start_response)
+
+        started = time.monotonic()
+        body = self._read_body(environ)
+        record = {
+            "t": round(started - self.started, 6),
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "client": self._client_id(environ.get("REMOTE_ADDR", "")),
+            "method": environ.get("REQUEST_METHOD", "GET"),
+            "path": environ.get("PATH_INFO", "/"),
+            "query": self._redact_form(environ.get("QUERY_STRING", "")),
+            "headers": self._sanitize_headers(environ),
+        }
+        record.update(self._sanitize_body(body, environ.get("CONTENT_TYPE", "")))
+
+        def capture_start_response(status, headers, exc_info=None):
+            record["status"] = int(status.split(" ", 1)[0])
+            return start_response(status, headers, exc_info)
+
+        result = self.app(environ, capture_start_response)
+        return _CapturedBody(result, self, record, started)
+
+    def _read_body(self, environ):
+        """Read the request body and put it back so the application can read it."""
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if length <= 0:
+            return b""
+        body = environ["wsgi.input"].read(length)
+        environ["wsgi.input"] = io.BytesIO(body)
+        return body
+
+    def _client_id(self, remote_addr):
+        return hashlib.sha256(self.salt + remote_addr.encode("utf-8")).hexdigest()[:8]
+
+    def _sanitize_headers(self, environ):
+        headers = {}
+        if environ.get("CONTENT_TYPE"):
+            headers["Content-Type"] = environ["CONTENT_TYPE"]
+        for key, value in environ.items():
+            if key.startswith("HTTP_"):
+                name = key[5:].replace("_", "-").title()
+                headers[name] = REDACTED if name in self.redact_headers else value
+        return headers
+
+    def _redact(self, data):
+        if isinstance(data, dict):
+            return {k: REDACTED if k.lower() in self.redact_fields else self._redact(v) for k, v in data.items()}
+        if isinstance(data, list):
+            return [self._redact(item) for item in data]
+        return data
+
+    def _redact_form(self, text):
+        """Redact sensitive fields in a query string or form body, keeping it as is when it has none."""
+        fields = parse_qsl(text, keep_blank_values=True)
+        if not any(k.lower() in self.redact_fields for k, _ in fields):
+            return text
+        return urlencode([(k, REDACTED if k.lower() in self.redact_fields else v) for k, v in fields])
+
+    def _sanitize_body(self, body, content_type):
+        truncated = len(body) > self.max_body
+        body = body[:self.max_body]
+        if not body:
+            return {"body": "", "body_encoding": "utf-8", "body_truncated": False}
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError:
+            return {"body": base64.b64encode(body).decode("ascii"), "body_encoding": "base64", "body_truncated": truncated}
+
+        if not truncated and "application/json" in content_type:
+            try:
+                text = json.dumps(self._redact(json.loads(text)))
+            except ValueError:
+                pass
+        elif not truncated and "application/x-www-form-urlencoded" in content_type:
+            text = self._redact_form(text)
+        return {"body": text, "body_encoding": "utf-8", "body_truncated": truncated}
+
+    def write(self, record):
+        """Append a finished record to the capture file."""
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+
+    def close(self):
+        """Close the capture file."""
+        with self.lock:
+            self.file.close()
+
+
+class _CapturedBody:
+    """Wraps a WSGI response iterable and writes the capture record on close()."""
+
+    def __init__(self, result, middleware, record, started):
+        self.result = result
+        self.middleware = middleware
+        self.record = record
+        self.started = started
+        self.response_bytes = 0
+
+    def __iter__(self):
+        for chunk in self.result:
+            self.response_bytes += len(chunk)
+            yield chunk
+
+    def close(self):
+        try:
+            if hasattr(self.result, "close"):
+                self.result.close()
+        finally:
+            self.record["duration_ms"] = round((time.monotonic() - self.started) * 1000, 3)
+            self.record["response_bytes"] = self.response_bytes
+            self.record.setdefault("status", 0)
+            try:
+                self.middleware.write(self.record)
+            except (OSError, ValueError) as e:
+                logger.error("CaptureMiddleware: Unable to write capture record -> %s", e)
@@ -6,6 +6,15 @@ application to log incoming requests and outgoing responses. It logs the request
 method and path, as well as the response status. In case of critical errors, it
 logs the error and forcefully terminates the program.
 
+Access-log mode:
+    When an AccessLogWriter (pylone/accesslog.py) is passed, the middleware
+    writes one access-log record per request instead of the two log lines.
+    The request thread only builds a tuple and queues it; formatting and I/O
+    happen on the writer thread. Synthetic warm-up requests are not logged.
+    File-wrapper responses (large static files) are returned unwrapped, so
+    the server can still send them with sendfile(); their record is queued
+    from a close() hook, with the size taken from Content-Length.
+
 Imports:
     logging: For logging messages.
     sys: For system-specific parameters and functions (not directly used here, but potentially needed for more advanced logging).
@@ -24,16 +33,21 @@ Functions:
 import logging
 import sys
 import os
+import time
+
+logger = logging.getLogger("demo.middlewares.logging")
 
 class LoggingMiddleware:
-    def __init__(self, app):
+    def __init__(self, app, access_log=None):
         """
         Initialize the logging middleware.
 
         Args:
             app: The WSGI application to wrap.
+            access_log: An AccessLogWriter to switch to access-log mode.
         """
         self.app = app
+        self.access_log = access_log
 
     def __call__(self, environ, start_response):
         """
@@ -46,21 +60,115 @@ class LoggingMiddleware:
         Returns:
             The response body as an iterable.
         """
+        if self.access_log is not None:
+            return self._access_log_call(environ, start_response)
+
         try:
             # Log the request
-            logging.info(f"LoggingMiddleware REQUEST -> {environ['REQUEST_METHOD']} {environ['PATH_INFO']}")
+            logger.info("LoggingMiddleware REQUEST -> %s %s", environ['REQUEST_METHOD'], environ['PATH_INFO'])
 
             # Call the next middleware or the app
             def custom_start_response(status, headers, exc_info=None):
                 # Log the response status
-                logging.info(f"LoggingMiddleware RESPOMSE -> {status}")
+                logger.info("LoggingMiddleware RESPOMSE -> %s", status)
                 return start_response(status, headers, exc_info)
 
             response = self.app(environ, custom_start_response)
 
             return response
         except Exception as e:
-            logging.error(f"LoggingMiddleware Critical error -> {e}")
+            logger.error("LoggingMiddleware Critical error -> %s", e)
             os._exit(1)  # Forcefully terminate the program
 
-            
\ No newline at end of file
+    def _access_log_call(self, environ, start_response):
+        """Serve a request and queue its access-log record."""
+        if environ.get("pylone.warmup"):
+            return self.app(environ, start_response)
+
+        started = time.perf_counter()
+        response_state = {}
+
+        def access_log_start_response(status, headers, exc_info=None):
+            response_state["status"] = status
+            response_state["headers"] = headers
+            return start_response(status, headers, exc_info)
+
+        result = self.app(environ, access_log_start_response)
+        if isinstance(result, (list, tuple)):
+            self._submit(environ, response_state, sum(len(chunk) for chunk in result), started)
+            return result
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        if isinstance(file_wrapper, type) and isinstance(result, file_wrapper):
+            return self._log_on_close(result, environ, response_state, started)
+        return _AccessLoggedBody(result, self, environ, response_state, started)
+
+    def _log_on_close(self, result, environ, response_state, started):
+        """
+        Queue the record when a file-wrapper response is closed.
+
+        Wrapping the object would hide it from the server and disable its
+        sendfile() fast path, so its close() is hooked instead.
+
+        Returns:
+            The original file wrapper, or an _AccessLoggedBody if its close()
+            cannot be replaced.
+        """
+        original_close = getattr(result, "close", None)
+
+        def close():
+            try:
+                if original_close is not None:
+                    original_close()
+            finally:
+                size = next((int(value) for name, value in response_state.get("headers", ())
+                             if name.lower() == "content-length" and value.isdigit()), 0)
+                self._submit(environ, response_state, size, started)
+
+        try:
+            result.close = close
+        except AttributeError:
+            return _AccessLoggedBody(result, self, environ, response_state, started)
+        return result
+
+    def _submit(self, environ, response_state, size, started):
+        path = environ.get("PATH_INFO", "/")
+        status = int(response_state.get("status", "500").split(" ", 1)[0])
+        if not self.access_log.should_log(path, status):
+            return
+        self.access_log.submit((
+            time.time(),
+            environ.get("REMOTE_ADDR", ""),
+            environ.get("REQUEST_METHOD", "GET"),
+            path,
+            environ.get("QUERY_STRING", ""),
+            environ.get("SERVER_PROTOCOL", "HTTP/1.1"),
+            status,
+            size,
+            time.perf_counter() - started,
+            environ.get("HTTP_REFERER", ""),
+            environ.get("HTTP_USER_AGENT", ""),
+        ))
+
+
+class _AccessLoggedBody:
+    """Wraps a streamed WSGI response and queues the access-log record on close()."""
+
+    def __init__(self, result, middleware, environ, response_state, started):
+        self.result = result
+        self.middleware = middleware
+        self.environ = environ
+        self.response_state = response_state
+        self.started = started
+        self.size = 0
+
+    def __iter__(self):
+        for chunk in self.result:
+            self.size += len(chunk)
+            yield chunk
+
+    def close(self):
+        try:
+            if hasattr(self.result, "close"):
+                self.result.close()
+        finally:
+            self.middleware._submit(self.environ, self.response_state, self.size, self.started)
@@ -6,10 +6,15 @@ application to limit the number of requests from a specific client IP within a
 defined time window. It prevents excessive requests and protects against
 brute-force attacks.
 
+The counting is done by pylone.ratelimit.RateLimiter: O(1) per request, a
+fixed amount of state per client, idle clients evicted, and safe to use from
+threaded servers. Clients can be keyed by IP address, session or route.
+With several worker processes, pass `storage` (a SQLite file path) so that
+all workers count against one shared limit instead of N separate ones.
+
 Imports:
-    time: For handling timestamps and time-related operations.
-    collections.defaultdict: For creating dictionaries with default values.
-    logging: For logging messages (not used in current code, but can be added for logging rate limiting events).
+    pylone.ratelimit: The rate limiter and key functions.
+    logging: For logging rate limiting events.
 
 Classes:
     RateLimitingMiddleware: A WSGI middleware that limits request rates.
@@ -20,11 +25,16 @@ Functions:
  * Version: 1.0.0
  * Date: 02/23/2024
 """
-import time
-from collections import defaultdict
+import math
 import logging
+from pylone.ratelimit import RateLimiter, SQLiteRateLimiter, KEY_FUNCS
+
+logger = logging.getLogger("demo.middlewares.ratelimit")
+
+
 class RateLimitingMiddleware:
-    def __init__(self, app, max_requests=100, time_window=60):
+    def __init__(self, app, max_requests=100, time_window=60, algorithm="sliding_window", key="ip",
+                 max_keys=100000, storage=None, limiter=None):
         """
         Initialize the rate-limiting middleware.
 
@@ -32,30 +42,35 @@ class RateLimitingMiddleware:
             app: The WSGI application to wrap.
             max_requests: Maximum number of requests allowed in the time window.
             time_window: Time window in seconds.
+            algorithm: "sliding_window" or "token_bucket".
+            key: "ip", "session", "route", or a callable taking the WSGI environ.
+            max_keys: Maximum number of clients tracked at once.
+            storage: A SQLite file shared by worker processes, or None to
+                count in this process only.
+            limiter: A ready-made limiter with a hit(key) method, overriding
+                max_requests, time_window, algorithm, max_keys and storage.
         """
         self.app = app
         self.max_requests = max_requests
         self.time_window = time_window
-        self.request_counts = defaultdict(list)
+        self.key_func = KEY_FUNCS[key] if isinstance(key, str) else key
+        if limiter is None and storage:
+            limiter = SQLiteRateLimiter(storage, max_requests, time_window, algorithm, max_keys=max_keys)
+        self.limiter = limiter or RateLimiter(max_requests, time_window, algorithm, max_keys=max_keys)
 
     def __call__(self, environ, start_response):
         """Middleware interface: makes the middleware callable."""
-        client_ip = environ.get("REMOTE_ADDR")
-
-        # Remove old requests
-        current_time = time.time()
-        self.request_counts[client_ip] = [
-            timestamp for timestamp in self.request_counts[client_ip]
-            if current_time - timestamp < self.time_window
-        ]
+        key = self.key_func(environ)
+        decision = self.limiter.hit(key)
 
         # Check if the client has exceeded the limit
-        if len(self.request_counts[client_ip]) >= self.max_requests:
-            start_response("429 Too Many Requests", [("Content-Type", "text/plain")])
+        if not decision.allowed:
+            logger.debug("RateLimitingMiddleware: Limit reached for %s", key)
+            start_response("429 Too Many Requests", [
+                ("Content-Type", "text/plain"),
+                ("Retry-After", str(max(1, math.ceil(decision.retry_after)))),
+            ])
             return [b"Too many requests. Please try again later."]
 
-        # Record the current request
-        self.request_counts[client_ip].append(current_time)
-
         # Call the next middleware or the app
-        return self.app(environ, start_response)
\ No newline at end of file
+        return self.app(environ, start_response)
@@ -4,16 +4,20 @@ demo/staticfile_middleware.py
         This middleware intercepts requests for static files (e.g., CSS, JS, images) and serves them
     directly from a specified directory. It handles file existence checks, MIME type detection,
     and proper HTTP headers for caching and security.
+    Requests are served by pylone.static.StaticFiles, the same engine the Router uses.
+    Small files are kept in memory with their headers (pylone.static.StaticFileCache);
+    large files are streamed. Revalidation requests are answered with 304 Not Modified
+    and HEAD requests get the headers only. Fingerprinted names from an
+    AssetManifest (style.3f2a9c1e.css) are served with an immutable, one-year Cache-Control.
+    Precompressed .br/.gz siblings are chosen from Accept-Encoding.
 # Author: alex@agilecreativelabs.ca
 # Date: Thu Feb 27, 2025
 # Copyright: Copyright (c) 2025 Agile Creative Labs Inc
 """
-import os
-import mimetypes
-from http import HTTPStatus
-from wsgiref.util import FileWrapper
-import time
 import logging
+from pylone.static import StaticFiles
+
+logger = logging.getLogger("demo.middlewares.staticfile")
 
 class StaticFileMiddleware:
     """
@@ -25,11 +29,13 @@ class StaticFileMiddleware:
 
     Attributes:
         app (callable): The next WSGI application or middleware in the chain.
+        static_files (StaticFiles): The static file engine serving the requests.
         static_dir (str): The absolute path to the directory containing static files.
+        cache (StaticFileCache): In-memory cache of small files and their headers.
 
     Methods:
         __call__(environ, start_response): Intercepts WSGI requests and serves static files if applicable.
-        serve_static_file(file_path, start_response): Serves a static file with proper headers and error handling.
+        serve_static_file(file_path, start_response, environ, immutable): Serves a static file with proper headers and error handling.
 
     Example:
         To use this middleware, wrap your WSGI application as follows:
@@ -39,23 +45,45 @@ class StaticFileMiddleware:
 
     Notes:
         - Static files are served under the `/static/` URL prefix.
-        - Files outside the `static_dir` are blocked to prevent directory traversal attacks.
+        - Files are looked up in an index built at startup; other names are
+          resolved on disk and blocked if they leave `static_dir`.
         - Supports caching via the `Cache-Control` header.
+        - Repeat requests for small files are served from memory; a file is
+          re-checked with one stat() at most every `check_interval` seconds.
+        - Files larger than `max_file_size` are streamed in chunks.
+        - Strong ETags; If-None-Match and If-Modified-Since produce 304 responses.
+        - HEAD is answered without a body; other methods get 405.
+        - Fingerprinted URLs (see pylone.static.AssetManifest) are cached for a year.
+        - Precompressed variants (see pylone.static.precompress) are sent with
+          Content-Encoding and Vary: Accept-Encoding to clients that accept them.
         - Returns appropriate HTTP status codes (200, 403, 404, 500) for different scenarios.
     """
 
-    def __init__(self, app, static_dir='static'):
+    def __init__(self, app, static_dir='static', max_cache_bytes=16 << 20, max_file_size=256 << 10, check_interval=2.0,
+                 manifest=None, static_files=None):
         """
         Initialize the StaticFileMiddleware.
 
         Args:
             app (callable): The next WSGI application or middleware.
             static_dir (str, optional): The directory for static files. Defaults to 'static'.
+            max_cache_bytes (int, optional): Memory budget for cached files. Defaults to 16 MiB.
+            max_file_size (int, optional): Larger files are streamed, not cached. Defaults to 256 KiB.
+            check_interval (float, optional): Seconds between modification checks of a cached file.
+            manifest (AssetManifest, optional): Resolves fingerprinted file names.
+            static_files (StaticFiles, optional): An existing engine to share,
+                e.g. with the Router; the other options are then ignored.
         """
         self.app = app
-        self.static_dir = os.path.abspath(static_dir)  # Ensure absolute path
-        logging.info(f"StaticFileMiddleware -> Static directory: {self.static_dir}")
-        mimetypes.init()  # Initialize MIME types
+        if static_files is None:
+            static_files = StaticFiles(static_dir, manifest=manifest, max_cache_bytes=max_cache_bytes,
+                                       max_file_size=max_file_size, check_interval=check_interval)
+        self.static_files = static_files
+        self.static_dir = static_files.static_dir
+        self.cache = static_files.cache
+        self.prefix = static_files.prefix
+        logger.info("StaticFileMiddleware -> Static directory: %s (%d files indexed)",
+                    self.static_dir, len(static_files.index))
 
     def __call__(self, environ, start_response):
         """
@@ -69,69 +97,33 @@ class StaticFileMiddleware:
             iterable: The response body as an iterable of bytes.
         """
         path = environ.get("PATH_INFO", "")
-        logging.info(f"StaticFileMiddleware -> Requested path: {path}")
         # Serve only requests starting with `/static/`
-        if path.startswith("/static/"):
-            relative_path = path[len("/static/"):]
-            logging.info(f"StaticFileMiddleware -> Relative path: {relative_path}")
-            # Resolve the requested file path safely
-            requested_file = os.path.normpath(os.path.join(self.static_dir, relative_path))
-            logging.info(f"StaticFileMiddleware -> Resolved file: {requested_file}")  # Add this line
-            # Ensure the requested file is inside the static directory (prevents directory traversal attacks)
-            if not requested_file.startswith(self.static_dir):
-                start_response(f"{HTTPStatus.FORBIDDEN.value} {HTTPStatus.FORBIDDEN.phrase}", [("Content-Type", "text/plain")])
-                return [b"403 Forbidden"]
-
-            # Check if file exists and is a file
-            if os.path.exists(requested_file) and os.path.isfile(requested_file):
-                logging.info(f"StaticFileMiddleware -> File exists: {requested_file}")
-                return self.serve_static_file(requested_file, start_response)
-
-            # File not found
-            logging.error(f"StaticFileMiddleware -> File not found: {requested_file}")
-            start_response(f"{HTTPStatus.NOT_FOUND.value} {HTTPStatus.NOT_FOUND.phrase}", [("Content-Type", "text/plain")])
-            return [b"404 File Not Found"]
+        if path.startswith(self.prefix):
+            status, headers, body = self.static_files.serve(path, environ)
+            start_response(status, headers)
+            return body
 
         # Pass to the next middleware or app
         return self.app(environ, start_response)
 
-    def serve_static_file(self, file_path, start_response):
+    def serve_static_file(self, file_path, start_response, environ=None, immutable=False):
         """
         Serve the requested static file efficiently.
 
         Args:
             file_path (str): The absolute path of the static file to be served.
             start_response (callable): The WSGI start_response function.
+            environ (dict, optional): The WSGI environment, used for conditional
+                requests, HEAD and wsgi.file_wrapper.
+            immutable (bool, optional): Whether the file was requested by its fingerprinted name.
 
         Returns:
-            iterable: The file content as an iterable of bytes.
+            iterable: The file content as an iterable of bytes, or None if
+            the file does not exist.
         """
-        try:
-            file_size = os.path.getsize(file_path)
-            last_modified = time.gmtime(os.path.getmtime(file_path))  # Get last modified time
-
-            # Determine MIME type
-            mime_type, _ = mimetypes.guess_type(file_path)
-            mime_type = mime_type or "application/octet-stream"
-
-            # Prepare headers
-            headers = [
-                ("Content-Type", mime_type),
-                ("Content-Length", str(file_size)),
-                ("Cache-Control", "public, max-age=86400"),  # Cache for 1 day
-                ("Last-Modified", time.strftime("%a, %d %b %Y %H:%M:%S GMT", last_modified)),
-            ]
-
-            # Start WSGI response
-            start_response(f"{HTTPStatus.OK.value} {HTTPStatus.OK.phrase}", headers)
-
-            # Read the file content and return it as an iterable
-            with open(file_path, "rb") as file:
-                return [file.read()]  # Return the file content as a list of bytes
-
-        except Exception as e:
-            logging.error(f"StaticFileMiddleware -> Error serving {file_path}: {e}")
-
-            start_response(f"{HTTPStatus.INTERNAL_SERVER_ERROR.value} {HTTPStatus.INTERNAL_SERVER_ERROR.phrase}", 
-                       [("Content-Type", "text/plain")])
-            return [b"500 Internal Server Error"]
\ No newline at end of file
+        response = self.static_files.serve_file(file_path, environ or {}, immutable)
+        if response is None:
+            return None
+        status, headers, body = response
+        start_response(status, headers)
+        return body
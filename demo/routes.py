@@ -39,9 +39,9 @@ AJAX_DATA_ROUTE = "/ajax/data"
 AJAX_DEMO_ROUTE = "/ajax-demo"
 
 # Authentication routes
-router.add_route("/", auth_controller.login, methods=["GET", "POST"])  # Default route to login page
-router.add_route(LOGIN_ROUTE, auth_controller.login, methods=["GET", "POST"])  # Login page
-router.add_route(REGISTER_ROUTE, auth_controller.register, methods=["GET", "POST"])  # User registration page
+router.add_route("/", auth_controller.login, methods=["GET", "POST"], public=True)  # Default route to login page
+router.add_route(LOGIN_ROUTE, auth_controller.login, methods=["GET", "POST"], public=True)  # Login page
+router.add_route(REGISTER_ROUTE, auth_controller.register, methods=["GET", "POST"], public=True, cache=60)  # User registration page
 router.add_route("/logout", dashboard_controller.logout, methods=["GET"])  # Logout route
 
 # Dashboard routes
@@ -51,20 +51,20 @@ router.add_route("/edit_user/<int:user_id>", dashboard_controller.edit_user_page
 router.add_route("/delete_user/<int:user_id>", dashboard_controller.delete_user_page, methods=["GET"])  # Delete user page
 
 # Demo and AJAX routes
-router.add_route("/demo", auth_controller.demo, methods=["GET"])  # Demo page
-router.add_route(AJAX_DATA_ROUTE, ajax_controller.get_data, methods=["GET"])  # AJAX data provider
-router.add_route(AJAX_DEMO_ROUTE, ajax_controller.ajax_demo, methods=["GET"])  # AJAX demo page
-router.add_route("/test-json", ajax_controller.test_json_response, methods=["GET"])
+router.add_route("/demo", auth_controller.demo, methods=["GET"], public=True, cache=60)  # Demo page
+router.add_route(AJAX_DATA_ROUTE, ajax_controller.get_data, methods=["GET"], public=True, coalesce=True)  # AJAX data provider
+router.add_route(AJAX_DEMO_ROUTE, ajax_controller.ajax_demo, methods=["GET"], public=True)  # AJAX demo page
+router.add_route("/test-json", ajax_controller.test_json_response, methods=["GET"], public=True)
 
 # Mock tests
 test_controller = TestController()
-router.add_route("/test-response-object", test_controller.test_response_object, methods=["GET"])
-router.add_route("/test-raw-tuple", test_controller.test_raw_tuple, methods=["GET"])
-router.add_route("/test-json", test_controller.test_json_response, methods=["GET"])
-router.add_route("/test-text", test_controller.test_text_response, methods=["GET"])
-router.add_route("/test-raw-bytes", test_controller.test_raw_bytes_response, methods=["GET"])
-router.add_route("/test-invalid", test_controller.test_invalid_response, methods=["GET"])
-router.add_route("/test-links",test_controller.links, methods=["GET"])
+router.add_route("/test-response-object", test_controller.test_response_object, methods=["GET"], public=True)
+router.add_route("/test-raw-tuple", test_controller.test_raw_tuple, methods=["GET"], public=True)
+router.add_route("/test-json", test_controller.test_json_response, methods=["GET"], public=True)
+router.add_route("/test-text", test_controller.test_text_response, methods=["GET"], public=True)
+router.add_route("/test-raw-bytes", test_controller.test_raw_bytes_response, methods=["GET"], public=True)
+router.add_route("/test-invalid", test_controller.test_invalid_response, methods=["GET"], public=True)
+router.add_route("/test-links",test_controller.links, methods=["GET"], public=True, cache=60)
 
 
 
@@ -29,21 +29,21 @@ class DevelopmentConfig(Config):
     CHAT_GREETING ='i LOVE YOU'
     DB_NAME = os.getenv('DB_NAME', 'demo.db')  # Default to 'demo.db' if not set
     DATABASE_URI = f"sqlite:///{DB_NAME}"  # Use DB_NAME to construct the DATABASE_URI
-    ALLOWED_PATHS = [
-            "/",
+    CAPTURE_FILE = os.getenv('CAPTURE_FILE')  # Record traffic to this JSON lines file (see pylone/replay.py)
+    STATIC_MANIFEST = os.getenv('STATIC_MANIFEST')  # Fingerprint manifest path (default: demo/static/manifest.json)
+    ACCESS_LOG = os.getenv('ACCESS_LOG')  # Batched access log file, or "-" for stdout (see pylone/accesslog.py)
+    ACCESS_LOG_FORMAT = os.getenv('ACCESS_LOG_FORMAT', 'jsonl')  # "jsonl" or "combined"
+    ACCESS_LOG_SAMPLE = {"/static/": 0.1}  # Fraction of requests logged per path prefix
+    SESSION_BACKEND = os.getenv('SESSION_BACKEND', 'memory')  # "memory", "cookie" (signed) or "sqlite" (see pylone/session.py)
+    SESSION_DB = os.getenv('SESSION_DB', 'sessions.db')  # Shared session file for the "sqlite" backend
+    SESSION_ENCRYPT = os.getenv('SESSION_ENCRYPT', '') == '1'  # Encrypt cookie sessions (needs cryptography)
+    SHARED_CACHE = os.getenv('SHARED_CACHE')  # Response/fragment cache file shared by the workers, e.g. /dev/shm/pylone-cache
+    WARMUP_REQUESTS = [  # Synthetic requests issued through the stack before serving
             "/login",
             "/register",
             "/demo",
-            "/ajax-demo",
             "/ajax/data",
-            "/test-json",
-            "/test-response-object",
-            "/test-raw-tuple",
-            "/test-json-response",
-            "/test-text-response",
-            "/test-invalid-response",
-            "/test-raw-bytes",
-            "/test-links"
+            "/static/css/style.css",
         ]
 
 # Create an instance of the configuration
@@ -10,19 +10,17 @@
 import os
 import json
 import logging
-import traceback
 from pylone.router import Router
 from pylone.request import Request
 from pylone.middleware import Middleware
-from pylone.template import TemplateEngine
+from pylone.template import get_template_engine
 from pylone.websocket import WebSocketWrapper
-import asyncio
+from pylone.warmup import Warmup
 from threading import Thread
 from wsgiref.simple_server import make_server
 
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("pylone.app")
 
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "../templates/")
 
@@ -38,8 +36,9 @@ class App:
         """
         self.router = router or Router()
         self.middlewares = middlewares or []
-        self.template_engine = TemplateEngine(templates_dir or TEMPLATES_DIR)
+        self.template_engine = get_template_engine(templates_dir or TEMPLATES_DIR)
         self.websocket_wrapper = None
+        self.warmup = Warmup()  # Steps run before the HTTP server accepts traffic
 
     def render_template(self, template_name, context=None, status=200, headers=None):
         """Render a template and return a WSGI-compliant response."""
@@ -66,7 +65,7 @@ class App:
             start_response (callable): The WSGI start_response function.
 
         Returns:
-            list: An iterable containing the response body as bytes.
+            iterable: The response body as bytes: a list, or an iterator for streamed responses.
         """
         try:
             # Create a Request object
@@ -89,6 +88,8 @@ class App:
                 body = [body]
             elif isinstance(body, list):
                 body = [b if isinstance(b, (bytes, bytearray)) else str(b).encode("utf-8") for b in body]
+            elif hasattr(body, "__next__"):
+                pass  # Streamed body (e.g. TemplateEngine.stream()), sent as it is produced
             else:
                 body = [b"Internal Server Error"]
 
@@ -97,8 +98,7 @@ class App:
             return body
 
         except Exception as e:
-            logging.error(f"APP -> Critical error handling request: {e}")
-            logging.error(traceback.format_exc())  # Log the full traceback
+            logger.error("APP -> Critical error handling request: %s", e, exc_info=True)  # Log the full traceback
             start_response("500 Internal Server Error", [("Content-Type", "text/plain")])
             return [b"Internal Server Error"]
 
@@ -123,7 +123,7 @@ class App:
                 - headers (list): A list of (key, value) header tuples.
                 - body (str or bytes): The response body.
         """
-        logging.debug(f"Processing response of type: {type(response)}")
+        logger.debug("Processing response of type: %s", type(response))
         if hasattr(response, "to_wsgi"):
             # Case 1: Response object with a to_wsgi() method
             status, headers, body = response.to_wsgi()
@@ -171,7 +171,7 @@ class App:
             start_response(status, headers)  # Start the WSGI response
             return body  # Return the response body
         except Exception as e:
-            logging.error(f"APP -> Critical error handling request: {e}")
+            logger.error("APP -> Critical error handling request: %s", e)
             os._exit(1)  # Forcefully terminate the program
 
     def __call__(self, environ, start_response):
@@ -185,25 +185,31 @@ class App:
             # Call the wrapped app
             return app(environ, start_response)
         except Exception as e:
-            logging.error(f"APP -> Critical error in middleware or app: {e} Exiting Pylone ...")
+            logger.error("APP -> Critical error in middleware or app: %s Exiting Pylone ...", e)
             os._exit(1)  # Forcefully terminate the program
 
     async def start_websocket_server(self, host="127.0.0.1", port=8001):
         """Start the WebSocket server (if enabled)."""
         if self.websocket_wrapper:
             await self.websocket_wrapper.start(host, port)
-            logging.info(f"🚀 WebSocket server running on ws://{host}:{port}")
+            logger.info("🚀 WebSocket server running on ws://%s:%s", host, port)
 
     def run(self, http_host="127.0.0.1", http_port=8000, ws_host="127.0.0.1", ws_port=8001):
         """Run the HTTP and WebSocket servers."""
         from wsgiref.simple_server import make_server
 
+        # Warm up before the listening socket is opened
+        self.warmup.run(mark_ready=False)
+
         # Start the HTTP server
         http_server = make_server(http_host, http_port, self)
-        logging.info(f"🚀 HTTP server running on http://{http_host}:{http_port}")
+        logger.info("🚀 HTTP server running on http://%s:%s", http_host, http_port)
+        self.warmup.mark_ready()
 
         # Start the WebSocket server in a separate thread (if enabled)
         if self.websocket_wrapper:
+            import asyncio  # Deferred: only servers with WebSocket routes need an event loop
+
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             websocket_thread = Thread(target=loop.run_until_complete, args=(self.start_websocket_server(ws_host, ws_port),))
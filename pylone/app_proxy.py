@@ -1,11 +1,14 @@
 # Create a proxy app that maintains the run method while using the middleware stack for WSGI calls
-import asyncio
+# asyncio is imported by the methods that run the WebSocket server, so HTTP-only
+# processes never load it
 import threading
 from pylone.app import App
 from typing import Callable, Dict, Any  # Add this import
 from wsgiref.simple_server import make_server
 import logging
 
+logger = logging.getLogger("pylone.app_proxy")
+
 class AppProxy:
     def __init__(self, base_app: App, wsgi_app: Callable):
         self.base_app = base_app
@@ -19,11 +22,13 @@ class AppProxy:
     def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Any:
         return self.wsgi_app(environ, start_response)
 
-    def run(self, http_host: str = "127.0.0.1", http_port: int = 8000, ws_host: str = "127.0.0.1", ws_port: int = 8001) -> None:
+    def run(self, http_host: str = "127.0.0.1", http_port: int = 8000, ws_host: str = "127.0.0.1", ws_port: int = 8001, ws_enabled: bool = True) -> None:
         """Start HTTP and WebSocket servers."""
+        import asyncio
+
         
         # Start the WebSocket server in a separate thread
-        if hasattr(self.base_app, "websocket_wrapper"):
+        if ws_enabled and getattr(self.base_app, "websocket_wrapper", None):
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
             self.websocket_thread = threading.Thread(
@@ -34,25 +39,37 @@ class AppProxy:
             self.websocket_thread.start()
 
         # Start HTTP server in a separate thread
-        self.http_server = make_server(http_host, http_port, self)
-        self.http_thread = threading.Thread(target=self._run_http_server, daemon=True)
+        self.http_thread = threading.Thread(target=self._run_http_server, args=(http_host, http_port), daemon=True)
         self.http_thread.start()
 
-        logging.info(f"🚀 HTTP server running on http://{http_host}:{http_port}")
-
         # Wait for shutdown signal
         self.shutdown_event.wait()
         self.shutdown()
 
-    def _run_http_server(self):
-        """Helper function to run the HTTP server."""
+    @property
+    def ready(self) -> threading.Event:
+        """Set once warm-up has finished and the HTTP server's socket is bound and listening."""
+        return self.base_app.warmup.ready
+
+    def _run_http_server(self, http_host, http_port):
+        """Helper function to warm up and run the HTTP server."""
         try:
+            # Warm up on the thread that serves requests, so thread-local
+            # resources such as SQLite connections are primed where they are
+            # used, and before the listening socket is opened.
+            self.base_app.warmup.run(mark_ready=False)
+            self.http_server = make_server(http_host, http_port, self)
+            logger.info("🚀 HTTP server running on http://%s:%s", http_host, http_port)
+            # Bound and listening: connections are queued from here on
+            self.base_app.warmup.mark_ready()
             self.http_server.serve_forever()
         except Exception as e:
-            logging.error(f"HTTP server encountered an error: {e}")
+            logger.error("HTTP server encountered an error: %s", e)
 
     async def _stop_event_loop(self):
         """Stop the event loop safely by ensuring all tasks are canceled."""
+        import asyncio
+
         tasks = [task for task in asyncio.all_tasks() if not task.done()]
         for task in tasks:
             task.cancel()
@@ -65,7 +82,9 @@ class AppProxy:
 
     async def _shutdown_websockets(self):
         """Stop the WebSocket server and clean up all tasks properly."""
-        logging.info("Cancelling pending WebSocket tasks...")
+        import asyncio
+
+        logger.info("Cancelling pending WebSocket tasks...")
         tasks = [task for task in asyncio.all_tasks(self.loop) if not task.done()]
         for task in tasks:
             task.cancel()
@@ -78,40 +97,44 @@ class AppProxy:
 
     def _run_websocket_server(self, ws_host, ws_port):
         """Runs the WebSocket server in a separate thread."""
+        import asyncio
+
         try:
             self.loop.run_until_complete(self.base_app.start_websocket_server(ws_host, ws_port))
         except asyncio.CancelledError:
-            logging.info("WebSocket server task was cancelled.")
+            logger.info("WebSocket server task was cancelled.")
         except Exception as e:
-            logging.error(f"Unexpected error in WebSocket server: {e}")
+            logger.error("Unexpected error in WebSocket server: %s", e)
         finally:
             self.loop.stop()  # <- Stop the event loop to allow full shutdown
-            logging.info("WebSocket server thread exiting...")
+            logger.info("WebSocket server thread exiting...")
     
     def shutdown(self):
         """Shuts down the application, including HTTP and WebSocket servers."""
-        logging.info("Shutting down servers gracefully...")
+        import asyncio
+
+        logger.info("Shutting down servers gracefully...")
 
         # Shutdown HTTP server
         if hasattr(self, "http_server") and self.http_server:
-            logging.info("Shutting down HTTP server...")
+            logger.info("Shutting down HTTP server...")
             self.http_server.shutdown()
-            logging.info("HTTP server shut down.")
+            logger.info("HTTP server shut down.")
     
         # Gracefully handle WebSocket server shutdown
         if hasattr(self, "ws_server"):
             if self.ws_server:
-                logging.info("Shutting down WebSocket server...")
+                logger.info("Shutting down WebSocket server...")
                 try:
                     for task in asyncio.all_tasks(self.loop):
                         task.cancel()
                         self.loop.stop()
-                        logging.info("WebSocket server shut down.")
+                        logger.info("WebSocket server shut down.")
                 except Exception as e:
-                    logging.error(f"Error shutting down WebSocket server: {e}")
+                    logger.error("Error shutting down WebSocket server: %s", e)
             else:
-                logging.info("WebSocket server was already None. No action needed.")
+                logger.info("WebSocket server was already None. No action needed.")
         else:
-            logging.info("WebSocket server was never initialized. Skipping shutdown.")
+            logger.info("WebSocket server was never initialized. Skipping shutdown.")
 
-        logging.info("All servers shut down gracefully. Exiting...")
\ No newline at end of file
+        logger.info("All servers shut down gracefully. Exiting...")
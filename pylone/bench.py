@@ -0,0 +1,309 @@
+"""pylone/bench.py
+
+This module provides an in-process benchmark harness for WSGI applications.
+Requests are driven straight through the WSGI callable (middlewares, router
+and controllers) without opening any sockets, so the numbers reflect the
+framework and application overhead only.
+
+Key features:
+    - Construction of WSGI environ dictionaries for synthetic requests.
+    - In-process WSGI calls that collect status, headers and body.
+    - Scenario definitions with an expected status code.
+    - Requests/sec, p50/p99 latency and allocated bytes per request.
+    - Baseline storage and regression gates with a configurable threshold.
+
+Usage:
+    Describe the scenarios to measure:
+    >>> scenarios = [Scenario("ajax_data", "GET", "/ajax/data")]
+
+    Run them against a WSGI application and print a report:
+    >>> results = run_benchmarks(app, scenarios, iterations=2000)
+    >>> print(format_report(results))
+
+    Compare against a stored baseline:
+    >>> regressions = compare_to_baseline(results, load_baseline("bench_baseline.json"))
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import io
+import sys
+import json
+import math
+import time
+import platform
+import tracemalloc
+from datetime import datetime
+
+
+def build_environ(method="GET", path="/", headers=None, body=b"", remote_addr="127.0.0.1"):
+    """
+    Build a WSGI environ dictionary for a synthetic request.
+
+    Args:
+        method (str): The HTTP method.
+        path (str): The request path, optionally with a query string.
+        headers (dict): Request headers, e.g. {"Cookie": "session_id=..."}.
+        body (bytes or str): The request body.
+        remote_addr (str): The client address reported to the application.
+
+    Returns:
+        dict: A WSGI environ ready to be passed to an application.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    path, _, query_string = path.partition("?")
+
+    environ = {
+        "REQUEST_METHOD": method.upper(),
+        "SCRIPT_NAME": "",
+        "PATH_INFO": path,
+        "QUERY_STRING": query_string,
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": remote_addr,
+        "CONTENT_TYPE": "",
+        "CONTENT_LENGTH": str(len(body)) if body else "",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for name, value in (headers or {}).items():
+        key = name.upper().replace("-", "_")
+        if key in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            environ[key] = value
+        else:
+            environ[f"HTTP_{key}"] = value
+    return environ
+
+
+def call_wsgi(app, environ):
+    """
+    Call a WSGI application in-process and collect the full response.
+
+    Args:
+        app (callable): The WSGI application.
+        environ (dict): The WSGI environ for the request.
+
+    Returns:
+        tuple: (status, headers, body) where status is the status line,
+        headers is a list of (name, value) tuples and body is bytes.
+    """
+    response = {}
+    chunks = []
+
+    def start_response(status, headers, exc_info=None):
+        response["status"] = status
+        response["headers"] = headers
+        return chunks.append
+
+    result = app(environ, start_response)
+    try:
+        for chunk in result:
+            chunks.append(chunk)
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+
+    return response.get("status", ""), response.get("headers", []), b"".join(chunks)
+
+
+def status_code(status):
+    """Return the integer status code from a WSGI status line."""
+    try:
+        return int(str(status).split(" ", 1)[0])
+    except ValueError:
+        return 0
+
+
+class Scenario:
+    """A single request shape to benchmark."""
+
+    def __init__(self, name, method="GET", path="/", headers=None, body=b"", expect_status=200):
+        """
+        Initialize a scenario.
+
+        Args:
+            name (str): A short identifier used in reports and baselines.
+            method (str): The HTTP method.
+            path (str): The request path, optionally with a query string.
+            headers (dict): Request headers.
+            body (bytes or str): The request body.
+            expect_status (int): The status code the scenario must return,
+                or None to accept any status.
+        """
+        self.name = name
+        self.method = method
+        self.path = path
+        self.headers = headers or {}
+        self.body = body
+        self.expect_status = expect_status
+
+    def environ(self):
+        """Build a fresh environ for one request of this scenario."""
+        return build_environ(self.method, self.path, self.headers, self.body)
+
+
+def percentile(sorted_values, fraction):
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_scenario(app, scenario, iterations=1000, warmup=100, alloc_iterations=200):
+    """
+    Benchmark a single scenario.
+
+    The scenario is first warmed up and its status checked, then timed over
+    `iterations` requests. Allocations are measured in a separate, shorter
+    pass because tracemalloc slows every allocation down.
+
+    Args:
+        app (callable): The WSGI application.
+        scenario (Scenario): The scenario to run.
+        iterations (int): Number of timed requests.
+        warmup (int): Number of untimed requests issued first.
+        alloc_iterations (int): Number of requests traced for allocations.
+
+    Returns:
+        dict: The measured metrics for the scenario.
+
+    Raises:
+        RuntimeError: If the scenario does not return its expected status.
+    """
+    for _ in range(max(1, warmup)):
+        status, _, _ = call_wsgi(app, scenario.environ())
+    code = status_code(status)
+    if scenario.expect_status is not None and code != scenario.expect_status:
+        raise RuntimeError(
+            f"Scenario '{scenario.name}' returned {status!r}, expected {scenario.expect_status}"
+        )
+
+    environs = [scenario.environ() for _ in range(iterations)]
+    latencies = []
+    perf_counter_ns = time.perf_counter_ns
+    started = perf_counter_ns()
+    for environ in environs:
+        t0 = perf_counter_ns()
+        call_wsgi(app, environ)
+        latencies.append(perf_counter_ns() - t0)
+    elapsed = (perf_counter_ns() - started) / 1e9
+    latencies.sort()
+
+    environs = [scenario.environ() for _ in range(alloc_iterations)]
+    allocated = 0
+    tracemalloc.start()
+    try:
+        for environ in environs:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call_wsgi(app, environ)
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - before
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "status": code,
+        "requests": iterations,
+        "rps": iterations / elapsed if elapsed else 0.0,
+        "mean_ms": sum(latencies) / len(latencies) / 1e6 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 0.50) / 1e6,
+        "p99_ms": percentile(latencies, 0.99) / 1e6,
+        "alloc_kib": allocated / max(1, alloc_iterations) / 1024,
+    }
+
+
+def run_benchmarks(app, scenarios, iterations=1000, warmup=100, alloc_iterations=200):
+    """Run every scenario and return a dictionary of results keyed by name."""
+    return {
+        scenario.name: run_scenario(app, scenario, iterations, warmup, alloc_iterations)
+        for scenario in scenarios
+    }
+
+
+def load_baseline(path):
+    """Load stored baseline results, or return None if the file does not exist."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f).get("scenarios", {})
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(results, path):
+    """Store results as the new baseline."""
+    data = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scenarios": results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4, sort_keys=True)
+
+
+def compare_to_baseline(results, baseline, threshold=0.10):
+    """
+    Compare results against a baseline.
+
+    A scenario regresses when its throughput drops, or its p99 latency or
+    allocations grow, by more than `threshold` (a fraction, 0.10 = 10%).
+    Scenarios that are missing from the baseline are not compared.
+
+    Returns:
+        list: Human-readable descriptions of each regression.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = (baseline or {}).get(name)
+        if not previous:
+            continue
+        if previous["rps"] and current["rps"] < previous["rps"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {current['rps']:.0f} req/s vs baseline {previous['rps']:.0f} req/s"
+            )
+        if previous["p99_ms"] and current["p99_ms"] > previous["p99_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p99 {current['p99_ms']:.3f} ms vs baseline {previous['p99_ms']:.3f} ms"
+            )
+        if previous["alloc_kib"] and current["alloc_kib"] > previous["alloc_kib"] * (1 + threshold):
+            regressions.append(
+                f"{name}: allocations {current['alloc_kib']:.1f} KiB/req vs baseline {previous['alloc_kib']:.1f} KiB/req"
+            )
+    return regressions
+
+
+def _delta(current, previous):
+    if not previous:
+        return ""
+    return f"{(current - previous) / previous * 100:+.1f}%"
+
+
+def format_report(results, baseline=None):
+    """Format results, and deltas against a baseline if given, as a text table."""
+    header = f"{'scenario':<16} {'status':>6} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'KiB/req':>9}"
+    if baseline:
+        header += f" {'d req/s':>9} {'d p99':>9} {'d KiB':>9}"
+    lines = [header, "-" * len(header)]
+    for name, r in results.items():
+        line = (
+            f"{name:<16} {r['status']:>6} {r['rps']:>10.0f} {r['p50_ms']:>9.3f} "
+            f"{r['p99_ms']:>9.3f} {r['alloc_kib']:>9.1f}"
+        )
+        previous = (baseline or {}).get(name)
+        if previous:
+            line += (
+                f" {_delta(r['rps'], previous['rps']):>9} {_delta(r['p99_ms'], previous['p99_ms']):>9}"
+                f" {_delta(r['alloc_kib'], previous['alloc_kib']):>9}"
+            )
+        lines.append(line)
+    return "\n".join(lines)
@@ -1,19 +1,24 @@
 import asyncio
-import spacy
-from spellchecker import SpellChecker
 from typing import Callable, Optional, Dict, List
 import uuid
 from datetime import datetime
 import re
-import websockets
 
 
 class ChatHandler:
-    def __init__(self, greeting: str, nlp_model: Optional[spacy.language.Language] = None):
+    def __init__(self, greeting: str, nlp_model: Optional["spacy.language.Language"] = None):
         self.greeting = greeting
         self.nlp_model = nlp_model
         self.user_states = {}
-        self.spell = SpellChecker()
+        self._spell = None
+
+    @property
+    def spell(self):
+        """The spell checker, loaded on first use (pyspellchecker is slow to import)."""
+        if self._spell is None:
+            from spellchecker import SpellChecker
+            self._spell = SpellChecker()
+        return self._spell
 
     async def handle_chat(self, websocket, message_processor: Optional[Callable[[str], str]] = None):
         user_id = str(uuid.uuid4())
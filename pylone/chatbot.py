@@ -1,24 +1,39 @@
 import asyncio
-import spacy
 import json
 import os
-from spellchecker import SpellChecker
 from typing import Callable, Optional, Dict, List
 import uuid
 from datetime import datetime
 import re
-import websockets
-from fpdf import FPDF
+
+# spaCy, pyspellchecker and fpdf take seconds to import and load, so they are
+# imported on first use rather than when this module is imported.
 
 class FluwdChatBot:
-    def __init__(self, greeting: str, nlp_model: Optional[spacy.language.Language] = None):
+    def __init__(self, greeting: str, nlp_model: Optional["spacy.language.Language"] = None):
         self.greeting = greeting
-        self.nlp_model = nlp_model if nlp_model else spacy.load("en_core_web_sm")
-        self.spell = SpellChecker()
+        self._nlp_model = nlp_model
+        self._spell = None
         self.user_states = {}
         self.chat_history = []
         self.data_store_path = "chat_logs.json"
         self.load_chat_history()
+
+    @property
+    def nlp_model(self):
+        """The spaCy model, loaded on first use."""
+        if self._nlp_model is None:
+            import spacy
+            self._nlp_model = spacy.load("en_core_web_sm")
+        return self._nlp_model
+
+    @property
+    def spell(self):
+        """The spell checker, loaded on first use."""
+        if self._spell is None:
+            from spellchecker import SpellChecker
+            self._spell = SpellChecker()
+        return self._spell
     
     async def handle_chat(self, websocket, message_processor: Optional[Callable[[str], str]] = None):
         user_id = str(uuid.uuid4())
@@ -93,6 +108,7 @@ class FluwdChatBot:
         return [entry for entry in self.chat_history if keyword.lower() in entry["message"].lower()]
     
     def generate_project_charter(self) -> str:
+        from fpdf import FPDF
         pdf = FPDF()
         pdf.set_auto_page_break(auto=True, margin=15)
         pdf.add_page()
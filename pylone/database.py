@@ -29,8 +29,7 @@ Usage:
 import sqlite3
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("pylone.database")
 
 class Database:
     def __init__(self, db_path="database.db"):
@@ -75,7 +74,7 @@ class Database:
         try:
             return self.execute("SELECT * FROM users WHERE username = ?", (username,), fetchone=True)
         except sqlite3.Error as e:
-            logging.error(f"Error retrieving user: {e}")
+            logger.error("Error retrieving user: %s", e)
             return None
 
   
\ No newline at end of file
@@ -2,17 +2,16 @@ import sqlite3
 from sqlite3 import Error
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("pylone.db_utils")
 
 def create_connection(db_file):
     """Create a database connection to the SQLite database."""
     conn = None
     try:
         conn = sqlite3.connect(db_file)
-        logging.debug("Connection to SQLite DB successful")
+        logger.debug("Connection to SQLite DB successful")
     except Error as e:
-        logging.error(f"Error connecting to SQLite DB: {e}")
+        logger.error("Error connecting to SQLite DB: %s", e)
     return conn
 
 def create_table(conn, table_sql):
@@ -21,6 +20,6 @@ def create_table(conn, table_sql):
         cursor = conn.cursor()
         cursor.execute(table_sql)
         conn.commit()
-        logging.debug("Table created or already exists")
+        logger.debug("Table created or already exists")
     except Error as e:
-        logging.error(f"Error creating table: {e}")
\ No newline at end of file
+        logger.error("Error creating table: %s", e)
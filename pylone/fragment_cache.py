@@ -0,0 +1,276 @@
+"""pylone/fragment_cache.py
+
+This module provides template fragment caching: a `{% cache %}` Jinja tag
+whose rendered output is kept in a bounded in-memory LRU, so expensive
+parts of a page (navigation, sidebars, lists) are rendered once per TTL
+instead of on every request.
+
+Tag syntax:
+    {% cache key %}...{% endcache %}
+    {% cache key, ttl %}...{% endcache %}
+    {% cache key, ttl, tags %}...{% endcache %}
+
+    key:  Any expression, e.g. "sidebar:" ~ user.id.
+    ttl:  Seconds the fragment is kept (default: the cache's default_ttl;
+          0 keeps it until it is evicted or invalidated).
+    tags: A tag name or a list of tag names, for invalidating groups of
+          fragments.
+
+Key features:
+    - LRU eviction bounded by the number of fragments.
+    - Invalidation by key or by tag from Python code, e.g. after a write.
+    - An optional SharedCache tier, so a fragment rendered by one worker
+      process is reused by all of them, and invalidations reach them all.
+    - Hit, miss, expiry, eviction and invalidation counters.
+
+Usage:
+    In a template:
+    {% cache "demo:crew", 300, "crew" %}
+        {% for member in crew %}...{% endfor %}
+    {% endcache %}
+
+    After the crew changes:
+    >>> fragment_cache.invalidate_tag("crew")
+    >>> fragment_cache.stats()
+    {'hits': 41, 'misses': 2, 'expired': 0, 'evicted': 0, 'invalidated': 1, 'entries': 0}
+
+    Share fragments between worker processes:
+    >>> fragment_cache.use_shared(SharedCache("/dev/shm/pylone-cache"))
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import time
+import marshal
+import threading
+from collections import OrderedDict
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+from pylone.shared_cache import name_hash
+
+# Shared-tier TTL for fragments kept until they are evicted or invalidated
+SHARED_FOREVER = 365 * 86400
+
+
+# SharedCache tag carried by every fragment, so clear() can drop them all
+# without touching the other caches sharing the file
+FRAGMENT_TAG = "fragment:*"
+
+
+def _shared_key(key):
+    return "fragment:" + str(key)
+
+
+def _shared_tag(tag):
+    return "fragment-tag:" + str(tag)
+
+
+class FragmentCache:
+    def __init__(self, max_entries=1024, default_ttl=300, clock=time.monotonic, shared=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Fragments kept; the least recently used go first.
+            default_ttl (float): Seconds a fragment is kept when the tag gives no TTL.
+            clock (callable): Returns the current time in seconds.
+            shared (SharedCache): A second tier shared with the other worker
+                processes, checked on a local miss (see use_shared()).
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> (value, expires or None, tags)
+        self.tags = {}                # tag -> set of keys
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        self.invalidated = 0
+        self.shared_hits = 0
+        self.use_shared(shared)
+
+    def use_shared(self, shared):
+        """Attach a SharedCache as the second tier, or detach it with None."""
+        with self.lock:
+            self.shared = shared
+            self.seen = shared.generation() if shared is not None else 0
+
+    def get(self, key):
+        """Return the cached fragment for `key`, or None."""
+        with self.lock:
+            if self.shared is not None:
+                self._sync()
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] is not None and self.clock() >= entry[1]:
+                self._remove(key)
+                self.expired += 1
+                entry = None
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        return self._get_shared(key) if self.shared is not None else None
+
+    def _get_shared(self, key):
+        """Look up a local miss in the shared tier, keeping a hit locally until it expires."""
+        shared = self.shared
+        found = shared.get(_shared_key(key))
+        if found is None:
+            return None
+        data, expires = found
+        markup, value, tags = marshal.loads(data)
+        if markup:
+            value = Markup(value)
+        self._store(key, value, expires - shared.clock(), tags)
+        self.shared_hits += 1
+        return value
+
+    def set(self, key, value, ttl=None, tags=()):
+        """
+        Cache a fragment.
+
+        Args:
+            key: The fragment key.
+            value (str): The rendered fragment.
+            ttl (float): Seconds to keep it (None uses default_ttl; 0 keeps
+                it until it is evicted or invalidated).
+            tags (iterable): Tag names for invalidate_tag().
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        tags = tuple(tags)
+        if self.shared is not None:
+            data = marshal.dumps((isinstance(value, Markup), str(value), tuple(str(tag) for tag in tags)))
+            self.shared.set(_shared_key(key), data, ttl or SHARED_FOREVER,
+                            [FRAGMENT_TAG] + [_shared_tag(tag) for tag in tags])
+        self._store(key, value, ttl, tags)
+
+    def _store(self, key, value, ttl, tags):
+        expires = self.clock() + ttl if ttl else None
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (value, expires, tags)
+            for tag in tags:
+                self.tags.setdefault(tag, set()).add(key)
+            while len(self.entries) > self.max_entries:
+                self._remove(next(iter(self.entries)))
+                self.evicted += 1
+
+    def _remove(self, key):
+        """Drop a fragment and its tag references. The lock must be held."""
+        _, _, tags = self.entries.pop(key)
+        for tag in tags:
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+    def invalidate(self, *keys):
+        """
+        Drop the fragments with the given keys, in every worker if there is a shared tier.
+
+        Returns:
+            int: The number dropped from this process's cache.
+        """
+        if self.shared is not None:
+            self.shared.invalidate(*[_shared_key(key) for key in keys])
+        dropped = 0
+        with self.lock:
+            for key in keys:
+                if key in self.entries:
+                    self._remove(key)
+                    dropped += 1
+            self.invalidated += dropped
+        return dropped
+
+    def invalidate_tag(self, *tags):
+        """
+        Drop every fragment carrying any of the given tags, in every worker if there is a shared tier.
+
+        Returns:
+            int: The number dropped from this process's cache.
+        """
+        if self.shared is not None:
+            self.shared.invalidate_tag(*[_shared_tag(tag) for tag in tags])
+        dropped = 0
+        with self.lock:
+            for tag in tags:
+                for key in list(self.tags.get(tag, ())):
+                    self._remove(key)
+                    dropped += 1
+            self.invalidated += dropped
+        return dropped
+
+    def clear(self):
+        """Drop every fragment, in every worker if there is a shared tier."""
+        if self.shared is not None:
+            self.shared.invalidate_tag(FRAGMENT_TAG)
+        with self.lock:
+            self.entries.clear()
+            self.tags.clear()
+
+    def _sync(self):
+        """Apply the shared tier's invalidations since the last call. The lock must be held."""
+        if self.shared.generation() == self.seen:
+            return
+        self.seen, hashes = self.shared.changes_since(self.seen)
+        if hashes is None or name_hash(FRAGMENT_TAG) in hashes:
+            self.entries.clear()
+            self.tags.clear()
+            return
+        for key, (_, _, tags) in list(self.entries.items()):
+            if name_hash(_shared_key(key)) in hashes or any(name_hash(_shared_tag(tag)) in hashes for tag in tags):
+                self._remove(key)
+
+    def stats(self):
+        """Return the cache's counters, and the shared tier's if there is one."""
+        stats = {"hits": self.hits, "misses": self.misses, "expired": self.expired, "evicted": self.evicted,
+                 "invalidated": self.invalidated, "entries": len(self.entries)}
+        if self.shared is not None:
+            stats["shared_hits"] = self.shared_hits
+            stats["shared"] = self.shared.stats()
+        return stats
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# The cache shared by every TemplateEngine, for invalidation from Python code
+fragment_cache = FragmentCache()
+
+
+class FragmentCacheExtension(Extension):
+    """The {% cache key[, ttl[, tags]] %}...{% endcache %} tag, backed by environment.fragment_cache."""
+
+    tags = {"cache"}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=fragment_cache)
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        for _ in range(2):
+            if parser.stream.skip_if("comma"):
+                args.append(parser.parse_expression())
+            else:
+                args.append(nodes.Const(None))
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(self.call_method("_cached", args), [], [], body).set_lineno(lineno)
+
+    def _cached(self, key, ttl, tags, caller):
+        cache = self.environment.fragment_cache
+        value = cache.get(key)
+        if value is None:
+            value = caller()
+            if isinstance(tags, str):
+                tags = (tags,)
+            cache.set(key, value, ttl, tags or ())
+        return value
@@ -0,0 +1,406 @@
+"""pylone/loadgen.py
+
+This module provides an HTTP/1.1 load generator built on asyncio and the
+standard library only. It is meant for sizing Pylone instances on hosts
+where tools such as wrk or locust cannot be installed.
+
+Key features:
+    - Multiple keep-alive connections, reconnecting when the server closes one.
+    - Weighted request mixes loaded from a JSON file.
+    - Closed-loop mode (each connection sends as fast as responses arrive).
+    - Open-loop constant-rate mode. Latency is measured from the time a request
+      was scheduled to be sent, not from when a connection became free, so a
+      stalled server cannot hide its queueing delay (coordinated omission).
+    - HdrHistogram-style log-linear latency histogram with ~1% precision.
+
+Mix file format:
+    A JSON list of requests, each with an optional relative weight:
+
+    [
+        {"method": "GET", "path": "/login", "weight": 3},
+        {"method": "GET", "path": "/ajax/data", "weight": 5},
+        {"method": "POST", "path": "/login", "weight": 1,
+         "headers": {"Content-Type": "application/json"},
+         "body": "{\\"username\\": \\"demo\\", \\"password\\": \\"demo\\"}"}
+    ]
+
+Usage:
+    Run a 10 second closed-loop test with 16 connections:
+    >>> result = run_load("http://127.0.0.1:8000", [RequestSpec("GET", "/login")],
+    ...                   connections=16, duration=10)
+    >>> print(result.format_report())
+
+    Run at a constant 500 requests/sec:
+    >>> result = run_load("http://127.0.0.1:8000", load_mix("mix.json"), rate=500)
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import json
+import math
+import time
+import random
+import asyncio
+from collections import Counter
+from urllib.parse import urlsplit
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies in microseconds.
+
+    Values below 256 are counted exactly. Larger values fall into buckets of
+    128 sub-buckets per power of two, bounding the relative error to under
+    1%, which is the same trade-off HdrHistogram makes with two significant
+    digits. Memory is proportional to the number of distinct buckets hit.
+    """
+
+    SUB_BUCKET_BITS = 8
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+
+    def __init__(self):
+        self.counts = Counter()
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value):
+        if value < self.SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - self.SUB_BUCKET_BITS
+        return self.SUB_BUCKET_COUNT + (shift - 1) * self.SUB_BUCKET_HALF + (value >> shift) - self.SUB_BUCKET_HALF
+
+    def _highest_equivalent(self, index):
+        if index < self.SUB_BUCKET_COUNT:
+            return index
+        shift, sub = divmod(index - self.SUB_BUCKET_COUNT, self.SUB_BUCKET_HALF)
+        shift += 1
+        return ((sub + self.SUB_BUCKET_HALF) << shift) + (1 << shift) - 1
+
+    def record(self, value_us):
+        """Record a single latency, in microseconds."""
+        value = max(0, int(value_us))
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """Add the values recorded by another histogram."""
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p):
+        """Return the value at percentile `p` (0-100), in microseconds."""
+        if not self.count:
+            return 0
+        target = min(self.count, max(1, math.ceil(p / 100.0 * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class RequestSpec:
+    """A request in a load mix, pre-encoded once into raw HTTP/1.1 bytes."""
+
+    def __init__(self, method="GET", path="/", headers=None, body=b"", weight=1):
+        self.method = method.upper()
+        self.path = path
+        self.headers = headers or {}
+        self.body = body.encode("utf-8") if isinstance(body, str) else (body or b"")
+        self.weight = weight
+        self.raw = None
+
+    def encode(self, host):
+        """Build the raw request bytes for the given Host header."""
+        lines = [f"{self.method} {self.path} HTTP/1.1", f"Host: {host}", "Connection: keep-alive"]
+        for name, value in self.headers.items():
+            lines.append(f"{name}: {value}")
+        if self.body or self.method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(self.body)}")
+        self.raw = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + self.body
+        return self.raw
+
+
+def load_mix(path):
+    """Load a weighted request mix from a JSON file."""
+    with open(path, "r") as f:
+        entries = json.load(f)
+    if isinstance(entries, dict):
+        entries = entries.get("requests", [])
+    if not entries:
+        raise ValueError(f"Request mix {path} is empty")
+    return [
+        RequestSpec(
+            entry.get("method", "GET"),
+            entry.get("path", "/"),
+            entry.get("headers"),
+            entry.get("body", b""),
+            entry.get("weight", 1),
+        )
+        for entry in entries
+    ]
+
+
+class HTTPConnection:
+    """A single keep-alive HTTP/1.1 client connection."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def _connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def request(self, raw):
+        """Send a request and read the full response. Returns (status, bytes)."""
+        reused = self.writer is not None
+        if not reused:
+            await self._connect()
+        self.writer.write(raw)
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        if not status_line and reused:
+            # The server closed an idle keep-alive connection; retry once.
+            self.close()
+            await self._connect()
+            self.writer.write(raw)
+            await self.writer.drain()
+            status_line = await self.reader.readline()
+        if not status_line:
+            self.close()
+            raise ConnectionError("Connection closed before a response was received")
+
+        received = 0
+        while True:
+            version, status, _ = (status_line.decode("latin-1").split(" ", 2) + [""])[:3]
+            status = int(status)
+            headers = {}
+            while True:
+                line = await self.reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            received += len(status_line)
+            if not 100 <= status < 200 or status == 101:
+                break
+            # An interim response (e.g. 100 Continue) precedes the final one.
+            status_line = await self.reader.readline()
+            if not status_line:
+                self.close()
+                raise ConnectionError("Connection closed before a final response was received")
+
+        # HEAD, 1xx, 204 and 304 responses never have a body, whatever their
+        # headers say (RFC 9112 section 6.3).
+        if status == 101:
+            # The connection no longer speaks HTTP.
+            self.close()
+            return status, received
+        elif raw.startswith(b"HEAD ") or status in (204, 304):
+            pass
+        elif "content-length" in headers:
+            received += len(await self.reader.readexactly(int(headers["content-length"])))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                received += len(await self.reader.readexactly(size + 2))
+                if size == 0:
+                    break
+        else:
+            received += len(await self.reader.read())
+            self.close()
+            return status, received
+
+        connection = headers.get("connection", "").lower()
+        if connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive"):
+            self.close()
+        return status, received
+
+
+class LoadResult:
+    """Aggregated outcome of a load run."""
+
+    def __init__(self, target, connections, rate):
+        self.target = target
+        self.connections = connections
+        self.rate = rate
+        self.histogram = LatencyHistogram()
+        self.statuses = Counter()
+        self.errors = Counter()
+        self.bytes_received = 0
+        self.backlog = 0
+        self.duration = 0.0
+
+    @property
+    def completed(self):
+        return self.histogram.count
+
+    def format_report(self):
+        """Format the result as a human-readable report."""
+        mode = f"open-loop at {self.rate:g} req/s" if self.rate else "closed-loop"
+        h = self.histogram
+        lines = [
+            f"Target:       {self.target} ({self.connections} connections, {mode})",
+            f"Duration:     {self.duration:.2f} s",
+            f"Requests:     {self.completed} completed, {sum(self.errors.values())} errors",
+            f"Throughput:   {self.completed / self.duration if self.duration else 0:.1f} req/s, "
+            f"{self.bytes_received / 1024 / max(self.duration, 1e-9):.1f} KiB/s",
+            "Latency (ms):",
+            f"  min {(h.min or 0) / 1000:.3f}  mean {h.mean() / 1000:.3f}  max {h.max / 1000:.3f}",
+        ]
+        for p in (50, 75, 90, 99, 99.9, 99.99):
+            lines.append(f"  p{p:<6g} {h.percentile(p) / 1000:10.3f}")
+        lines.append("Status codes: " + ", ".join(f"{code}: {n}" for code, n in sorted(self.statuses.items())))
+        if self.errors:
+            lines.append("Errors:       " + ", ".join(f"{name}: {n}" for name, n in self.errors.items()))
+        if self.backlog:
+            lines.append(
+                f"WARNING: {self.backlog} scheduled requests were never sent; "
+                "the server cannot sustain the requested rate."
+            )
+        return "\n".join(lines)
+
+
+class LoadGenerator:
+    """Drives a request mix against an HTTP server."""
+
+    def __init__(self, target, requests, connections=8, duration=10.0, rate=None, timeout=10.0, seed=None):
+        """
+        Initialize the load generator.
+
+        Args:
+            target (str): Base URL of the server, e.g. "http://127.0.0.1:8000".
+            requests (list): RequestSpec objects making up the mix.
+            connections (int): Number of concurrent keep-alive connections.
+            duration (float): Length of the run in seconds.
+            rate (float): Requests/sec for open-loop mode, or None for closed-loop.
+            timeout (float): Per-request timeout in seconds.
+            seed (int): Seed for the request-mix random generator.
+        """
+        url = urlsplit(target)
+        if url.scheme != "http":
+            raise ValueError("Only plain http:// targets are supported")
+        self.target = target
+        self.host = url.hostname or "127.0.0.1"
+        self.port = url.port or 80
+        self.requests = requests
+        self.connections = max(1, connections)
+        self.duration = duration
+        self.rate = rate
+        self.timeout = timeout
+        self.random = random.Random(seed)
+
+        host_header = url.netloc or self.host
+        for spec in requests:
+            spec.encode(host_header)
+        total = 0
+        self.cum_weights = []
+        for spec in requests:
+            total += spec.weight
+            self.cum_weights.append(total)
+
+    def _pick(self):
+        return self.random.choices(self.requests, cum_weights=self.cum_weights)[0]
+
+    async def _send(self, connection, spec, started, result):
+        try:
+            status, received = await asyncio.wait_for(connection.request(spec.raw), self.timeout)
+        except asyncio.TimeoutError:
+            connection.close()
+            result.errors["timeout"] += 1
+            return
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            connection.close()
+            result.errors[type(e).__name__] += 1
+            return
+        result.histogram.record((time.perf_counter() - started) * 1e6)
+        result.statuses[status] += 1
+        result.bytes_received += received
+
+    async def _closed_loop_worker(self, deadline, result):
+        connection = HTTPConnection(self.host, self.port)
+        try:
+            while time.perf_counter() < deadline:
+                await self._send(connection, self._pick(), time.perf_counter(), result)
+        finally:
+            connection.close()
+
+    async def _open_loop_worker(self, queue, result):
+        connection = HTTPConnection(self.host, self.port)
+        try:
+            while True:
+                intended, spec = await queue.get()
+                try:
+                    # Latency counts from the intended send time (coordinated omission).
+                    await self._send(connection, spec, intended, result)
+                finally:
+                    queue.task_done()
+        finally:
+            connection.close()
+
+    async def _schedule(self, queue, start, deadline):
+        interval = 1.0 / self.rate
+        n = 0
+        while True:
+            intended = start + n * interval
+            if intended >= deadline:
+                return
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            queue.put_nowait((intended, self._pick()))
+            n += 1
+
+    async def run_async(self):
+        result = LoadResult(self.target, self.connections, self.rate)
+        start = time.perf_counter()
+        deadline = start + self.duration
+
+        if not self.rate:
+            await asyncio.gather(*(self._closed_loop_worker(deadline, result) for _ in range(self.connections)))
+        else:
+            queue = asyncio.Queue()
+            workers = [asyncio.ensure_future(self._open_loop_worker(queue, result)) for _ in range(self.connections)]
+            await self._schedule(queue, start, deadline)
+            try:
+                await asyncio.wait_for(queue.join(), self.timeout)
+            except asyncio.TimeoutError:
+                pass
+            result.backlog = queue.qsize()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        result.duration = time.perf_counter() - start
+        return result
+
+    def run(self):
+        """Run the load test to completion and return a LoadResult."""
+        return asyncio.run(self.run_async())
+
+
+def run_load(target, requests, connections=8, duration=10.0, rate=None, timeout=10.0, seed=None):
+    """Convenience wrapper around LoadGenerator(...).run()."""
+    return LoadGenerator(target, requests, connections, duration, rate, timeout, seed).run()
@@ -0,0 +1,103 @@
+"""pylone/log.py
+
+This module configures logging for a Pylone application. Framework and demo
+modules only create named loggers (e.g. "pylone.router") and never configure
+handlers or levels themselves; the entry point picks a logging profile once
+at startup.
+
+Debug-level messages on the request path use lazy %-style arguments, and the
+expensive ones (headers, cookies, bodies) are guarded by isEnabledFor(), so
+with the production profile they cost a single level check per call site.
+
+Key features:
+    - "development" profile: everything at INFO (or DEBUG with debug=True),
+      with logger names in the output.
+    - "production" profile: framework messages at INFO, everything else at
+      WARNING, and no caller/thread/process lookups per record.
+    - "benchmark" profile: errors only, so measurements are not skewed by
+      console output.
+    - Per-logger level overrides.
+
+Usage:
+    Configure logging once, from the entry point:
+    >>> configure_logging("production")
+
+    Turn on debug detail for the router only:
+    >>> configure_logging("development", levels={"pylone.router": logging.DEBUG})
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import logging
+
+# logging's own source file, which findCaller() skips while walking the stack
+_SRCFILE = logging._srcfile
+
+PROFILES = {
+    "development": {
+        "level": logging.INFO,
+        "format": "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+        "levels": {},
+        "record_details": True,
+    },
+    "production": {
+        "level": logging.WARNING,
+        "format": "%(asctime)s %(levelname)s %(name)s %(message)s",
+        "levels": {"pylone": logging.INFO},
+        "record_details": False,
+    },
+    "benchmark": {
+        "level": logging.ERROR,
+        "format": "%(asctime)s %(levelname)s %(name)s %(message)s",
+        "levels": {},
+        "record_details": False,
+    },
+}
+
+
+def configure_logging(profile="development", debug=False, levels=None, stream=None):
+    """
+    Configure the root logger from a named profile.
+
+    Args:
+        profile (str): One of "development", "production" or "benchmark".
+        debug (bool): Lower the root level to DEBUG. Ignored by the
+            production and benchmark profiles.
+        levels (dict): Extra logger name -> level overrides.
+        stream: The stream to log to (defaults to sys.stderr).
+
+    Returns:
+        logging.Logger: The root logger.
+
+    Raises:
+        ValueError: If the profile is unknown.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown logging profile '{profile}' (expected one of {', '.join(PROFILES)})")
+    settings = PROFILES[profile]
+
+    level = settings["level"]
+    if debug and profile == "development":
+        level = logging.DEBUG
+    logging.basicConfig(level=level, format=settings["format"], stream=stream, force=True)
+
+    overrides = {**settings["levels"], **(levels or {})}
+    for other in PROFILES.values():
+        for name in other["levels"]:
+            logging.getLogger(name).setLevel(overrides.get(name, logging.NOTSET))
+    for name, logger_level in overrides.items():
+        logging.getLogger(name).setLevel(logger_level)
+
+    # Skip the per-record stack walk, thread and process lookups, and the
+    # traceback printing on handler errors, when they are not needed. The
+    # stack walk (findCaller) is turned off through logging's private
+    # _srcfile: with it None, records get "(unknown file)" as pathname, which
+    # no profile's format uses.
+    record_details = settings["record_details"]
+    logging._srcfile = _SRCFILE if record_details else None
+    logging.logThreads = record_details
+    logging.logProcesses = record_details
+    logging.logMultiprocessing = record_details
+    logging.raiseExceptions = record_details
+    return logging.getLogger()
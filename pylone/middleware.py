@@ -27,6 +27,11 @@ Usage:
     Author: cooper@agilecreativelabs.ca
     Copyright: © 2025 Agile Creative Labs Inc.
 """
+import logging
+
+logger = logging.getLogger("pylone.middleware")
+
+
 class Middleware:
     def __init__(self, app):
         """
@@ -66,7 +71,7 @@ class Middleware:
         Args:
             environ: The WSGI environment dictionary.
         """
-        logging.debug(f"Middleware: Pre-processing request for {environ['PATH_INFO']}")
+        logger.debug("Middleware: Pre-processing request for %s", environ['PATH_INFO'])
 
     def post_process(self, environ, response):
         """
@@ -76,4 +81,4 @@ class Middleware:
             environ: The WSGI environment dictionary.
             response: The WSGI response.
         """
-        logging.debug(f"Middleware: Post-processing response for {environ['PATH_INFO']}")
\ No newline at end of file
+        logger.debug("Middleware: Post-processing response for %s", environ['PATH_INFO'])
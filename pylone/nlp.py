@@ -1,5 +1,3 @@
-import spacy
-
 class NLPWrapper:
     _instance = None  # Singleton instance for efficiency
 
@@ -11,6 +9,7 @@ class NLPWrapper:
 
     def _load_model(self, model):
         """Load and cache the spaCy NLP model"""
+        import spacy  # Deferred: importing spaCy takes seconds
         self.nlp = spacy.load(model)
 
     def process_text(self, text):
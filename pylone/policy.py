@@ -0,0 +1,147 @@
+"""pylone/policy.py
+
+This module provides an AccessPolicy that decides which requirement applies
+to a request path. Rules are compiled into lookup structures when they are
+added, so evaluating a path costs one hash lookup plus a walk over its
+segments, whatever the number of rules.
+
+Rules, in order of precedence:
+    exact:   A set of literal paths, e.g. "/login".
+    pattern: Route patterns such as "/edit_user/<int:user_id>", compiled into
+             a segment trie where "<...>" segments match any one segment.
+    prefix:  Path prefixes on segment boundaries, e.g. "/static/", in a
+             segment trie; the longest matching prefix wins.
+    default: The requirement for every other path.
+
+A requirement is "public", "authenticated", or a callable that receives the
+session (or None) and returns True if access is granted.
+
+Key features:
+    - O(path length) evaluation.
+    - Built directly from Router.add_route(..., public=True) metadata, so
+      public and private routes are declared once, next to the route.
+    - Per-rule requirements, including custom predicates.
+
+Usage:
+    Build the policy from the router and allow static files:
+    >>> policy = AccessPolicy.from_router(router)
+    >>> policy.allow_prefix("/static/")
+    >>> policy.requirement("/static/css/style.css")
+    'public'
+    >>> policy.is_allowed("/dashboard", session=None)
+    False
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import re
+
+PUBLIC = "public"
+AUTHENTICATED = "authenticated"
+
+_PARAM = re.compile(r"^<(\w+:)?\w+>$")
+_WILDCARD = "<*>"  # Trie key for a "<param>" segment
+_RULE = None       # Trie key for the requirement stored at a node
+
+
+def _segments(path):
+    return path.strip("/").split("/") if path.strip("/") else []
+
+
+class AccessPolicy:
+    def __init__(self, default=AUTHENTICATED):
+        """
+        Initialize an empty policy.
+
+        Args:
+            default: The requirement for paths that match no rule.
+        """
+        self.default = default
+        self.exact = {}
+        self.patterns = {}
+        self.prefixes = {}
+
+    @classmethod
+    def from_router(cls, router, default=AUTHENTICATED):
+        """
+        Build a policy from the routes of a Router.
+
+        Routes registered with public=True are public. A route may also pass
+        requires=... to add_route() for any other requirement; all other
+        routes get the default.
+        """
+        policy = cls(default)
+        for path, route in router.routes.items():
+            requires = route["meta"].get("requires", PUBLIC if route["public"] else None)
+            if requires is not None:
+                policy.add_rule(path, requires)
+        return policy
+
+    def add_rule(self, path, requires=PUBLIC):
+        """Add a rule for an exact path or a route pattern with "<param>" segments."""
+        segments = _segments(path)
+        if not any(_PARAM.match(segment) for segment in segments):
+            self.exact[path] = requires
+            return self
+        node = self.patterns
+        for segment in segments:
+            node = node.setdefault(_WILDCARD if _PARAM.match(segment) else segment, {})
+        node[_RULE] = requires
+        return self
+
+    def allow_prefix(self, prefix, requires=PUBLIC):
+        """Add a rule for every path under `prefix` (matched on whole segments)."""
+        node = self.prefixes
+        for segment in _segments(prefix):
+            node = node.setdefault(segment, {})
+        node[_RULE] = requires
+        return self
+
+    def requirement(self, path):
+        """Return the requirement that applies to `path`."""
+        requires = self.exact.get(path)
+        if requires is not None:
+            return requires
+
+        segments = _segments(path)
+        if self.patterns:
+            requires = self._match_pattern(self.patterns, segments, 0)
+            if requires is not None:
+                return requires
+
+        node, requires = self.prefixes, self.prefixes.get(_RULE)
+        for segment in segments:
+            node = node.get(segment)
+            if node is None:
+                break
+            requires = node.get(_RULE, requires)
+        return requires if requires is not None else self.default
+
+    def _match_pattern(self, node, segments, i):
+        # Literal segments take precedence over parameters; backtracking is
+        # only needed when both exist at the same depth.
+        if i == len(segments):
+            return node.get(_RULE)
+        child = node.get(segments[i])
+        if child is not None:
+            requires = self._match_pattern(child, segments, i + 1)
+            if requires is not None:
+                return requires
+        child = node.get(_WILDCARD)
+        if child is not None and segments[i]:
+            return self._match_pattern(child, segments, i + 1)
+        return None
+
+    def is_public(self, path):
+        """Return True if `path` needs no session at all."""
+        return self.requirement(path) == PUBLIC
+
+    def is_allowed(self, path, session):
+        """Return True if a request for `path` with `session` (or None) is allowed."""
+        requires = self.requirement(path)
+        if requires == PUBLIC:
+            return True
+        if requires == AUTHENTICATED:
+            return session is not None
+        return bool(requires(session))
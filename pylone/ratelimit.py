@@ -0,0 +1,347 @@
+"""pylone/ratelimit.py
+
+This module provides a RateLimiter that decides in O(1) time whether a
+request may proceed, keeping a fixed-size state per client key.
+
+Two algorithms are available:
+    token_bucket:   A bucket of `limit` tokens refilled at limit/window tokens
+                    per second. Allows short bursts up to `limit`.
+    sliding_window: A sliding window counter that weights the previous fixed
+                    window's count by how much of it still overlaps the
+                    sliding window. Close to an exact sliding log, without
+                    storing timestamps.
+
+Key features:
+    - Three numbers of state per key, whatever the limit.
+    - Keys are spread over lock stripes so threaded servers do not serialize
+      on a single lock.
+    - Idle keys expire after a TTL, and each stripe is an LRU capped at
+      max_keys / stripes entries, so memory is bounded under key floods.
+    - Key functions for limiting per client IP, per session or per route.
+    - SQLiteRateLimiter: the same algorithms with the state in a SQLite file
+      in WAL mode, so several worker processes share one limit.
+
+Usage:
+    Allow 100 requests per minute per client IP:
+    >>> limiter = RateLimiter(limit=100, window=60, algorithm="sliding_window")
+    >>> decision = limiter.hit(key_by_ip(environ))
+    >>> decision.allowed, decision.remaining, decision.retry_after
+    (True, 99, 0.0)
+
+    Share the limit between worker processes on the same host:
+    >>> limiter = SQLiteRateLimiter("/tmp/pylone-ratelimit.db", limit=100, window=60)
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import math
+import time
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict, namedtuple
+from pylone.session import session_id_from_environ
+
+logger = logging.getLogger("pylone.ratelimit")
+
+# allowed: whether the request may proceed; remaining: requests left in the
+# current window; retry_after: seconds until a request would be allowed.
+Decision = namedtuple("Decision", ["allowed", "remaining", "retry_after"])
+
+
+def key_by_ip(environ):
+    """Limit per client address."""
+    return environ.get("REMOTE_ADDR", "")
+
+
+def key_by_session(environ):
+    """Limit per session cookie, falling back to the client address."""
+    session_id = session_id_from_environ(environ)
+    return "session:" + session_id if session_id else environ.get("REMOTE_ADDR", "")
+
+
+def key_by_route(environ):
+    """Limit per client address and path."""
+    return f"{environ.get('REMOTE_ADDR', '')} {environ.get('PATH_INFO', '/')}"
+
+
+KEY_FUNCS = {"ip": key_by_ip, "session": key_by_session, "route": key_by_route}
+
+ALGORITHMS = ("token_bucket", "sliding_window")
+
+
+def token_bucket(state, now, limit, window, cost):
+    """
+    Apply one hit to a token bucket state [tokens, updated].
+
+    Returns:
+        Decision: The outcome; `state` is updated in place.
+    """
+    rate = limit / window
+    tokens = min(limit, state[0] + (now - state[1]) * rate)
+    state[1] = now
+    if tokens >= cost:
+        state[0] = tokens - cost
+        return Decision(True, int(state[0]), 0.0)
+    state[0] = tokens
+    return Decision(False, int(tokens), (cost - tokens) / rate)
+
+
+def sliding_window(state, now, limit, window, cost):
+    """
+    Apply one hit to a sliding window counter state [window_index, current, previous].
+
+    Returns:
+        Decision: The outcome; `state` is updated in place.
+    """
+    index = int(now // window)
+    if index != state[0]:
+        state[2] = state[1] if index == state[0] + 1 else 0
+        state[1] = 0
+        state[0] = index
+    elapsed = now - index * window
+    weight = 1 - elapsed / window
+    estimate = state[2] * weight + state[1]
+    if estimate + cost <= limit:
+        state[1] += cost
+        return Decision(True, int(limit - estimate - cost), 0.0)
+
+    # Time until the previous window's weight has decayed enough, or until
+    # the next window if the current one alone is over the limit.
+    spare = limit - state[1] - cost
+    if state[2] and spare >= 0:
+        retry_after = (weight - spare / state[2]) * window
+    else:
+        retry_after = window - elapsed
+    return Decision(False, max(0, int(limit - estimate)), max(retry_after, 0.0))
+
+
+class RateLimiter:
+    def __init__(self, limit=100, window=60, algorithm="sliding_window", max_keys=100000, idle_ttl=None,
+                 stripes=16, clock=time.monotonic):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limit (int): Requests allowed per window.
+            window (float): Window length in seconds.
+            algorithm (str): "token_bucket" or "sliding_window".
+            max_keys (int): Maximum number of keys tracked; the least recently
+                seen keys are evicted first.
+            idle_ttl (float): Seconds after which an idle key is forgotten.
+                Defaults to two windows, after which both algorithms would
+                treat the key as new anyway.
+            stripes (int): Number of independently locked partitions.
+            clock (callable): Returns the current time in seconds.
+
+        Raises:
+            ValueError: If the algorithm is unknown.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm '{algorithm}' (expected one of {', '.join(ALGORITHMS)})")
+        self.limit = limit
+        self.window = window
+        self.algorithm = algorithm
+        self.apply = token_bucket if algorithm == "token_bucket" else sliding_window
+        self.idle_ttl = idle_ttl if idle_ttl is not None else 2 * window
+        self.stripe_capacity = max(1, math.ceil(max_keys / stripes))
+        self.stripes = [(threading.Lock(), OrderedDict()) for _ in range(stripes)]
+        self.clock = clock
+        self.evicted = 0
+
+    def new_state(self, now):
+        """Return the state of a key that has not been seen recently."""
+        if self.algorithm == "token_bucket":
+            return [float(self.limit), now, now]
+        return [int(now // self.window), 0, 0, now]
+
+    def hit(self, key, cost=1):
+        """
+        Count a request for `key` and decide whether it is allowed.
+
+        Args:
+            key (str): The client key, e.g. from key_by_ip().
+            cost (int): How many requests this one counts as.
+
+        Returns:
+            Decision: allowed, remaining and retry_after.
+        """
+        now = self.clock()
+        lock, entries = self.stripes[hash(key) % len(self.stripes)]
+        with lock:
+            state = entries.get(key)
+            if state is None:
+                self._evict(entries, now)
+                state = entries[key] = self.new_state(now)
+            else:
+                entries.move_to_end(key)
+            state[-1] = now
+            return self.apply(state, now, self.limit, self.window, cost)
+
+    def _evict(self, entries, now):
+        """Drop idle keys from the front of a stripe, then enforce its capacity."""
+        expired_before = now - self.idle_ttl
+        while entries:
+            key, state = next(iter(entries.items()))
+            if state[-1] >= expired_before and len(entries) < self.stripe_capacity:
+                break
+            del entries[key]
+            self.evicted += 1
+
+    def reset(self, key):
+        """Forget the state of `key`."""
+        lock, entries = self.stripes[hash(key) % len(self.stripes)]
+        with lock:
+            entries.pop(key, None)
+
+    def __len__(self):
+        return sum(len(entries) for _, entries in self.stripes)
+
+
+class SQLiteRateLimiter:
+    """A RateLimiter whose state lives in a SQLite file shared by several processes."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rate_limits (
+            key TEXT PRIMARY KEY,
+            a REAL NOT NULL,
+            b REAL NOT NULL,
+            c REAL NOT NULL,
+            seen REAL NOT NULL
+        ) WITHOUT ROWID
+    """
+    # sweep() deletes and orders by `seen`; without this index both are full-table scans
+    INDEX = "CREATE INDEX IF NOT EXISTS rate_limits_seen ON rate_limits (seen)"
+
+    def __init__(self, path, limit=100, window=60, algorithm="sliding_window", max_keys=100000, idle_ttl=None,
+                 sweep_interval=30.0, timeout=1.0, clock=time.time):
+        """
+        Initialize the shared rate limiter.
+
+        Each hit runs in its own BEGIN IMMEDIATE transaction, so the read,
+        the decision and the write are atomic across processes. The database
+        uses WAL mode with synchronous=OFF: limiter state may be lost on a
+        power failure, which only resets the counters.
+
+        Args:
+            path (str): The SQLite file shared by the workers.
+            limit (int): Requests allowed per window.
+            window (float): Window length in seconds.
+            algorithm (str): "token_bucket" or "sliding_window".
+            max_keys (int): Keys kept after a sweep; the least recently seen go first.
+            idle_ttl (float): Seconds after which an idle key is deleted
+                (defaults to two windows).
+            sweep_interval (float): Seconds between sweeps of idle keys, per process.
+            timeout (float): Seconds to wait for the write lock before failing open.
+            clock (callable): Returns the current wall-clock time in seconds.
+                It must agree between processes.
+
+        Raises:
+            ValueError: If the algorithm is unknown.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm '{algorithm}' (expected one of {', '.join(ALGORITHMS)})")
+        self.path = path
+        self.limit = limit
+        self.window = window
+        self.algorithm = algorithm
+        self.apply = token_bucket if algorithm == "token_bucket" else sliding_window
+        self.max_keys = max_keys
+        self.idle_ttl = idle_ttl if idle_ttl is not None else 2 * window
+        self.sweep_interval = sweep_interval
+        self.timeout = timeout
+        self.clock = clock
+        self.local = threading.local()
+        self.next_sweep = 0.0
+        self.sweep_lock = threading.Lock()
+        conn = self.get_connection()
+        conn.execute(self.SCHEMA)
+        conn.execute(self.INDEX)
+
+    def get_connection(self):
+        """Get this thread's connection to the shared database."""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            self.local.conn = conn
+        return conn
+
+    def new_state(self, now):
+        """Return the state of a key that has not been seen recently."""
+        if self.algorithm == "token_bucket":
+            return [float(self.limit), now, 0.0]
+        return [int(now // self.window), 0, 0]
+
+    def hit(self, key, cost=1):
+        """
+        Count a request for `key` and decide whether it is allowed.
+
+        If the database cannot be locked within `timeout`, the request is
+        allowed and the error is logged, so a busy limiter never takes the
+        application down.
+
+        Args:
+            key (str): The client key, e.g. from key_by_ip().
+            cost (int): How many requests this one counts as.
+
+        Returns:
+            Decision: allowed, remaining and retry_after.
+        """
+        now = self.clock()
+        conn = self.get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT a, b, c, seen FROM rate_limits WHERE key = ?", (key,)).fetchone()
+                if row is None or row[3] < now - self.idle_ttl:
+                    state = self.new_state(now)
+                else:
+                    state = list(row[:3])
+                    if self.algorithm == "sliding_window":
+                        state[0] = int(state[0])
+                decision = self.apply(state, now, self.limit, self.window, cost)
+                conn.execute(
+                    "INSERT INTO rate_limits (key, a, b, c, seen) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET a = excluded.a, b = excluded.b, c = excluded.c, seen = excluded.seen",
+                    (key, state[0], state[1], state[2], now),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.warning("Rate limiter: allowing request, shared state unavailable -> %s", e)
+            return Decision(True, self.limit, 0.0)
+
+        if now >= self.next_sweep:
+            self.sweep(now)
+        return decision
+
+    def sweep(self, now=None):
+        """Delete idle keys, then the least recently seen keys beyond max_keys."""
+        if not self.sweep_lock.acquire(blocking=False):
+            return
+        try:
+            now = self.clock() if now is None else now
+            self.next_sweep = now + self.sweep_interval
+            conn = self.get_connection()
+            conn.execute("DELETE FROM rate_limits WHERE seen < ?", (now - self.idle_ttl,))
+            conn.execute(
+                "DELETE FROM rate_limits WHERE key IN "
+                "(SELECT key FROM rate_limits ORDER BY seen DESC LIMIT -1 OFFSET ?)",
+                (self.max_keys,),
+            )
+        except sqlite3.Error as e:
+            logger.warning("Rate limiter: sweep failed -> %s", e)
+        finally:
+            self.sweep_lock.release()
+
+    def reset(self, key):
+        """Forget the state of `key`."""
+        self.get_connection().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    def __len__(self):
+        return self.get_connection().execute("SELECT COUNT(*) FROM rate_limits").fetchone()[0]
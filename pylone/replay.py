@@ -0,0 +1,199 @@
+"""pylone/replay.py
+
+This module replays traffic recorded by the capture middleware
+(demo/middlewares/capture_middleware.py) against a WSGI application,
+either in-process or over HTTP, to benchmark against production-shaped
+traffic.
+
+Key features:
+    - Loading of JSON lines capture files.
+    - In-process replay through the WSGI callable, strictly in capture order
+      on a single thread so that runs are deterministic.
+    - HTTP replay against a running server over keep-alive connections.
+    - Original pacing (optionally scaled) or as-fast-as-possible replay.
+    - Per-client synthetic addresses so rate limiting sees distinct clients.
+    - Latency histogram, status breakdown and status mismatches against the
+      capture.
+
+Usage:
+    Replay a capture in-process as fast as possible:
+    >>> records = load_capture("capture.jsonl")
+    >>> result = Replayer(records, app=app).run()
+    >>> print(result.format_report())
+
+    Replay over HTTP at twice the original speed:
+    >>> result = Replayer(records, target="http://127.0.0.1:8000", speed=2.0).run()
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import json
+import time
+import base64
+import asyncio
+from urllib.parse import urlsplit
+from pylone.bench import build_environ, call_wsgi, status_code
+from pylone.loadgen import LoadResult, RequestSpec, HTTPConnection
+
+
+def load_capture(path):
+    """Load capture records from a JSON lines file, ordered by capture time."""
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    records.sort(key=lambda record: record.get("t", 0))
+    return records
+
+
+def record_body(record):
+    """Return the recorded request body as bytes."""
+    body = record.get("body") or ""
+    if record.get("body_encoding") == "base64":
+        return base64.b64decode(body)
+    return body.encode("utf-8")
+
+
+def record_path(record):
+    """Return the recorded path including its query string."""
+    query = record.get("query")
+    return f"{record['path']}?{query}" if query else record["path"]
+
+
+class ReplayResult(LoadResult):
+    """Outcome of a replay, including responses whose status differs from the capture."""
+
+    def __init__(self, target, connections, speed):
+        super().__init__(target, connections, None)
+        self.speed = speed
+        self.mismatches = 0
+        self.max_lag = 0.0
+
+    def format_report(self):
+        pacing = f"{self.speed:g}x original pacing" if self.speed else "as fast as possible"
+        lines = super().format_report().splitlines()
+        lines[0] = f"Target:       {self.target} ({self.connections} connections, {pacing})"
+        lines.append(f"Mismatches:   {self.mismatches} responses differ in status from the capture")
+        if self.speed:
+            lines.append(f"Max lag:      {self.max_lag * 1000:.1f} ms behind the original schedule")
+        return "\n".join(lines)
+
+
+class Replayer:
+    """Feeds captured requests back through a WSGI application or an HTTP server."""
+
+    def __init__(self, records, app=None, target=None, speed=None, connections=1, timeout=10.0):
+        """
+        Initialize the replayer.
+
+        Args:
+            records (list): Capture records, as returned by load_capture().
+            app (callable): A WSGI application for in-process replay.
+            target (str): Base URL for HTTP replay, e.g. "http://127.0.0.1:8000".
+            speed (float): Pacing multiplier (1.0 = original pacing), or None
+                to replay as fast as possible.
+            connections (int): Concurrent connections for HTTP replay.
+            timeout (float): Per-request timeout in seconds for HTTP replay.
+        """
+        if (app is None) == (target is None):
+            raise ValueError("Replayer needs exactly one of app or target")
+        self.records = records
+        self.app = app
+        self.target = target
+        self.speed = speed
+        self.connections = max(1, connections)
+        self.timeout = timeout
+        self.client_addrs = {}
+
+    def _remote_addr(self, record):
+        client = record.get("client", "")
+        if client not in self.client_addrs:
+            n = len(self.client_addrs) + 1
+            self.client_addrs[client] = f"10.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}"
+        return self.client_addrs[client]
+
+    def _due(self, record, start):
+        return start + record.get("t", 0) / self.speed
+
+    def _check(self, result, record, status):
+        result.statuses[status] += 1
+        if record.get("status") and record["status"] != status:
+            result.mismatches += 1
+
+    def run(self):
+        """Replay every record and return a ReplayResult."""
+        if self.app is not None:
+            return self._run_in_process()
+        return asyncio.run(self._run_http())
+
+    def _run_in_process(self):
+        result = ReplayResult("in-process", 1, self.speed)
+        start = time.perf_counter()
+        for record in self.records:
+            environ = build_environ(
+                record["method"], record_path(record), record.get("headers"),
+                record_body(record), self._remote_addr(record),
+            )
+            started = time.perf_counter()
+            if self.speed:
+                due = self._due(record, start)
+                if due > started:
+                    time.sleep(due - started)
+                    started = due
+                result.max_lag = max(result.max_lag, started - due)
+            status, _, body = call_wsgi(self.app, environ)
+            result.histogram.record((time.perf_counter() - started) * 1e6)
+            result.bytes_received += len(body)
+            self._check(result, record, status_code(status))
+        result.duration = time.perf_counter() - start
+        return result
+
+    async def _run_http(self):
+        url = urlsplit(self.target)
+        host, port = url.hostname or "127.0.0.1", url.port or 80
+        result = ReplayResult(self.target, self.connections, self.speed)
+        queue = asyncio.Queue()
+        for record in self.records:
+            spec = RequestSpec(record["method"], record_path(record), dict(record.get("headers") or {}), record_body(record))
+            # RequestSpec writes its own Host and Connection headers.
+            spec.headers.pop("Host", None)
+            spec.headers.pop("Connection", None)
+            spec.encode(url.netloc)
+            queue.put_nowait((record, spec))
+
+        start = time.perf_counter()
+
+        async def worker():
+            connection = HTTPConnection(host, port)
+            try:
+                while not queue.empty():
+                    record, spec = queue.get_nowait()
+                    started = time.perf_counter()
+                    if self.speed:
+                        due = self._due(record, start)
+                        if due > started:
+                            await asyncio.sleep(due - started)
+                            started = due
+                        result.max_lag = max(result.max_lag, started - due)
+                    try:
+                        status, received = await asyncio.wait_for(connection.request(spec.raw), self.timeout)
+                    except asyncio.TimeoutError:
+                        connection.close()
+                        result.errors["timeout"] += 1
+                        continue
+                    except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+                        connection.close()
+                        result.errors[type(e).__name__] += 1
+                        continue
+                    result.histogram.record((time.perf_counter() - started) * 1e6)
+                    result.bytes_received += received
+                    self._check(result, record, status)
+            finally:
+                connection.close()
+
+        await asyncio.gather(*(worker() for _ in range(self.connections)))
+        result.duration = time.perf_counter() - start
+        return result
@@ -32,6 +32,8 @@ import logging
 import json
 from urllib.parse import parse_qs
 
+logger = logging.getLogger("pylone.request")
+
 class Request:
     def __init__(self, environ):
         self.environ = environ
@@ -42,12 +44,13 @@ class Request:
         self.cookies = self._parse_cookies(environ.get('HTTP_COOKIE', ''))
         self.body = self._parse_body(environ)
         
-        logging.debug(f"Request Path Extracted: {self.path}")
-        logging.debug(f"Request Method: {self.method}")
-        logging.debug(f"Request Headers: {self.headers}")
-        logging.debug(f"Request Cookies: {self.cookies}")
-        logging.debug(f"Request Query Params: {self.query_params}")
-        logging.debug(f"Request Body: {self.body}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request Path Extracted: %s", self.path)
+            logger.debug("Request Method: %s", self.method)
+            logger.debug("Request Headers: %s", self.headers)
+            logger.debug("Request Cookies: %s", self.cookies)
+            logger.debug("Request Query Params: %s", self.query_params)
+            logger.debug("Request Body: %s", self.body)
     
     def _parse_query_params(self, query_string):
         """Parse query parameters from the URL."""
@@ -71,7 +74,7 @@ class Request:
                     key, value = cookie.strip().split('=', 1)
                     cookies[key] = value
                 except ValueError:
-                    logging.warning(f"Malformed cookie ignored: {cookie}")
+                    logger.warning("Malformed cookie ignored: %s", cookie)
         return cookies
     
     def _parse_body(self, environ):
@@ -88,7 +91,7 @@ class Request:
             # Add size limit to prevent DoS attacks
             max_size = 10 * 1024 * 1024  # 10MB limit
             if request_body_size > max_size:
-                logging.warning(f"Request body size ({request_body_size} bytes) exceeds limit")
+                logger.warning("Request body size (%s bytes) exceeds limit", request_body_size)
                 return body
                 
             if request_body_size > 0:
@@ -99,11 +102,11 @@ class Request:
                         try:
                             body = json.loads(request_body)
                         except json.JSONDecodeError as e:
-                            logging.error(f"Failed to parse JSON body: {e}")
+                            logger.error("Failed to parse JSON body: %s", e)
                     elif 'application/x-www-form-urlencoded' in content_type:
                         body = parse_qs(request_body)
                 except UnicodeDecodeError as e:
-                    logging.error(f"Failed to decode request body: {e}")
+                    logger.error("Failed to decode request body: %s", e)
         
         return body
     
@@ -11,7 +11,8 @@ Key features:
     - Cookie handling and inclusion in headers.
     - JSON serialization for dictionary bodies.
     - String encoding for HTML or plain text bodies.
-    - Support for iterable byte bodies.
+    - Support for iterable byte bodies; iterators (e.g. TemplateEngine.stream())
+      are passed through unconsumed, so the body is streamed.
     - Logging of response details.
     - Conversion to WSGI-compatible (status, headers, body) tuple.
 
@@ -36,8 +37,7 @@ import logging
 import json
 from http import cookies
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger("pylone.response")
 
 class Response:
     STATUS_MESSAGES = {
@@ -63,7 +63,8 @@ class Response:
         """
         Initialize a Response object.
         Args:
-            body: The response body (str, dict, or iterable of bytes).
+            body: The response body (str, dict, or iterable of bytes). An
+                iterator or generator of bytes is streamed as it is produced.
             status: The HTTP status code (int or str).
             headers: A dictionary or list of tuples representing HTTP headers.
             cookies: A dictionary of cookies to set in the response.
@@ -175,10 +176,11 @@ class Response:
             cookie_str = self._format_cookie(name, value)
             headers.append(("Set-Cookie", cookie_str))
         
-        # Log response details
-        logging.debug(f"Response status: {self.status}")
-        logging.debug(f"Response headers: {headers}")
-        logging.debug(f"Response cookies: {self.cookies}")
+        # Log response details (headers and cookies only when debugging)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response status: %s", self.status)
+            logger.debug("Response headers: %s", headers)
+            logger.debug("Response cookies: %s", self.cookies)
         
         # Handle body encoding
         try:
@@ -193,6 +195,10 @@ class Response:
             elif isinstance(self.body, bytes):
                 # Already bytes
                 body = [self.body]
+            elif hasattr(self.body, '__next__'):
+                # Streamed body (a generator or file wrapper yielding bytes): pass it through
+                # unconsumed, keeping its close() method
+                body = self.body
             elif hasattr(self.body, '__iter__'):
                 # Assume body is already an iterable of bytes or strings
                 body = [chunk.encode('utf-8') if isinstance(chunk, str) else chunk for chunk in self.body]
@@ -200,7 +206,7 @@ class Response:
                 # Convert to string and encode
                 body = [str(self.body).encode('utf-8')]
         except (TypeError, ValueError) as e:
-            logging.error(f"Error encoding response body: {e}", exc_info=True)
+            logger.error("Error encoding response body: %s", e, exc_info=True)
             body = [b"Internal Server Error"]
             
             # Update headers and status
@@ -0,0 +1,253 @@
+"""pylone/response_cache.py
+
+This module provides a ResponseCache that stores finished responses for
+pages that are the same for every anonymous visitor, so they are rendered
+once per TTL instead of on every request.
+
+Entries are keyed on the request method, path, normalized query string
+(parameters sorted) and the values of selected request headers (the
+route's "vary" list). Only 200 responses without Set-Cookie or a
+"private"/"no-store" Cache-Control are stored.
+
+Key features:
+    - TTL per entry and LRU eviction bounded by entry count and total body size.
+    - Single-flight filling: concurrent misses for the same key are coalesced,
+      so only one request renders while the others wait for its result.
+    - Invalidation by path, or of everything.
+    - An optional SharedCache tier, so a response rendered by one worker
+      process is served by all of them, and invalidations reach them all.
+    - Hit, miss, store, coalesced and eviction counters.
+
+Usage:
+    Routes opt in with Router.add_route metadata:
+    >>> router.add_route("/demo", controller.demo, public=True, cache=60)
+    >>> router.add_route("/docs", controller.docs, public=True, cache={"ttl": 300, "vary": ["Accept-Language"]})
+
+    Or use the cache directly:
+    >>> cache = ResponseCache(max_entries=1024)
+    >>> response = cache.fetch(cache_key(environ), 60, render)
+
+    Share responses between worker processes:
+    >>> cache = ResponseCache(shared=SharedCache("/dev/shm/pylone-cache"))
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import time
+import marshal
+import threading
+from urllib.parse import parse_qsl, urlencode
+from collections import OrderedDict, namedtuple
+from pylone.singleflight import SingleFlight
+from pylone.shared_cache import name_hash
+
+# A finished response: status line, header list and the complete body as bytes
+CachedResponse = namedtuple("CachedResponse", ["status", "headers", "body"])
+
+
+def vary_keys(headers):
+    """Return the WSGI environ keys for a list of request header names."""
+    return tuple("HTTP_" + name.upper().replace("-", "_") for name in headers)
+
+
+def cache_key(environ, vary=()):
+    """
+    Return the cache key for a request.
+
+    Args:
+        environ (dict): The WSGI environment.
+        vary (tuple): Environ keys (see vary_keys()) whose values are part of the key.
+    """
+    query = environ.get("QUERY_STRING", "")
+    if query:
+        query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    return (environ.get("REQUEST_METHOD", "GET"), environ.get("PATH_INFO", "/"), query,
+            tuple(environ.get(name, "") for name in vary))
+
+
+# SharedCache tag carried by every response, so invalidate() can drop them all
+# without touching the other caches sharing the file
+RESPONSE_TAG = "response:*"
+
+
+def path_tag(path):
+    """Return the SharedCache tag carried by the responses for `path`."""
+    return "path:" + path
+
+
+def is_cacheable(response):
+    """Return True if a CachedResponse may be shared between visitors."""
+    if not response.status.startswith("200"):
+        return False
+    for name, value in response.headers:
+        name = name.lower()
+        if name == "set-cookie":
+            return False
+        if name == "cache-control" and ("private" in value or "no-store" in value):
+            return False
+    return True
+
+
+def _shared_key(key):
+    """Return the SharedCache key for a cache_key()."""
+    method, path, query, vary = key
+    return "\x1f".join(("response", method, path, query) + vary)
+
+
+class ResponseCache:
+    def __init__(self, max_entries=1024, max_bytes=32 << 20, wait_timeout=10.0, clock=time.monotonic, shared=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Responses kept; the least recently used go first.
+            max_bytes (int): Total size of the stored bodies.
+            wait_timeout (float): Seconds a coalesced request waits for the
+                rendering request before rendering the page itself.
+            clock (callable): Returns the current time in seconds.
+            shared (SharedCache): A second tier shared with the other worker
+                processes, checked on a local miss (see use_shared()).
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> (CachedResponse, expires)
+        self.size = 0
+        self.lock = threading.Lock()
+        self.flight = SingleFlight(wait_timeout)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evicted = 0
+        self.shared_hits = 0
+        self.use_shared(shared)
+
+    def use_shared(self, shared):
+        """Attach a SharedCache as the second tier, or detach it with None."""
+        with self.lock:
+            self.shared = shared
+            self.seen = shared.generation() if shared is not None else 0
+
+    def get(self, key):
+        """Return the fresh CachedResponse for `key`, or None."""
+        with self.lock:
+            if self.shared is not None:
+                self._sync()
+            entry = self.entries.get(key)
+            if entry is not None:
+                if self.clock() < entry[1]:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                self._remove(key)
+            self.misses += 1
+        return self._get_shared(key) if self.shared is not None else None
+
+    def _get_shared(self, key):
+        """Look up a local miss in the shared tier, keeping a hit locally until it expires."""
+        shared = self.shared
+        found = shared.get(_shared_key(key))
+        if found is None:
+            return None
+        data, expires = found
+        response = CachedResponse(*marshal.loads(data))
+        self._store(key, response, expires - shared.clock())
+        self.shared_hits += 1
+        return response
+
+    def set(self, key, response, ttl):
+        """Store a CachedResponse for `ttl` seconds, in the shared tier too if there is one."""
+        if len(response.body) > self.max_bytes:
+            return
+        if self.shared is not None:
+            self.shared.set(_shared_key(key), marshal.dumps(tuple(response)), ttl,
+                            (RESPONSE_TAG, path_tag(key[1])))
+        self._store(key, response, ttl)
+
+    def _store(self, key, response, ttl):
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (response, self.clock() + ttl)
+            self.size += len(response.body)
+            self.stores += 1
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+                self.evicted += 1
+
+    def _remove(self, key):
+        """Drop an entry. The lock must be held."""
+        response, _ = self.entries.pop(key)
+        self.size -= len(response.body)
+
+    def fetch(self, key, ttl, render):
+        """
+        Return the cached response for `key`, rendering it on a miss.
+
+        Concurrent misses for the same key share one call to `render`.
+
+        Args:
+            key: From cache_key().
+            ttl (float): Seconds to keep a newly rendered response.
+            render (callable): Returns a CachedResponse, which is stored if
+                is_cacheable(), or any other response, which is passed
+                through uncached.
+        """
+        response = self.get(key)
+        if response is not None:
+            return response
+        return self.flight.do(key, lambda: self._fill(key, ttl, render))
+
+    def _fill(self, key, ttl, render):
+        with self.lock:
+            # Filled by a request that finished rendering just before this one started
+            entry = self.entries.get(key)
+            if entry is not None and self.clock() < entry[1]:
+                return entry[0]
+        response = render()
+        if isinstance(response, CachedResponse) and is_cacheable(response):
+            self.set(key, response, ttl)
+        return response
+
+    def invalidate(self, path=None):
+        """
+        Drop the entries for `path` (all methods, queries and variants), or every entry.
+
+        With a shared tier, the entries are dropped there and in the other
+        workers' local caches too.
+        """
+        if self.shared is not None:
+            if path is None:
+                self.shared.invalidate_tag(RESPONSE_TAG)
+            else:
+                self.shared.invalidate_tag(path_tag(path))
+        with self.lock:
+            keys = [key for key in self.entries if path is None or key[1] == path]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def _sync(self):
+        """Apply the shared tier's invalidations since the last call. The lock must be held."""
+        if self.shared.generation() == self.seen:
+            return
+        self.seen, hashes = self.shared.changes_since(self.seen)
+        if hashes is None or name_hash(RESPONSE_TAG) in hashes:
+            keys = list(self.entries)
+        else:
+            keys = [key for key in self.entries if name_hash(path_tag(key[1])) in hashes]
+        for key in keys:
+            self._remove(key)
+
+    def stats(self):
+        """Return the cache's counters, and the shared tier's if there is one."""
+        stats = {"hits": self.hits, "misses": self.misses, "stores": self.stores, "evicted": self.evicted,
+                 "coalesced": self.flight.coalesced, "entries": len(self.entries), "bytes": self.size}
+        if self.shared is not None:
+            stats["shared_hits"] = self.shared_hits
+            stats["shared"] = self.shared.stats()
+        return stats
+
+    def __len__(self):
+        return len(self.entries)
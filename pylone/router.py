@@ -8,8 +8,13 @@ and method-based routing.
 Key features:
     - Route registration with dynamic parameter handling using regular expressions.
     - Method-based routing (e.g., GET, POST).
-    - Static file serving from a specified directory.
-    - MIME type detection for static files.
+    - Per-route metadata, such as whether a route is public.
+    - Opt-in full-page caching of anonymous GET responses with
+      add_route(..., cache=ttl) (see pylone.response_cache).
+    - Opt-in coalescing of identical concurrent GETs with
+      add_route(..., coalesce=True): one handler call serves them all
+      (see pylone.singleflight).
+    - Static file serving through a mounted pylone.static.StaticFiles engine.
     - Error handling and logging.
 
 Usage:
@@ -26,7 +31,8 @@ Usage:
     >>> response = router.resolve(request)
 
     Serve static files:
-    Place static files in the 'demo/static' directory, and access them via '/static/'.
+    >>> router.mount_static(StaticFiles("demo/static"))
+    Files in 'demo/static' are then served under '/static/'.
 
 Example Static File URLs
 /static/css/style.css → Serves demo/static/css/style.css
@@ -39,39 +45,58 @@ Example Static File URLs
 """
 
 import re
-import os
 import logging
 from pylone.response import Response
+from pylone.response_cache import ResponseCache, CachedResponse, cache_key, vary_keys, is_cacheable
+from pylone.singleflight import SingleFlight
+from pylone.session import session_id_from_environ
+
+logger = logging.getLogger("pylone.router")
+
+# Seconds a coalesced request waits for the leading request before calling the handler itself
+COALESCE_TIMEOUT = 10.0
+
+
+def request_key(request):
+    """
+    Return the default coalescing key: requests are identical when they have
+    the same session, method, path and normalized query string.
+    """
+    return session_id_from_environ(request.environ), cache_key(request.environ)
+
+
+def materialize(response):
+    """Return a handler's Response as a CachedResponse with the whole body read, or any other result as is."""
+    if not hasattr(response, "to_wsgi"):
+        return response
+    status, headers, body = response.to_wsgi()
+    return CachedResponse(status, headers, b"".join(body))
 
-logging.basicConfig(level=logging.DEBUG)
 
 class Router:
-    STATIC_DIR = "demo/static"  # Path to the static directory
-
-    MIME_TYPES = {
-        ".html": "text/html",
-        ".css": "text/css",
-        ".js": "application/javascript",
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".gif": "image/gif",
-        ".svg": "image/svg+xml",
-        ".ico": "image/x-icon",
-        ".woff": "font/woff",
-        ".woff2": "font/woff2",
-        ".ttf": "font/ttf",
-        ".otf": "font/otf",
-        ".eot": "application/vnd.ms-fontobject",
-        ".json": "application/json",
-        ".txt": "text/plain"
-    }
-
-    def __init__(self):
-        """Initialize the router with an empty routes dictionary."""
+    def __init__(self, static_files=None, response_cache=None, flight=None):
+        """
+        Initialize the router with an empty routes dictionary.
+
+        Args:
+            static_files (StaticFiles): The engine serving requests under its
+                prefix (see pylone.static.StaticFiles), or None.
+            response_cache (ResponseCache): Stores the responses of routes
+                registered with cache=... (defaults to a new ResponseCache).
+            flight (SingleFlight): Coalesces the requests to routes
+                registered with coalesce=... (defaults to a new SingleFlight
+                with COALESCE_TIMEOUT).
+        """
         self.routes = {}
+        self.static_files = static_files
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+        self.flight = flight if flight is not None else SingleFlight(COALESCE_TIMEOUT)
 
-    def add_route(self, path, handler, methods=["GET"]):
+    def mount_static(self, static_files):
+        """Serve requests under `static_files.prefix` with a pylone.static.StaticFiles engine."""
+        self.static_files = static_files
+
+    def add_route(self, path, handler, methods=["GET"], public=False, **meta):
         """
         Register a route with a handler.
 
@@ -79,11 +104,30 @@ class Router:
             path (str): The URL path for the route.
             handler (function): The function to handle the request.
             methods (list): List of HTTP methods allowed for the route (e.g., ["GET", "POST"]).
+            public (bool): Whether the route is reachable without a session
+                (see pylone.policy.AccessPolicy.from_router).
+            **meta: Extra route metadata, e.g. requires=... for a custom
+                access requirement, or cache=... to cache GET responses for
+                visitors without a session: a TTL in seconds, or a dict
+                {"ttl": seconds, "vary": [request header names]}, or
+                coalesce=... to run the handler once for identical GETs that
+                arrive while it is running and give them all its response:
+                True to key requests with request_key(), or a function
+                taking the request and returning a hashable key.
         """
         # Convert dynamic route parameters to a regex pattern
         pattern = re.sub(r"<(\w+:)?(\w+)>", r"(?P<\2>[^/]+)", path)
-        self.routes[path] = {"pattern": re.compile(f"^{pattern}$"), "handler": handler, "methods": methods}
-        logging.debug(f"ROUTER Route added-> {path} with methods {methods}")
+        cache = meta.get("cache")
+        if cache is not None and not isinstance(cache, dict):
+            cache = {"ttl": cache}
+        coalesce = meta.get("coalesce")
+        if coalesce is True:
+            coalesce = request_key
+        self.routes[path] = {"pattern": re.compile(f"^{pattern}$"), "handler": handler, "methods": methods,
+                             "public": public, "meta": meta, "path": path,
+                             "cache": (cache["ttl"], vary_keys(cache.get("vary", ()))) if cache else None,
+                             "coalesce": coalesce or None}
+        logger.debug("ROUTER Route added-> %s with methods %s", path, methods)
 
     def resolve(self, request):
         """
@@ -97,61 +141,90 @@ class Router:
         """
         path = request.path
         method = request.method
-        logging.debug(f"ROUTER Resolving request-> {method} {path}")
+        logger.debug("ROUTER Resolving request-> %s %s", method, path)
 
         # Serve static files if the request is for /static/*
-        if path.startswith("/static/"):
-            return self.serve_static_file(path)
+        if self.static_files is not None and path.startswith(self.static_files.prefix):
+            return self.serve_static_file(request)
 
         # Check if the path matches any route
         for route_path, route in self.routes.items():
             match = route["pattern"].match(path)
             if match:
-                logging.debug(f"ROUTER Route found -> {route_path}")
+                logger.debug("ROUTER Route found -> %s", route_path)
                 # Check if the request method is allowed for the route
                 if method in route["methods"]:
-                    logging.debug(f"Method {method} allowed for {route_path}")
-                    handler = route["handler"]
+                    logger.debug("Method %s allowed for %s", method, route_path)
                     # Pass dynamic parameters to the handler
                     kwargs = match.groupdict()
-                    response = handler(request, **kwargs)  # Call the handler
+                    if route["cache"] is not None and method == "GET":
+                        response = self.cached_response(route, request, kwargs)
+                    else:
+                        response = self.call_handler(route, request, kwargs)
                     if response is None:
-                        logging.error(f"ROUTER Handler for {route_path} returned None")
+                        logger.error("ROUTER Handler for %s returned None", route_path)
                         return Response("ROUTER 500 Internal Server Error", status=500)
                     return response  # Return the response
                 else:
                     # Method not allowed
-                    logging.warning(f"ROUTER Method {method} not allowed for {route_path}")
+                    logger.warning("ROUTER Method %s not allowed for %s", method, route_path)
                     return Response("ROUTER 405 Method Not Allowed", status=405)
 
         # Route not found
-        logging.warning(f"ROUTER 404 Not Found: {method} {path}")
+        logger.warning("ROUTER 404 Not Found: %s %s", method, path)
         return Response("ROUTER 404 Not Found", status=404)
 
-    def serve_static_file(self, path):
+    def cached_response(self, route, request, kwargs):
+        """
+        Serve a GET for a route registered with cache=..., rendering it once
+        per TTL however many requests arrive at the same time.
+
+        Requests carrying a session cookie always reach the handler, since
+        the page may be personalised.
+        """
+        if session_id_from_environ(request.environ):
+            return self.call_handler(route, request, kwargs)
+        ttl, vary = route["cache"]
+        result = self.response_cache.fetch(cache_key(request.environ, vary), ttl,
+                                           lambda: materialize(route["handler"](request, **kwargs)))
+        if isinstance(result, CachedResponse):
+            return Response(result.body, status=result.status, headers=result.headers)
+        return result
+
+    def call_handler(self, route, request, kwargs):
+        """
+        Call a route's handler. For a GET to a route registered with
+        coalesce=..., requests with the same key that arrive while the
+        handler runs wait for it and share its response instead of calling
+        it again.
+
+        Only responses that could be shared by a cache are shared (see
+        is_cacheable(): a 200 without Set-Cookie or a private/no-store
+        Cache-Control); for any other result, each waiting request calls the
+        handler itself.
+        """
+        handler = route["handler"]
+        if route["coalesce"] is None or request.method != "GET":
+            return handler(request, **kwargs)
+        key = (route["path"], route["coalesce"](request))
+        caller = object()
+        leader, result = self.flight.do(key, lambda: (caller, materialize(handler(request, **kwargs))))
+        if leader is not caller and not (isinstance(result, CachedResponse) and is_cacheable(result)):
+            return handler(request, **kwargs)
+        if isinstance(result, CachedResponse):
+            # Each request gets its own Response over the shared body
+            return Response(result.body, status=result.status, headers=list(result.headers))
+        return result
+
+    def serve_static_file(self, request):
         """
-        Serve a static file from the static directory.
+        Serve a static file through the mounted StaticFiles engine.
 
         Args:
-            path (str): The request path starting with /static/
+            request (Request): A request whose path starts with the static prefix.
 
         Returns:
-            Response: A response containing the file content or a 404 error.
+            Response: The file, a 304, or an error response.
         """
-        file_path = os.path.join(self.STATIC_DIR, path.lstrip("/"))  # Remove leading "/"
-
-        if os.path.exists(file_path) and os.path.isfile(file_path):
-            _, ext = os.path.splitext(file_path)
-            content_type = self.MIME_TYPES.get(ext, "application/octet-stream")
-
-            try:
-                with open(file_path, "rb") as file:
-                    content = file.read()
-                logging.debug(f"STATIC FILE SERVED: {file_path}")
-                return Response(content, status=200, content_type=content_type)
-            except Exception as e:
-                logging.error(f"STATIC FILE ERROR: Unable to read {file_path}: {e}")
-                return Response("ROUTER 500 Internal Server Error", status=500)
-
-        logging.warning(f"STATIC FILE NOT FOUND: {file_path}")
-        return Response("ROUTER 404 Not Found", status=404)
\ No newline at end of file
+        status, headers, body = self.static_files.serve(request.path, request.environ)
+        return Response(body, status=status, headers=headers)
@@ -3,58 +3,623 @@
     validating, and deleting sessions, as well as handling CSRF tokens.
     Sessions are stored in memory and are set to expire after 1 hour.
 
+    Key features:
+        - Expired sessions are removed by an incremental sweep over an
+          expiry heap, run by a background thread and opportunistically on
+          session creation, so abandoned sessions do not accumulate.
+        - Thread safe: sessions are sharded by ID over independently locked
+          partitions, so lookups of different sessions do not contend.
+        - A hard cap on the number of sessions; the least recently used
+          session (of its shard) is evicted when a new one would exceed it.
+        - Counters for live, created, expired, evicted and deleted sessions.
+        - SignedCookieSession: a stateless alternative that keeps the session
+          in an HMAC-signed (optionally encrypted) cookie, so it needs no
+          server-side lookup and works across any number of processes.
+        - SQLiteSession: sessions in a SQLite file in WAL mode shared by the
+          workers on a host, with a short-lived per-process read cache and
+          batched activity updates, for revocable multi-process sessions.
+        - session_manager delegates to the backend chosen at startup.
+
+    Usage:
+        >>> sessions = Session(ttl=3600, max_sessions=100000)
+        >>> session_id = sessions.create_session(user_id=42)
+        >>> sessions.get_session(session_id)["user_id"]
+        42
+        >>> sessions.stats()["live"]
+        1
+
+        Switch the global manager to signed cookies, rotating from an old key:
+        >>> session_manager.use(SignedCookieSession([new_key, old_key]))
+
     Date Created: February 26, 2025
     Author: alex@agilecreativelabs.ca
     Copyright: © 2025 Agile Creative Labs Inc.
 """
-import uuid
-from datetime import datetime, timedelta
 import os
+import hmac
+import json
+import time
+import heapq
+import base64
+import atexit
+import hashlib
+import logging
+import sqlite3
 import binascii
+import threading
+from datetime import datetime
+from collections import OrderedDict
+from pylone.settings import DEFAULT_SECRET_KEY
+
+logger = logging.getLogger("pylone.session")
+
+
+class SessionShard:
+    """One partition of a Session store, with its own lock, LRU order, expiry heap and counters."""
+
+    __slots__ = ("lock", "sessions", "expiry_heap", "created", "expired", "evicted", "deleted")
 
-class Session:
     def __init__(self):
-        self.sessions = {}  # Store sessions in memory
+        self.lock = threading.Lock()
+        self.sessions = OrderedDict()  # Least recently used first
+        self.expiry_heap = []          # (expires, session_id); entries of removed sessions are skipped
+        self.created = 0
+        self.expired = 0
+        self.evicted = 0
+        self.deleted = 0
+
+    def sweep(self, now, limit):
+        """Pop up to `limit` expired sessions off the expiry heap. The lock must be held."""
+        heap, sessions = self.expiry_heap, self.sessions
+        removed = 0
+        while heap and heap[0][0] <= now and removed < limit:
+            expires, session_id = heapq.heappop(heap)
+            session = sessions.get(session_id)
+            if session is not None and session["expires"] == expires:
+                del sessions[session_id]
+                self.expired += 1
+                removed += 1
+        return removed
+
+    def compact(self):
+        """Rebuild the expiry heap without the entries of deleted or evicted sessions. The lock must be held."""
+        self.expiry_heap = [(session["expires"], session_id) for session_id, session in self.sessions.items()]
+        heapq.heapify(self.expiry_heap)
+
+
+class Session:
+    def __init__(self, ttl=3600, max_sessions=100000, sweep_interval=1.0, sweep_batch=1000, shards=16,
+                 clock=time.time):
+        """
+        Initialize the session store.
+
+        Sessions are spread over `shards` partitions by session ID, each with
+        its own lock, so requests for different sessions rarely contend.
+
+        Args:
+            ttl (float): Seconds a session lives after it is created.
+            max_sessions (int): Maximum number of sessions kept, across all
+                shards. At the cap, a new session evicts the least recently
+                used session of its own shard (of another shard if its own is
+                empty). Concurrent creates may briefly overshoot by the number
+                of threads creating at once; the next create corrects it.
+            sweep_interval (float): Seconds between background sweeps of
+                expired sessions; None disables the sweeper thread.
+            sweep_batch (int): Maximum sessions removed per lock acquisition,
+                so a large sweep never blocks requests for long.
+            shards (int): Number of independently locked partitions.
+            clock (callable): Returns the current wall-clock time in seconds.
+        """
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.sweep_interval = sweep_interval
+        self.sweep_batch = sweep_batch
+        self.clock = clock
+        self.shards = [SessionShard() for _ in range(shards)]
+        self.next_victim = 0  # Shard index tried first when a session must be evicted from another shard
+        self.sweeper = None
+        self.sweeper_lock = threading.Lock()
 
-    def create_session(self, user_id):
+    def shard(self, session_id):
+        """Return the shard holding `session_id`."""
+        return self.shards[hash(session_id) % len(self.shards)]
+
+    def create_session(self, user_id, ttl=None):
         """Create a new session for a user."""
         session_id = str(binascii.hexlify(os.urandom(16)).decode('utf-8'))  # Generate a unique session ID
         csrf_token = str(binascii.hexlify(os.urandom(16)).decode('utf-8'))  # Generate a CSRF token
-        expiry = datetime.now() + timedelta(hours=1)  # Set session expiry to 1 hour
-        self.sessions[session_id] = {
+        now = self.clock()
+        expires = now + (self.ttl if ttl is None else ttl)  # Absolute expiry time
+        session = {
             "user_id": user_id,
             "csrf_token": csrf_token,
-            "expiry": expiry
+            "expiry": datetime.fromtimestamp(expires),
+            "expires": expires,
         }
+        shard = self.shard(session_id)
+        with shard.lock:
+            shard.sweep(now, 8)  # Keep up with expiry even without the sweeper thread
+            sessions = shard.sessions
+            if sessions and len(self) >= self.max_sessions:
+                sessions.popitem(last=False)
+                shard.evicted += 1
+            sessions[session_id] = session
+            heapq.heappush(shard.expiry_heap, (expires, session_id))
+            shard.created += 1
+            if len(shard.expiry_heap) > 2 * len(sessions) + 1024:
+                shard.compact()
+        while len(self) > self.max_sessions and self._evict_one():
+            pass
+        if self.sweeper is None and self.sweep_interval:
+            self._start_sweeper()
         return session_id
 
+    def _evict_one(self):
+        """
+        Evict the least recently used session of the next non-empty shard,
+        taking one shard lock at a time.
+
+        Returns:
+            bool: False if every shard was empty.
+        """
+        count = len(self.shards)
+        start = self.next_victim
+        for i in range(count):
+            shard = self.shards[(start + i) % count]
+            with shard.lock:
+                if shard.sessions:
+                    shard.sessions.popitem(last=False)
+                    shard.evicted += 1
+                    self.next_victim = (start + i + 1) % count
+                    return True
+        return False
+
     def get_csrf_token(self, session_id):
         """Retrieve the CSRF token for a session."""
-        if session_id in self.sessions:
-            return self.sessions[session_id]["csrf_token"]
-        return None
+        session = self.get_session(session_id)
+        return session["csrf_token"] if session is not None else None
 
     def validate_csrf_token(self, session_id, csrf_token):
         """Validate the CSRF token for a session."""
-        if session_id in self.sessions:
-            return self.sessions[session_id]["csrf_token"] == csrf_token
-        return False
+        session = self.get_session(session_id)
+        return session is not None and session["csrf_token"] == csrf_token
 
     def get_session(self, session_id):
         """Retrieve session data by session ID."""
-        if session_id in self.sessions:
-            session = self.sessions[session_id]
-            if datetime.now() < session["expiry"]:  # Check if session is still valid
+        shard = self.shard(session_id)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
+            if session is None:
+                return None
+            if self.clock() < session["expires"]:  # Check if session is still valid
+                shard.sessions.move_to_end(session_id)
                 return session
-            else:
-                del self.sessions[session_id]  # Delete expired session
+            del shard.sessions[session_id]  # Delete expired session
+            shard.expired += 1
         return None
 
     def delete_session(self, session_id):
         """Delete a session by session ID."""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        shard = self.shard(session_id)
+        with shard.lock:
+            if shard.sessions.pop(session_id, None) is not None:
+                shard.deleted += 1
+
+    def sweep(self, now=None):
+        """
+        Remove every expired session, `sweep_batch` sessions per lock acquisition.
+
+        Returns:
+            int: The number of sessions removed.
+        """
+        now = self.clock() if now is None else now
+        removed = 0
+        for shard in self.shards:
+            while True:
+                with shard.lock:
+                    batch = shard.sweep(now, self.sweep_batch)
+                removed += batch
+                if batch < self.sweep_batch:
+                    break
+        return removed
+
+    def _start_sweeper(self):
+        with self.sweeper_lock:
+            if self.sweeper is not None:
+                return
+            self.sweeper = threading.Thread(target=self._run_sweeper, name="pylone-session-sweeper", daemon=True)
+        self.sweeper.start()
+
+    def _run_sweeper(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                removed = self.sweep()
+                if removed:
+                    logger.debug("Session sweep removed %d expired sessions", removed)
+            except Exception as e:
+                logger.error("Session sweep failed -> %s", e)
+
+    def stats(self):
+        """Return the store's counters, summed over the shards."""
+        totals = {"live": 0, "created": 0, "expired": 0, "evicted": 0, "deleted": 0}
+        for shard in self.shards:
+            totals["live"] += len(shard.sessions)
+            totals["created"] += shard.created
+            totals["expired"] += shard.expired
+            totals["evicted"] += shard.evicted
+            totals["deleted"] += shard.deleted
+        return totals
+
+    def __len__(self):
+        return sum(len(shard.sessions) for shard in self.shards)
+
+    def __contains__(self, session_id):
+        return session_id in self.shard(session_id).sessions
+
+def _b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data):
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+# Shortest secret key accepted for signing session cookies, in bytes
+MIN_SECRET_KEY_LENGTH = 32
+
+
+class SignedCookieSession:
+    """
+    A stateless session backend: the session ID *is* the session, as a
+    signed (and optionally encrypted) token, so any process holding the
+    secret key can validate it without a lookup.
+    """
+
+    def __init__(self, secret_keys, ttl=3600, salt="pylone.session", encrypt=False):
+        """
+        Initialize the backend.
+
+        Args:
+            secret_keys: The secret key, or a list of keys. The first key
+                signs new sessions; all of them are accepted, so a key can be
+                rotated by putting the new one first and dropping the old one
+                once its sessions have expired.
+            ttl (float): Seconds a session lives after it is created.
+            salt (str): Separates these signatures from other uses of the keys.
+            encrypt (bool): Also encrypt the token (with Fernet), hiding the
+                user ID from the client. Requires the cryptography package.
+
+        Raises:
+            ValueError: If no secret key is given, or a key is the public
+                default or shorter than MIN_SECRET_KEY_LENGTH bytes; anyone
+                knowing or guessing a key could forge a session for any user.
+            ImportError: If encrypt is set and cryptography is not installed.
+        """
+        keys = [secret_keys] if isinstance(secret_keys, (str, bytes)) else list(secret_keys)
+        keys = [key.encode("utf-8") if isinstance(key, str) else key for key in keys if key]
+        if not keys:
+            raise ValueError("SignedCookieSession needs at least one secret key")
+        for key in keys:
+            if key == DEFAULT_SECRET_KEY.encode("utf-8"):
+                raise ValueError("Refusing to sign sessions with the default secret key; set SECRET_KEY to a random "
+                                 f"value of at least {MIN_SECRET_KEY_LENGTH} bytes")
+            if len(key) < MIN_SECRET_KEY_LENGTH:
+                raise ValueError(f"Refusing to sign sessions with a {len(key)}-byte secret key (SECRET_KEY or "
+                                 f"SECRET_KEY_FALLBACKS); use at least {MIN_SECRET_KEY_LENGTH} random bytes")
+        self.ttl = ttl
+        salt = salt.encode("utf-8")
+        self.signing_keys = [hashlib.sha256(salt + b"signer" + key).digest() for key in keys]
+        self.fernet = None
+        if encrypt:
+            try:
+                from cryptography.fernet import Fernet, MultiFernet
+            except ImportError as e:
+                raise ImportError("Encrypted cookie sessions require the 'cryptography' package") from e
+            self.fernet = MultiFernet([Fernet(base64.urlsafe_b64encode(hashlib.sha256(salt + b"cipher" + key).digest()))
+                                       for key in keys])
+        self.invalid = 0
+
+    def create_session(self, user_id, ttl=None):
+        """Create a new session for a user and return its cookie value."""
+        csrf_token = str(binascii.hexlify(os.urandom(16)).decode('utf-8'))  # Generate a CSRF token
+        expires = int(time.time() + (self.ttl if ttl is None else ttl))
+        payload = json.dumps([user_id, csrf_token, expires], separators=(",", ":")).encode("utf-8")
+        if self.fernet is not None:
+            return self.fernet.encrypt(payload).rstrip(b"=").decode("ascii")
+        payload = _b64encode(payload)
+        signature = _b64encode(hmac.new(self.signing_keys[0], payload, hashlib.sha256).digest())
+        return (payload + b"." + signature).decode("ascii")
+
+    def get_session(self, session_id):
+        """Verify a session cookie value and return its data, or None."""
+        if not session_id:
+            return None
+        try:
+            token = session_id.encode("ascii")
+            if self.fernet is not None:
+                payload = self._decrypt(token)
+            else:
+                payload = self._verify(token)
+            if payload is None:
+                self.invalid += 1
+                return None
+            user_id, csrf_token, expires = json.loads(payload)
+        except (UnicodeError, ValueError, TypeError):
+            self.invalid += 1
+            return None
+        if time.time() >= expires:
+            return None
+        return {"user_id": user_id, "csrf_token": csrf_token,
+                "expiry": datetime.fromtimestamp(expires), "expires": expires}
+
+    def _verify(self, token):
+        payload, _, signature = token.rpartition(b".")
+        if not payload:
+            return None
+        for key in self.signing_keys:
+            expected = _b64encode(hmac.new(key, payload, hashlib.sha256).digest())
+            if hmac.compare_digest(expected, signature):
+                return _b64decode(payload)
+        return None
+
+    def _decrypt(self, token):
+        from cryptography.fernet import InvalidToken
+        try:
+            return self.fernet.decrypt(token + b"=" * (-len(token) % 4))
+        except InvalidToken:
+            return None
+
+    def get_csrf_token(self, session_id):
+        """Retrieve the CSRF token for a session."""
+        session = self.get_session(session_id)
+        return session["csrf_token"] if session is not None else None
+
+    def validate_csrf_token(self, session_id, csrf_token):
+        """Validate the CSRF token for a session."""
+        session = self.get_session(session_id)
+        return session is not None and hmac.compare_digest(session["csrf_token"], csrf_token or "")
+
+    def delete_session(self, session_id):
+        """
+        Nothing to delete: the session lives in the cookie, which the caller
+        clears. A copy of the cookie stays valid until it expires.
+        """
+
+    def stats(self):
+        """Return the backend's counters."""
+        return {"invalid": self.invalid}
+
+
+def session_id_from_environ(environ, cookie_name="session_id"):
+    """Return the session ID from the request's Cookie header, or None."""
+    cookie_header = environ.get("HTTP_COOKIE")
+    if not cookie_header or cookie_name not in cookie_header:
+        return None
+    for cookie in cookie_header.split(";"):
+        name, _, value = cookie.strip().partition("=")
+        if name == cookie_name:
+            return value or None
+    return None
+
+class SQLiteSession:
+    """A session backend in a SQLite file shared by all worker processes on a host."""
+
+    SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS sessions (
+            id TEXT PRIMARY KEY,
+            user_id NOT NULL,
+            csrf_token TEXT NOT NULL,
+            expires REAL NOT NULL,
+            seen REAL NOT NULL
+        ) WITHOUT ROWID""",
+        "CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires)",
+    )
+    # Kept as constants so each connection's statement cache reuses the compiled statements
+    SELECT = "SELECT user_id, csrf_token, expires, seen FROM sessions WHERE id = ?"
+    INSERT = "INSERT INTO sessions (id, user_id, csrf_token, expires, seen) VALUES (?, ?, ?, ?, ?)"
+    DELETE = "DELETE FROM sessions WHERE id = ?"
+    TOUCH = "UPDATE sessions SET seen = MAX(seen, ?) WHERE id = ?"
+    # Separate statements, so each one can use its index (an OR across both columns scans the table)
+    SWEEP_EXPIRED = "DELETE FROM sessions WHERE expires <= ?"
+    SWEEP_IDLE = "DELETE FROM sessions WHERE seen < ?"
+    # Only created with an idle_timeout: otherwise nothing queries `seen`, and every touch would update the index
+    IDLE_INDEX = "CREATE INDEX IF NOT EXISTS sessions_seen ON sessions (seen)"
+
+    def __init__(self, path, ttl=3600, idle_timeout=None, cache_ttl=1.0, cache_size=4096, flush_interval=5.0,
+                 sweep_interval=60.0, timeout=1.0, clock=time.time):
+        """
+        Initialize the shared session store.
+
+        Reads go through a small per-process cache, so most requests do not
+        query the database at all; a session deleted by another worker (e.g.
+        on logout) stops being accepted here within `cache_ttl` seconds.
+        Activity timestamps are collected in memory and written in one
+        transaction every `flush_interval` seconds instead of once per request.
+
+        Args:
+            path (str): The SQLite file shared by the workers.
+            ttl (float): Seconds a session lives after it is created.
+            idle_timeout (float): Seconds of inactivity after which a session
+                expires, or None for no idle expiry.
+            cache_ttl (float): Seconds a session read from the database is
+                trusted without re-reading it.
+            cache_size (int): Sessions kept in the per-process cache.
+            flush_interval (float): Seconds between batched activity updates.
+            sweep_interval (float): Seconds between deletions of expired sessions, per process.
+            timeout (float): Seconds to wait for the database lock.
+            clock (callable): Returns the current wall-clock time in seconds.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.idle_timeout = idle_timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.flush_interval = flush_interval
+        self.sweep_interval = sweep_interval
+        self.timeout = timeout
+        self.clock = clock
+        self.local = threading.local()
+        self.cache = OrderedDict()  # session_id -> (session, loaded_at)
+        self.touches = {}           # session_id -> last activity not yet written
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.next_flush = clock() + flush_interval
+        self.next_sweep = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.flushes = 0
+        conn = self.get_connection()
+        for statement in self.SCHEMA:
+            conn.execute(statement)
+        if idle_timeout is not None:
+            conn.execute(self.IDLE_INDEX)
+        atexit.register(self.flush)
+
+    def get_connection(self):
+        """Get this thread's connection to the shared database."""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    def create_session(self, user_id, ttl=None):
+        """Create a new session for a user."""
+        session_id = str(binascii.hexlify(os.urandom(16)).decode('utf-8'))  # Generate a unique session ID
+        csrf_token = str(binascii.hexlify(os.urandom(16)).decode('utf-8'))  # Generate a CSRF token
+        now = self.clock()
+        expires = now + (self.ttl if ttl is None else ttl)
+        self.get_connection().execute(self.INSERT, (session_id, user_id, csrf_token, expires, now))
+        session = self._session(user_id, csrf_token, expires)
+        with self.lock:
+            self._cache_put(session_id, session, now)
+        return session_id
+
+    def get_session(self, session_id):
+        """Retrieve session data by session ID, from the cache when it is fresh."""
+        if not session_id:
+            return None
+        now = self.clock()
+        with self.lock:
+            entry = self.cache.get(session_id)
+            if entry is not None and now - entry[1] < self.cache_ttl:
+                self.cache.move_to_end(session_id)
+                self.cache_hits += 1
+                session = entry[0]
+            else:
+                session = None
+                self.cache_misses += 1
+
+        if session is None:
+            try:
+                row = self.get_connection().execute(self.SELECT, (session_id,)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Sessions: lookup failed -> %s", e)
+                return None
+            if row is None or (self.idle_timeout is not None and now - row[3] >= self.idle_timeout):
+                self._forget(session_id)
+                return None
+            session = self._session(row[0], row[1], row[2])
+            with self.lock:
+                self._cache_put(session_id, session, now)
+
+        if now >= session["expires"]:
+            self._forget(session_id)
+            return None
+        with self.lock:
+            self.touches[session_id] = now
+        if now >= self.next_flush:
+            self.flush(now)
+        return session
+
+    def _session(self, user_id, csrf_token, expires):
+        return {"user_id": user_id, "csrf_token": csrf_token,
+                "expiry": datetime.fromtimestamp(expires), "expires": expires}
+
+    def _cache_put(self, session_id, session, now):
+        """Cache a session. The lock must be held."""
+        self.cache[session_id] = (session, now)
+        self.cache.move_to_end(session_id)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def _forget(self, session_id):
+        with self.lock:
+            self.cache.pop(session_id, None)
+            self.touches.pop(session_id, None)
+
+    def get_csrf_token(self, session_id):
+        """Retrieve the CSRF token for a session."""
+        session = self.get_session(session_id)
+        return session["csrf_token"] if session is not None else None
+
+    def validate_csrf_token(self, session_id, csrf_token):
+        """Validate the CSRF token for a session."""
+        session = self.get_session(session_id)
+        return session is not None and session["csrf_token"] == csrf_token
+
+    def delete_session(self, session_id):
+        """Delete a session by session ID, for every worker."""
+        self._forget(session_id)
+        self.get_connection().execute(self.DELETE, (session_id,))
+
+    def flush(self, now=None):
+        """Write the collected activity timestamps in one transaction, and sweep when due."""
+        if not self.flush_lock.acquire(blocking=False):
+            return
+        try:
+            now = self.clock() if now is None else now
+            self.next_flush = now + self.flush_interval
+            with self.lock:
+                touches, self.touches = self.touches, {}
+            conn = self.get_connection()
+            if touches:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(self.TOUCH, ((seen, session_id) for session_id, seen in touches.items()))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                self.flushes += 1
+            if now >= self.next_sweep:
+                self.next_sweep = now + self.sweep_interval
+                conn.execute(self.SWEEP_EXPIRED, (now,))
+                if self.idle_timeout is not None:
+                    conn.execute(self.SWEEP_IDLE, (now - self.idle_timeout,))
+        except sqlite3.Error as e:
+            logger.warning("Sessions: flush failed -> %s", e)
+        finally:
+            self.flush_lock.release()
+
+    def stats(self):
+        """Return the backend's counters."""
+        return {"live": len(self), "cache_hits": self.cache_hits, "cache_misses": self.cache_misses,
+                "cached": len(self.cache), "flushes": self.flushes}
+
+    def __len__(self):
+        return self.get_connection().execute("SELECT COUNT(*) FROM sessions WHERE expires > ?",
+                                             (self.clock(),)).fetchone()[0]
+
+
+class SessionManager:
+    """The process-wide session manager. Delegates to the backend chosen at startup."""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def use(self, backend):
+        """Switch to another backend (e.g. SignedCookieSession) and return it."""
+        self.backend = backend
+        return backend
+
+    def __getattr__(self, name):
+        return getattr(self.backend, name)
+
 
 # Create a global session manager
-session_manager = Session()
+session_manager = SessionManager(Session())
 
@@ -1,8 +1,15 @@
 import os
 
+# Placeholder used when SECRET_KEY is not set; it is public, so never sign anything with it
+DEFAULT_SECRET_KEY = 'default-secret-key'
+
 class Config:
     """Default configuration for the Pylone framework."""
     DEBUG = False
-    SECRET_KEY = os.getenv('SECRET_KEY', 'default-secret-key')
+    SECRET_KEY = os.getenv('SECRET_KEY', DEFAULT_SECRET_KEY)
+    # Previous secret keys, still accepted for signed data while they are rotated out (comma separated)
+    SECRET_KEY_FALLBACKS = [key for key in os.getenv('SECRET_KEY_FALLBACKS', '').split(',') if key]
     STATIC_FOLDER = 'static'
+    TEMPLATE_AUTO_RELOAD = os.getenv('TEMPLATE_AUTO_RELOAD', '1') != '0'  # Check templates for changes on every render
+    TEMPLATE_CACHE_DIR = os.getenv('TEMPLATE_CACHE_DIR')  # Compiled template bytecode cache, kept across restarts
     DATABASE_URI = os.getenv('DATABASE_URI', 'sqlite:///:memory:')
\ No newline at end of file
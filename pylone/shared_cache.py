@@ -0,0 +1,326 @@
+"""pylone/shared_cache.py
+
+This module provides a SharedCache: a key/value store in a memory-mapped
+file (put it on /dev/shm for a RAM-backed file) that every worker process on
+the host maps, so a response or fragment rendered by one worker is a hit in
+all the others.
+
+Layout:
+    The file is a header followed by fixed-size slots, grouped into buckets
+    of `ways` slots (a set-associative cache). A key hashes to one bucket and
+    may live in any of its slots. Values that do not fit in a slot are not
+    shared.
+
+    Writers lock their bucket with a byte-range lock (fcntl.lockf) on the
+    file, plus a thread lock. Readers take no lock: each slot carries a
+    version counter that writers make odd while they write (a seqlock), and
+    a read that sees the version change is retried as a miss.
+
+Eviction:
+    Within a bucket, a new entry takes the slot of the same key, an empty
+    slot, an expired one, or else the least recently used one.
+
+Invalidation broadcast:
+    The header holds a generation counter and a ring of the last RING_SIZE
+    invalidated names (key or tag hashes). Process-local caches layered on
+    top compare the generation (one 8-byte read) on each lookup and drop the
+    affected local entries when it changes.
+
+Key features:
+    - Lock-free reads; bucket-level write locks across processes.
+    - Per-entry TTL and up to MAX_TAGS tags per entry.
+    - invalidate(), invalidate_tag() and clear() reach every worker.
+
+Usage:
+    Every worker opens the same file with the same geometry:
+    >>> shared = SharedCache("/dev/shm/pylone-cache", slots=2048, slot_size=32 << 10)
+    >>> shared.set("page:/demo", body, ttl=60, tags=("path:/demo",))
+    >>> shared.get("page:/demo")
+    (b'<html>...', 1792368167.2)
+    >>> shared.invalidate_tag("path:/demo")
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import os
+import mmap
+import time
+import fcntl
+import struct
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger("pylone.shared_cache")
+
+MAGIC = b"PYLSHC1\0"
+HEADER = struct.Struct("<8sIII")   # magic, slots, slot_size, ways
+GENERATION_OFFSET = 32
+RING_OFFSET = 64
+RING_SIZE = 256
+HEADER_SIZE = 4096                 # RING_OFFSET + RING_SIZE * 8, rounded up to a page
+
+# version, key hash, expires, last used, key length, tag count, value length, tags
+SLOT = struct.Struct("<QQddHHI4Q")
+MAX_TAGS = 4
+VERSION = struct.Struct("<Q")
+FLOAT = struct.Struct("<d")
+
+ALL = 1  # Name hash broadcast by clear(): drop everything
+
+
+def name_hash(name):
+    """Return the 64-bit hash used for keys and tags (never 0 or ALL)."""
+    value = int.from_bytes(hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest(), "little")
+    return value if value > ALL else value + 2
+
+
+class SharedCache:
+    def __init__(self, path, slots=2048, slot_size=32 << 10, ways=8, clock=time.time):
+        """
+        Map the cache file, creating it if needed.
+
+        Args:
+            path (str): The file shared by the workers, e.g. under /dev/shm.
+            slots (int): Number of slots; rounded down to a multiple of `ways`.
+            slot_size (int): Bytes per slot, including its SLOT header and the key.
+            ways (int): Slots per bucket.
+            clock (callable): Returns the current wall-clock time in seconds.
+                It must agree between processes.
+
+        Raises:
+            ValueError: If the file exists with a different geometry.
+        """
+        self.path = path
+        self.ways = ways
+        self.buckets = max(1, slots // ways)
+        self.slots = self.buckets * ways
+        self.slot_size = slot_size
+        self.clock = clock
+        self.size = HEADER_SIZE + self.slots * slot_size
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._initialize()
+        self.map = mmap.mmap(self.fd, self.size)
+        self.thread_locks = [threading.Lock() for _ in range(64)]
+        self.broadcast_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evicted = 0
+        self.too_large = 0
+
+    def _initialize(self):
+        """Write the header of a new or empty file, or check the geometry of an existing one."""
+        fcntl.lockf(self.fd, fcntl.LOCK_EX, HEADER_SIZE, 0)
+        try:
+            header = os.pread(self.fd, HEADER.size, 0)
+            if len(header) == HEADER.size and header[:8] == MAGIC:
+                _, slots, slot_size, ways = HEADER.unpack(header)
+                if (slots, slot_size, ways) != (self.slots, self.slot_size, self.ways):
+                    raise ValueError(f"Shared cache {self.path} has {slots} slots of {slot_size} bytes in buckets "
+                                     f"of {ways}; expected {self.slots} of {self.slot_size} in buckets of {self.ways}")
+                return
+            os.ftruncate(self.fd, 0)
+            os.ftruncate(self.fd, self.size)
+            os.pwrite(self.fd, HEADER.pack(MAGIC, self.slots, self.slot_size, self.ways), 0)
+        finally:
+            fcntl.lockf(self.fd, fcntl.LOCK_UN, HEADER_SIZE, 0)
+
+    def _offset(self, slot):
+        return HEADER_SIZE + slot * self.slot_size
+
+    def _lock(self, bucket):
+        """Lock a bucket against other threads and processes."""
+        lock = self.thread_locks[bucket % len(self.thread_locks)]
+        lock.acquire()
+        try:
+            fcntl.lockf(self.fd, fcntl.LOCK_EX, self.ways * self.slot_size, self._offset(bucket * self.ways))
+        except BaseException:
+            lock.release()
+            raise
+        return lock
+
+    def _unlock(self, bucket, lock):
+        fcntl.lockf(self.fd, fcntl.LOCK_UN, self.ways * self.slot_size, self._offset(bucket * self.ways))
+        lock.release()
+
+    def get(self, key):
+        """
+        Look up a key.
+
+        Returns:
+            tuple: (value bytes, expires as a clock() timestamp), or None.
+        """
+        key_bytes = key.encode("utf-8")
+        h = name_hash(key)
+        bucket = h % self.buckets
+        now = self.clock()
+        data = self.map
+        for slot in range(bucket * self.ways, (bucket + 1) * self.ways):
+            offset = self._offset(slot)
+            version, slot_hash, expires, _, key_len, _, value_len, *_ = SLOT.unpack_from(data, offset)
+            if slot_hash != h or version & 1 or key_len != len(key_bytes):
+                continue
+            start = offset + SLOT.size
+            if data[start:start + key_len] != key_bytes:
+                continue
+            value = data[start + key_len:start + key_len + value_len]
+            if VERSION.unpack_from(data, offset)[0] != version:
+                break  # Rewritten while it was read
+            if now >= expires:
+                break
+            FLOAT.pack_into(data, offset + 24, now)  # Approximate LRU; a lost update is harmless
+            self.hits += 1
+            return value, expires
+        self.misses += 1
+        return None
+
+    def set(self, key, value, ttl, tags=()):
+        """
+        Store a value for `ttl` seconds.
+
+        Args:
+            key (str): The key.
+            value (bytes): The value.
+            ttl (float): Seconds the value is kept.
+            tags (iterable): Up to MAX_TAGS tag names for invalidate_tag().
+
+        Returns:
+            bool: False if the value does not fit in a slot.
+        """
+        key_bytes = key.encode("utf-8")
+        if SLOT.size + len(key_bytes) + len(value) > self.slot_size:
+            self.too_large += 1
+            return False
+        h = name_hash(key)
+        tag_hashes = [name_hash(tag) for tag in tags][:MAX_TAGS]
+        tag_count = len(tag_hashes)
+        tag_hashes += [0] * (MAX_TAGS - tag_count)
+        bucket = h % self.buckets
+        now = self.clock()
+        data = self.map
+
+        lock = self._lock(bucket)
+        try:
+            target, target_rank, target_used = None, 4, None
+            for slot in range(bucket * self.ways, (bucket + 1) * self.ways):
+                offset = self._offset(slot)
+                _, slot_hash, expires, last_used, key_len, *_ = SLOT.unpack_from(data, offset)
+                if slot_hash == h and data[offset + SLOT.size:offset + SLOT.size + key_len] == key_bytes:
+                    rank = 0  # Same key
+                elif slot_hash == 0:
+                    rank = 1  # Empty
+                elif expires <= now:
+                    rank = 2  # Expired
+                else:
+                    rank = 3  # Live: least recently used goes
+                if rank < target_rank or (rank == target_rank == 3 and last_used < target_used):
+                    target, target_rank, target_used = slot, rank, last_used
+                    if rank == 0:
+                        break
+            if target_rank == 3:
+                self.evicted += 1
+
+            offset = self._offset(target)
+            version = VERSION.unpack_from(data, offset)[0]
+            VERSION.pack_into(data, offset, version + 1)  # Odd: being written
+            start = offset + SLOT.size
+            data[start:start + len(key_bytes)] = key_bytes
+            data[start + len(key_bytes):start + len(key_bytes) + len(value)] = value
+            SLOT.pack_into(data, offset, version + 1, h, now + ttl, now, len(key_bytes), tag_count, len(value),
+                           *tag_hashes)
+            VERSION.pack_into(data, offset, version + 2)
+            self.stores += 1
+        finally:
+            self._unlock(bucket, lock)
+        return True
+
+    def _clear_slots(self, bucket, match):
+        """Empty the slots of a bucket for which match(key hash, tag hashes) is true."""
+        data = self.map
+        cleared = 0
+        lock = self._lock(bucket)
+        try:
+            for slot in range(bucket * self.ways, (bucket + 1) * self.ways):
+                offset = self._offset(slot)
+                version, slot_hash, _, _, _, tag_count, _, *tag_hashes = SLOT.unpack_from(data, offset)
+                if slot_hash and match(slot_hash, tag_hashes[:tag_count]):
+                    VERSION.pack_into(data, offset, version + 1)
+                    struct.pack_into("<Q", data, offset + 8, 0)
+                    VERSION.pack_into(data, offset, version + 2)
+                    cleared += 1
+        finally:
+            self._unlock(bucket, lock)
+        return cleared
+
+    def invalidate(self, *keys):
+        """Delete keys in every worker, and broadcast them to the local caches."""
+        hashes = [name_hash(key) for key in keys]
+        for h in hashes:
+            self._clear_slots(h % self.buckets, lambda slot_hash, _, h=h: slot_hash == h)
+        self.broadcast(hashes)
+
+    def invalidate_tag(self, *tags):
+        """Delete every entry carrying one of `tags`, and broadcast the tags to the local caches."""
+        hashes = set(name_hash(tag) for tag in tags)
+        cleared = 0
+        for bucket in range(self.buckets):
+            cleared += self._clear_slots(bucket, lambda _, tag_hashes: not hashes.isdisjoint(tag_hashes))
+        self.broadcast(hashes)
+        return cleared
+
+    def clear(self):
+        """
+        Delete every entry, and tell the local caches to drop everything.
+
+        This flushes every cache layered on the file; to drop one cache's
+        entries, invalidate_tag() the tag it puts on all of them.
+        """
+        for bucket in range(self.buckets):
+            self._clear_slots(bucket, lambda *_: True)
+        self.broadcast([ALL])
+
+    def broadcast(self, hashes):
+        """Append invalidated name hashes to the ring and advance the generation."""
+        data = self.map
+        with self.broadcast_lock:
+            fcntl.lockf(self.fd, fcntl.LOCK_EX, HEADER_SIZE - GENERATION_OFFSET, GENERATION_OFFSET)
+            try:
+                generation = VERSION.unpack_from(data, GENERATION_OFFSET)[0]
+                for h in hashes:
+                    VERSION.pack_into(data, RING_OFFSET + (generation % RING_SIZE) * 8, h)
+                    generation += 1
+                VERSION.pack_into(data, GENERATION_OFFSET, generation)
+            finally:
+                fcntl.lockf(self.fd, fcntl.LOCK_UN, HEADER_SIZE - GENERATION_OFFSET, GENERATION_OFFSET)
+
+    def generation(self):
+        """Return the invalidation generation; it changes whenever something is invalidated."""
+        return VERSION.unpack_from(self.map, GENERATION_OFFSET)[0]
+
+    def changes_since(self, seen):
+        """
+        Return what was invalidated since generation `seen`.
+
+        Returns:
+            tuple: (current generation, set of name hashes), where the set is
+            None if the ring has wrapped or clear() was called, meaning
+            everything must be dropped.
+        """
+        generation = self.generation()
+        if generation - seen > RING_SIZE:
+            return generation, None
+        hashes = set(VERSION.unpack_from(self.map, RING_OFFSET + (g % RING_SIZE) * 8)[0]
+                     for g in range(seen, generation))
+        return generation, None if ALL in hashes else hashes
+
+    def stats(self):
+        """Return this process's counters and the shared generation."""
+        return {"hits": self.hits, "misses": self.misses, "stores": self.stores, "evicted": self.evicted,
+                "too_large": self.too_large, "generation": self.generation()}
+
+    def close(self):
+        """Unmap the file."""
+        self.map.close()
+        os.close(self.fd)
@@ -0,0 +1,99 @@
+"""pylone/singleflight.py
+
+This module provides SingleFlight, which coalesces concurrent calls for the
+same key: the first caller (the leader) runs the function, and callers that
+arrive while it is running wait for its result instead of repeating the
+work. It protects expensive renders and queries from cache stampedes.
+
+Key features:
+    - Per-key coalescing; calls for different keys never wait on each other.
+    - The leader's exception is raised in every waiter too.
+    - Waiters can give up after a timeout and run the function themselves,
+      so a stuck leader never blocks them forever.
+    - A counter of coalesced calls.
+
+Usage:
+    >>> flight = SingleFlight()
+    >>> result = flight.do("page:/demo", render_demo_page)
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self, timeout=None):
+        """
+        Initialize with no calls in flight.
+
+        Args:
+            timeout (float): Seconds a waiter waits for the leader before
+                running the function itself; None waits indefinitely.
+        """
+        self.timeout = timeout
+        self.calls = {}
+        self.lock = threading.Lock()
+        self.coalesced = 0
+        self.timeouts = 0
+
+    def do(self, key, func):
+        """
+        Run `func()` once for all concurrent callers with the same key.
+
+        Args:
+            key: Identifies the work, e.g. a cache key.
+            func (callable): Called with no arguments by the leader.
+
+        Returns:
+            The leader's result.
+
+        Raises:
+            Exception: Whatever the leader's call raised.
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            if call is None:
+                call = self.calls[key] = _Call()
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            if not call.done.wait(self.timeout):
+                with self.lock:
+                    self.timeouts += 1
+                return func()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self):
+        """Return the number of keys currently being computed."""
+        return len(self.calls)
+
+    def stats(self):
+        """Return the coalescing counters."""
+        return {"in_flight": len(self.calls), "coalesced": self.coalesced, "timeouts": self.timeouts}
@@ -0,0 +1,157 @@
+"""pylone/startup.py
+
+This module measures how long a Pylone application takes to boot and breaks
+the time down per module and per package, so that slow imports and
+import-time initialization (model loading, database setup, template
+environments) can be found and deferred.
+
+The application is imported in a fresh interpreter started with
+`-X importtime`, so the numbers reflect a real cold start and the current
+process is left untouched. Each module's "self" time covers both importing
+it and running its module-level code.
+
+Key features:
+    - Whole-process boot time, checked against a time budget.
+    - Per-stage timings for each module imported in order.
+    - Self and cumulative time per module, and self time per top-level package.
+
+Usage:
+    Profile the demo application and print the report:
+    >>> report = profile_startup(["pylone", "demo.app"])
+    >>> print(report.format_report(top=20, budget_ms=200))
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import os
+import sys
+import json
+import time
+import subprocess
+from collections import Counter
+
+MARKER = "__PYLONE_STARTUP__"
+
+CHILD_SCRIPT = """
+import sys, json, time, importlib
+stages = []
+for name in {modules!r}:
+    started = time.perf_counter()
+    importlib.import_module(name)
+    stages.append([name, time.perf_counter() - started])
+sys.stdout.write("\\n{marker}" + json.dumps(stages) + "\\n")
+"""
+
+
+class ModuleTiming:
+    """Import timing for one module, in microseconds."""
+
+    def __init__(self, name, self_us, cumulative_us, depth):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+    @property
+    def package(self):
+        return self.name.split(".", 1)[0]
+
+
+class StartupReport:
+    """Timings collected from one cold start."""
+
+    def __init__(self, modules, wall_seconds, stages, timings):
+        self.modules = modules
+        self.wall_seconds = wall_seconds
+        self.stages = stages
+        self.timings = timings
+
+    def package_totals(self):
+        """Return self time per top-level package, in microseconds."""
+        totals = Counter()
+        for timing in self.timings:
+            totals[timing.package] += timing.self_us
+        return totals
+
+    def format_report(self, top=20, budget_ms=200):
+        """Format the report as text. The budget is the target boot time."""
+        wall_ms = self.wall_seconds * 1000
+        verdict = "OK" if wall_ms <= budget_ms else "OVER BUDGET"
+        lines = [
+            f"Startup report for {', '.join(self.modules)}",
+            f"Process boot (interpreter + imports + init): {wall_ms:.1f} ms  [budget {budget_ms} ms: {verdict}]",
+            "",
+            "Stages:",
+        ]
+        for name, seconds in self.stages:
+            lines.append(f"  import {name:<40} {seconds * 1000:9.1f} ms")
+
+        lines += ["", f"Top {top} packages by import + init time:"]
+        for package, self_us in self.package_totals().most_common(top):
+            lines.append(f"  {package:<47} {self_us / 1000:9.1f} ms")
+
+        lines += ["", f"Top {top} modules (self / cumulative):"]
+        for timing in sorted(self.timings, key=lambda t: t.self_us, reverse=True)[:top]:
+            lines.append(
+                f"  {timing.name:<47} {timing.self_us / 1000:9.1f} ms {timing.cumulative_us / 1000:9.1f} ms"
+            )
+        return "\n".join(lines)
+
+
+def parse_importtime(output):
+    """Parse the stderr of `python -X importtime` into ModuleTiming objects."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # The header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(ModuleTiming(stripped, self_us, cumulative_us, (len(name) - len(stripped) - 1) // 2))
+    return timings
+
+
+def profile_startup(modules, python=None, cwd=None, env=None, timeout=120):
+    """
+    Import `modules` in a fresh interpreter and collect startup timings.
+
+    Args:
+        modules (list): Module names to import, in order (e.g. ["pylone", "demo.app"]).
+        python (str): The interpreter to use (defaults to the current one).
+        cwd (str): Working directory for the child process.
+        env (dict): Environment for the child process.
+        timeout (float): Seconds to wait for the child process.
+
+    Returns:
+        StartupReport: The collected timings.
+
+    Raises:
+        RuntimeError: If the modules fail to import.
+    """
+    script = CHILD_SCRIPT.format(modules=list(modules), marker=MARKER)
+    started = time.perf_counter()
+    child = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", script],
+        cwd=cwd,
+        env=env or os.environ.copy(),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    wall_seconds = time.perf_counter() - started
+    if child.returncode != 0:
+        errors = [line for line in child.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError("Startup profiling failed:\n" + "\n".join(errors[-20:]))
+
+    stages = []
+    for line in child.stdout.splitlines():
+        if line.startswith(MARKER):
+            stages = json.loads(line[len(MARKER):])
+    return StartupReport(list(modules), wall_seconds, stages, parse_importtime(child.stderr))
@@ -0,0 +1,693 @@
+"""pylone/static.py
+
+This module provides StaticFiles, the static file engine used by both
+StaticFileMiddleware and the Router, and the StaticFileCache behind it, which
+keeps small static assets in memory together with their precomputed response
+headers, so repeat requests for CSS, JS and images are served without
+touching the disk.
+
+Key features:
+    - A path -> file index built at startup: known files are resolved with
+      one dictionary lookup, and their MIME types and headers are computed
+      once, when they are loaded.
+    - Names missing from the index are resolved on disk and may not escape
+      the static directory.
+    - LRU eviction bounded by the total size of the cached bodies.
+    - One os.stat() per miss; none per hit until the check interval has
+      passed, after which a changed mtime or size reloads the file.
+    - Files larger than max_file_size are never loaded into memory; only
+      their metadata is cached and the body is streamed through
+      wsgi.file_wrapper, which servers may implement with sendfile().
+    - Hit, miss and reload counters.
+    - Strong ETags built from inode, mtime and size, and conditional request
+      evaluation (If-None-Match, If-Modified-Since) for 304 responses.
+    - An AssetManifest mapping logical names to content-hashed file names
+      (css/style.css -> css/style.3f2a9c1e.css), which can be cached forever,
+      and a static_url() template global that resolves them.
+    - Precompressed .gz (and .br when the brotli package is installed)
+      siblings, chosen per request from Accept-Encoding, so compressed
+      responses cost no CPU at request time.
+
+Usage:
+    Serve a directory, from a middleware or as a WSGI app of its own:
+    >>> static_files = StaticFiles("demo/static", manifest=manifest)
+    >>> status, headers, body = static_files.serve("/static/css/style.css", environ)
+
+    Cache up to 16 MiB of assets, each at most 256 KiB:
+    >>> cache = StaticFileCache(max_bytes=16 << 20, max_file_size=256 << 10)
+    >>> asset = cache.get("/srv/app/static/css/style.css")
+    >>> start_response("200 OK", asset.headers)
+    >>> body = [asset.body] if asset.body is not None else open(asset.path, "rb")
+
+    Answer revalidation requests without a body:
+    >>> if not_modified(environ, asset):
+    ...     start_response("304 Not Modified", asset.not_modified_headers)
+
+    Fingerprint the static directory at startup (or at build time with
+    `python run.py --build-assets`) and resolve names in templates:
+    >>> manifest = AssetManifest.build("demo/static")
+    >>> set_manifest(manifest)
+    >>> static_url("css/style.css")
+    '/static/css/style.3f2a9c1e.css'
+
+    Generate compressed siblings once, at startup or build time:
+    >>> precompress("demo/static")
+    >>> asset = cache.negotiate(cache.get(path), environ.get("HTTP_ACCEPT_ENCODING"))
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import os
+import json
+import gzip
+import stat
+import time
+import hashlib
+import tempfile
+import threading
+import logging
+import mimetypes
+from http import HTTPStatus
+from collections import OrderedDict
+from wsgiref.util import FileWrapper
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger("pylone.static")
+
+HTTP_DATE = "%a, %d %b %Y %H:%M:%S GMT"
+IMMUTABLE = "public, max-age=31536000, immutable"
+MANIFEST_NAME = "manifest.json"
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+COMPRESSED_SUFFIXES = tuple(suffix for _, suffix in ENCODINGS)
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "application/xml", "image/svg+xml")
+
+_STATUS = {status: f"{status.value} {status.phrase}" for status in HTTPStatus}
+
+
+class StaticAsset:
+    """A static file's metadata, response headers and, when small enough, its content."""
+
+    __slots__ = ("path", "size", "mtime", "mtime_ns", "etag", "content_type", "headers",
+                 "not_modified_headers", "immutable_headers", "immutable_not_modified_headers",
+                 "body", "checked", "variants")
+
+    def __init__(self, path, st, content_type, headers, body, checked):
+        self.path = path
+        self.size = st.st_size
+        self.mtime = st.st_mtime
+        self.mtime_ns = st.st_mtime_ns
+        self.etag = make_etag(st)
+        self.content_type = content_type
+        self.headers = headers + [("ETag", self.etag)]
+        # A 304 repeats the validators and caching headers, but not the entity headers.
+        self.not_modified_headers = [(name, value) for name, value in self.headers
+                                     if name not in ("Content-Type", "Content-Length")]
+        # Served under a fingerprinted name, the content can never change.
+        self.immutable_headers = _with_cache_control(self.headers, IMMUTABLE)
+        self.immutable_not_modified_headers = _with_cache_control(self.not_modified_headers, IMMUTABLE)
+        self.body = body
+        self.checked = checked
+        self.variants = ()  # (encoding, StaticAsset) pairs, in order of preference
+
+    @property
+    def cached_bytes(self):
+        """Memory held by this asset's body and its compressed variants' bodies."""
+        total = len(self.body) if self.body is not None else 0
+        for _, variant in self.variants:
+            if variant.body is not None:
+                total += len(variant.body)
+        return total
+
+
+def _with_cache_control(headers, cache_control):
+    return [(name, cache_control if name == "Cache-Control" else value) for name, value in headers]
+
+
+def make_etag(st):
+    """Return a strong ETag for a file from its inode, modification time and size."""
+    return f'"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def not_modified(environ, asset):
+    """
+    Evaluate a request's conditional headers against an asset.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2).
+
+    Returns:
+        bool: True if a 304 Not Modified response should be sent.
+    """
+    if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+    if if_none_match:
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match uses the weak comparison function.
+        tags = (tag.strip() for tag in if_none_match.split(","))
+        return any((tag[2:] if tag.startswith("W/") else tag) == asset.etag for tag in tags)
+
+    if_modified_since = environ.get("HTTP_IF_MODIFIED_SINCE")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(asset.mtime) <= since
+    return False
+
+
+def accepted_encodings(accept_encoding):
+    """Return the set of content codings an Accept-Encoding header allows (q > 0)."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def is_compressible(content_type):
+    """Return True for text-like content types worth compressing."""
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def precompress(static_dir, min_size=1024, min_ratio=0.9):
+    """
+    Write .gz (and .br, if the brotli package is installed) siblings for the
+    compressible files under `static_dir`. Up-to-date siblings are kept.
+
+    Args:
+        static_dir (str): The static directory.
+        min_size (int): Smaller files are not worth compressing.
+        min_ratio (float): Variants larger than this fraction of the
+            original are not kept.
+
+    Returns:
+        int: The number of files written.
+    """
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    compressors = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        compressors.insert(0, (".br", lambda data: brotli.compress(data, quality=11)))
+
+    written = 0
+    for root, _, files in os.walk(static_dir):
+        for filename in files:
+            if filename.endswith(COMPRESSED_SUFFIXES) or filename == MANIFEST_NAME:
+                continue
+            path = os.path.join(root, filename)
+            st = os.stat(path)
+            content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            if st.st_size < min_size or not is_compressible(content_type):
+                continue
+            data = None
+            for suffix, compress in compressors:
+                target = path + suffix
+                try:
+                    if os.stat(target).st_mtime_ns >= st.st_mtime_ns:
+                        continue
+                except OSError:
+                    pass
+                if data is None:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                compressed = compress(data)
+                if len(compressed) > len(data) * min_ratio:
+                    continue
+                with open(target, "wb") as f:
+                    f.write(compressed)
+                written += 1
+    return written
+
+
+class StaticFileCache:
+    def __init__(self, max_bytes=16 << 20, max_file_size=256 << 10, check_interval=2.0,
+                 cache_control="public, max-age=86400", clock=time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes (int): Total size of cached file bodies.
+            max_file_size (int): Files larger than this are streamed, not cached.
+            check_interval (float): Seconds between stat() checks of a cached
+                file; 0 checks on every request.
+            cache_control (str): The Cache-Control header sent with every asset.
+            clock (callable): Returns the current time in seconds.
+        """
+        self.max_bytes = max_bytes
+        self.max_file_size = min(max_file_size, max_bytes)
+        self.check_interval = check_interval
+        self.cache_control = cache_control
+        self.clock = clock
+        self.assets = OrderedDict()
+        self.cached_bytes = 0
+        self.lock = threading.Lock()
+        self.accept_cache = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def get(self, file_path):
+        """
+        Return the StaticAsset for `file_path`, or None if it is not a regular file.
+
+        Args:
+            file_path (str): An absolute, already validated file path.
+        """
+        now = self.clock()
+        with self.lock:
+            asset = self.assets.get(file_path)
+            if asset is not None:
+                self.assets.move_to_end(file_path)
+                if now - asset.checked < self.check_interval:
+                    self.hits += 1
+                    return asset
+
+        try:
+            st = os.stat(file_path)
+        except (OSError, ValueError):  # ValueError: an embedded NUL byte in the path
+            self._discard(file_path)
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            self._discard(file_path)
+            return None
+
+        if asset is not None and asset.mtime_ns == st.st_mtime_ns and asset.size == st.st_size:
+            asset.checked = now
+            with self.lock:
+                self.hits += 1
+            return asset
+
+        with self.lock:
+            if asset is None:
+                self.misses += 1
+            else:
+                self.reloads += 1
+        return self._load(file_path, st, now)
+
+    def _load(self, file_path, st, now):
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        body = None
+        if st.st_size <= self.max_file_size:
+            with open(file_path, "rb") as f:
+                body = f.read()
+            if len(body) != st.st_size:
+                # The file changed while it was read; stream it until it settles.
+                body = None
+        variants = self._load_variants(file_path, st, content_type, now)
+        headers = self.build_headers(st, content_type)
+        if variants:
+            headers.append(("Vary", "Accept-Encoding"))
+        asset = StaticAsset(file_path, st, content_type, headers, body, now)
+        asset.variants = variants
+
+        with self.lock:
+            old = self.assets.pop(file_path, None)
+            if old is not None:
+                self.cached_bytes -= old.cached_bytes
+            self.assets[file_path] = asset
+            self.cached_bytes += asset.cached_bytes
+            while self.cached_bytes > self.max_bytes and len(self.assets) > 1:
+                _, evicted = self.assets.popitem(last=False)
+                self.cached_bytes -= evicted.cached_bytes
+        return asset
+
+    def _load_variants(self, file_path, st, content_type, now):
+        """Load the precompressed siblings of a file that are newer than it."""
+        if not is_compressible(content_type):
+            return ()
+        variants = []
+        for encoding, suffix in ENCODINGS:
+            variant_path = file_path + suffix
+            try:
+                vst = os.stat(variant_path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(vst.st_mode) or vst.st_mtime_ns < st.st_mtime_ns:
+                continue  # Missing or stale
+            body = None
+            if vst.st_size <= self.max_file_size:
+                with open(variant_path, "rb") as f:
+                    body = f.read()
+                if len(body) != vst.st_size:
+                    continue
+            # Same content as the original, so the same Last-Modified, but its own length and ETag
+            headers = self.build_headers(st, content_type, size=vst.st_size)
+            headers += [("Content-Encoding", encoding), ("Vary", "Accept-Encoding")]
+            variant = StaticAsset(variant_path, vst, content_type, headers, body, now)
+            variant.mtime = st.st_mtime
+            variants.append((encoding, variant))
+        return tuple(variants)
+
+    def negotiate(self, asset, accept_encoding):
+        """
+        Pick the best precompressed variant of `asset` for an Accept-Encoding header.
+
+        Returns:
+            StaticAsset: A variant, or `asset` itself if none is acceptable.
+        """
+        if not asset.variants or not accept_encoding:
+            return asset
+        accepted = self.accept_cache.get(accept_encoding)
+        if accepted is None:
+            accepted = accepted_encodings(accept_encoding)
+            if len(self.accept_cache) < 256:  # Browsers send a handful of distinct values
+                self.accept_cache[accept_encoding] = accepted
+        for encoding, variant in asset.variants:
+            if encoding in accepted:
+                return variant
+        return asset
+
+    def build_headers(self, st, content_type, size=None):
+        """Return the response headers for a file (of `size` bytes, if it differs from st)."""
+        return [
+            ("Content-Type", content_type),
+            ("Content-Length", str(st.st_size if size is None else size)),
+            ("Cache-Control", self.cache_control),
+            ("Last-Modified", time.strftime(HTTP_DATE, time.gmtime(st.st_mtime))),
+        ]
+
+    def _discard(self, file_path):
+        with self.lock:
+            old = self.assets.pop(file_path, None)
+            if old is not None:
+                self.cached_bytes -= old.cached_bytes
+
+    def stats(self):
+        """Return the cache's counters."""
+        return {"hits": self.hits, "misses": self.misses, "reloads": self.reloads,
+                "files": len(self.assets), "bytes": self.cached_bytes}
+
+
+class AssetManifest:
+    """Maps logical static file names to content-hashed ("fingerprinted") names."""
+
+    def __init__(self, assets=None, prefix="/static/", sources=None):
+        """
+        Args:
+            assets (dict): Logical name -> fingerprinted name, both relative
+                to the static directory and using "/" separators.
+            prefix (str): The URL prefix static files are served under.
+            sources (dict): Logical name -> (mtime_ns, size) of the file the
+                fingerprint was computed from.
+        """
+        self.assets = dict(assets or {})
+        self.originals = {hashed: name for name, hashed in self.assets.items()}
+        self.prefix = prefix
+        self.sources = {name: tuple(source) for name, source in (sources or {}).items()}
+
+    @classmethod
+    def build(cls, static_dir, prefix="/static/", hash_length=8, previous=None):
+        """
+        Fingerprint every file under `static_dir` and return the manifest.
+
+        Args:
+            previous (AssetManifest): An earlier manifest whose fingerprints
+                are reused for files whose modification time and size have
+                not changed; every other file is hashed.
+        """
+        assets, sources = {}, {}
+        for root, _, files in os.walk(static_dir):
+            for filename in files:
+                if filename == MANIFEST_NAME or filename.endswith(COMPRESSED_SUFFIXES):
+                    continue
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, static_dir).replace(os.sep, "/")
+                st = os.stat(path)
+                source = (st.st_mtime_ns, st.st_size)
+                if previous is not None and previous.sources.get(name) == source and name in previous.assets:
+                    assets[name], sources[name] = previous.assets[name], source
+                    continue
+                digest = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1 << 16), b""):
+                        digest.update(block)
+                base, ext = os.path.splitext(name)
+                assets[name] = f"{base}.{digest.hexdigest()[:hash_length]}{ext}"
+                sources[name] = source
+        return cls(assets, prefix, sources)
+
+    @classmethod
+    def load(cls, path, prefix="/static/"):
+        """Load a manifest written by save()."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["assets"], prefix, data.get("sources"))
+
+    @classmethod
+    def load_or_build(cls, static_dir, path, prefix="/static/"):
+        """
+        Load the manifest at `path` and bring it up to date with `static_dir`.
+
+        Only files whose modification time or size differ from the manifest's
+        record are hashed again (all of them if the file is missing or has
+        no records), and the manifest is saved only if something changed.
+        """
+        try:
+            previous = cls.load(path, prefix)
+        except FileNotFoundError:
+            logger.info("Static: no manifest at %s; fingerprinting %s", path, static_dir)
+            previous = None
+        manifest = cls.build(static_dir, prefix, previous=previous)
+        if previous is None or manifest.assets != previous.assets or manifest.sources != previous.sources:
+            if previous is not None:
+                changed = sum(1 for name, hashed in manifest.assets.items() if previous.assets.get(name) != hashed)
+                logger.info("Static: re-fingerprinted %d changed files in %s", changed, path)
+            manifest.save(path)
+        return manifest
+
+    def source(self, name):
+        """Return the (mtime_ns, size) a logical name was fingerprinted from, or None."""
+        return self.sources.get(name)
+
+    def save(self, path):
+        """
+        Write the manifest as JSON and return self.
+
+        The file is written under a temporary name and renamed into place, so
+        concurrent readers and writers only ever see a complete manifest.
+        """
+        fd, tmp_path = tempfile.mkstemp(prefix=".manifest-", suffix=".tmp", dir=os.path.dirname(path) or ".")
+        try:
+            os.fchmod(fd, 0o644)  # mkstemp creates the file readable by its owner only
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 2, "assets": self.assets, "sources": self.sources}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return self
+
+    def url(self, name):
+        """Return the fingerprinted URL for a logical name, or its plain URL if unknown."""
+        name = name.lstrip("/")
+        return self.prefix + self.assets.get(name, name)
+
+    def original(self, hashed_name):
+        """Return the logical name for a fingerprinted name, or None."""
+        return self.originals.get(hashed_name)
+
+
+class StaticFiles:
+    """
+    Serves one static directory. This is the single static file code path:
+    StaticFileMiddleware and Router.serve_static_file() both delegate to it.
+    """
+
+    BLOCK_SIZE = 64 * 1024  # Chunk size for streamed files
+
+    def __init__(self, static_dir, prefix="/static/", manifest=None, max_cache_bytes=16 << 20,
+                 max_file_size=256 << 10, check_interval=2.0, cache_control="public, max-age=86400", preload=True):
+        """
+        Index the static directory.
+
+        Args:
+            static_dir (str): The directory to serve.
+            prefix (str): The URL prefix files are served under.
+            manifest (AssetManifest): Fingerprinted names to serve as immutable, or None.
+            max_cache_bytes (int): Memory budget for cached file bodies.
+            max_file_size (int): Larger files are streamed, not cached.
+            check_interval (float): Seconds between modification checks of a cached file.
+            cache_control (str): The Cache-Control header for non-fingerprinted names.
+            preload (bool): Load every indexed file's metadata, headers and
+                (within the budget) content now. Pass False to keep file
+                reads out of startup and call preload() from a warm-up step.
+        """
+        self.static_dir = os.path.abspath(static_dir)
+        self.root = self.static_dir + os.sep
+        self.prefix = prefix
+        self.manifest = manifest
+        self.cache = StaticFileCache(max_cache_bytes, max_file_size, check_interval, cache_control)
+        self.index = {}
+        self.build_index(preload)
+
+    def build_index(self, preload=True):
+        """
+        Map every URL name under the prefix, plain and fingerprinted, to its
+        (file path, immutable) pair, so known files are resolved with one
+        dictionary lookup. For a fingerprinted name, `immutable` is the
+        (mtime_ns, size) recorded in the manifest (see serve_file()).
+        """
+        index = {}
+        for root, _, files in os.walk(self.static_dir):
+            for filename in files:
+                if filename == MANIFEST_NAME or filename.endswith(COMPRESSED_SUFFIXES):
+                    continue
+                path = os.path.join(root, filename)
+                index[os.path.relpath(path, self.static_dir).replace(os.sep, "/")] = (path, False)
+        if self.manifest is not None:
+            for name, hashed in self.manifest.assets.items():
+                if name in index:
+                    # Immutable only while the file still matches what was fingerprinted
+                    index[hashed] = (index[name][0], self.manifest.source(name) or False)
+        self.index = index
+        if preload:
+            self.preload()
+        return index
+
+    def preload(self):
+        """Load every indexed file into the cache (within its budget). Returns the number of files."""
+        loaded = 0
+        for path, immutable in self.index.values():
+            if not immutable:  # Fingerprinted names share their file with the plain name
+                self.cache.get(path)
+                loaded += 1
+        return loaded
+
+    def resolve(self, name):
+        """
+        Return the (file path, immutable) pair for a name relative to the prefix.
+
+        Names missing from the index (files added since startup) are resolved
+        on disk and must stay inside the static directory.
+
+        Returns:
+            tuple: (file path, immutable), or None if the name escapes the directory.
+        """
+        entry = self.index.get(name)
+        if entry is not None:
+            return entry
+        path = os.path.normpath(os.path.join(self.static_dir, name))
+        if not path.startswith(self.root):
+            return None
+        return path, False
+
+    def serve(self, path, environ):
+        """
+        Serve a request path under the prefix.
+
+        Args:
+            path (str): The request path, e.g. "/static/css/style.css".
+            environ (dict): The WSGI environment.
+
+        Returns:
+            tuple: (status, headers, body), where body is a list of bytes or a
+            wsgi.file_wrapper iterable.
+        """
+        method = environ.get("REQUEST_METHOD", "GET")
+        if method not in ("GET", "HEAD"):
+            return _STATUS[HTTPStatus.METHOD_NOT_ALLOWED], [("Content-Type", "text/plain"), ("Allow", "GET, HEAD")], \
+                [b"405 Method Not Allowed"]
+
+        name = path[len(self.prefix):]
+        if "\x00" in name:
+            logger.debug("Static: NUL byte in path -> %r", path)
+            return _STATUS[HTTPStatus.NOT_FOUND], [("Content-Type", "text/plain")], [b"404 File Not Found"]
+        if name.endswith(COMPRESSED_SUFFIXES):
+            # Precompressed siblings are only served through content negotiation
+            # on their source file; on their own they would go out as gzip or
+            # brotli bytes labelled with the source's type
+            logger.debug("Static: precompressed variant requested directly -> %s", path)
+            return _STATUS[HTTPStatus.NOT_FOUND], [("Content-Type", "text/plain")], [b"404 File Not Found"]
+
+        entry = self.resolve(name)
+        if entry is None:
+            logger.warning("Static: blocked path outside the static directory -> %s", path)
+            return _STATUS[HTTPStatus.FORBIDDEN], [("Content-Type", "text/plain")], [b"403 Forbidden"]
+
+        response = self.serve_file(entry[0], environ, entry[1])
+        if response is None:
+            logger.debug("Static: file not found -> %s", path)
+            return _STATUS[HTTPStatus.NOT_FOUND], [("Content-Type", "text/plain")], [b"404 File Not Found"]
+        return response
+
+    def serve_file(self, file_path, environ, immutable=False):
+        """
+        Serve a resolved file, answering conditional and HEAD requests.
+
+        Args:
+            file_path (str): An absolute file path inside the static directory.
+            environ (dict): The WSGI environment.
+            immutable: True to send the immutable caching headers, or the
+                (mtime_ns, size) the file's fingerprint was computed from, to
+                send them only while the file still matches it. A file
+                changed since it was fingerprinted is served with the regular
+                headers, so its new content is never cached forever under
+                the old fingerprint.
+
+        Returns:
+            tuple: (status, headers, body), or None if the file does not exist.
+        """
+        try:
+            asset = self.cache.get(file_path)
+            if asset is None:
+                return None
+            if immutable and immutable is not True:
+                immutable = immutable == (asset.mtime_ns, asset.size)
+                if not immutable:
+                    logger.debug("Static: %s changed since it was fingerprinted; serving it as mutable", file_path)
+
+            asset = self.cache.negotiate(asset, environ.get("HTTP_ACCEPT_ENCODING"))
+            if not_modified(environ, asset):
+                return _STATUS[HTTPStatus.NOT_MODIFIED], \
+                    asset.immutable_not_modified_headers if immutable else asset.not_modified_headers, []
+
+            headers = asset.immutable_headers if immutable else asset.headers
+            if environ.get("REQUEST_METHOD") == "HEAD":
+                return _STATUS[HTTPStatus.OK], headers, []
+            if asset.body is not None:
+                # Served from memory with precomputed headers
+                return _STATUS[HTTPStatus.OK], headers, [asset.body]
+
+            # Large file: let the server stream it (with sendfile() where it can)
+            file_wrapper = environ.get("wsgi.file_wrapper", FileWrapper)
+            return _STATUS[HTTPStatus.OK], headers, file_wrapper(open(asset.path, "rb"), self.BLOCK_SIZE)
+        except OSError as e:
+            logger.error("Static: error serving %s -> %s", file_path, e)
+            return _STATUS[HTTPStatus.INTERNAL_SERVER_ERROR], [("Content-Type", "text/plain")], \
+                [b"500 Internal Server Error"]
+
+    def __call__(self, environ, start_response):
+        """WSGI interface: serve PATH_INFO, which must start with the prefix."""
+        status, headers, body = self.serve(environ.get("PATH_INFO", ""), environ)
+        start_response(status, headers)
+        return body
+
+
+_manifest = None
+
+
+def set_manifest(manifest):
+    """Set the manifest used by static_url()."""
+    global _manifest
+    _manifest = manifest
+
+
+def static_url(name):
+    """Template global: the URL of a static file, fingerprinted when a manifest is set."""
+    if _manifest is None:
+        return "/static/" + name.lstrip("/")
+    return _manifest.url(name)
@@ -9,16 +9,37 @@ web applications.
 
 Key features:
     - Initialization of a Jinja2 Environment with file system loader and autoescaping.
+    - A process-wide registry: get_template_engine() returns one shared
+      engine per templates directory, so every controller reuses the same
+      compiled templates.
+    - An optional filesystem bytecode cache, so compiled templates survive
+      restarts.
+    - A production mode (auto_reload=False) that skips the per-render
+      template mtime check.
     - Template rendering with context handling and error logging.
+    - Streaming rendering with Jinja's generate(): stream() yields encoded,
+      buffered chunks, so a large page is sent while it is rendered and the
+      browser can fetch CSS/JS from the <head> early.
+    - Precompilation of every template, used by the warm-up phase.
+    - A static_url() global and filter resolving fingerprinted static URLs.
+    - A {% cache key, ttl, tags %} tag for caching rendered fragments (see
+      pylone/fragment_cache.py).
     - Generation of WSGI-compliant responses with rendered template content.
 
 Usage:
-    Initialize a TemplateEngine with a directory containing templates:
-    >>> engine = TemplateEngine("templates")
+    Get the shared engine for a directory containing templates:
+    >>> engine = get_template_engine("templates")
+
+    In production, stop checking templates for changes and keep compiled
+    bytecode on disk (applies to existing and future engines):
+    >>> configure_templates(auto_reload=False, bytecode_cache_dir="/var/cache/pylone/jinja")
 
     Render a template with a context:
     >>> rendered_output = engine.render("index.html", {"name": "User"})
 
+    Stream a large page in chunks of about 8 KiB:
+    >>> return Response(engine.stream("users.html", {"users": db.get_all_users()}))
+
     Generate a WSGI-compliant response:
     >>> body, status, headers = engine.render_template("page.html", {"data": "content"})
     
@@ -29,18 +50,72 @@ Usage:
 import os
 import logging
 import re
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import threading
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+from pylone.static import static_url
+from pylone.fragment_cache import FragmentCacheExtension
+
+logger = logging.getLogger("pylone.template")
+
+# Settings applied to every engine, see configure_templates()
+_settings = {"auto_reload": True, "bytecode_cache_dir": None}
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def make_bytecode_cache(directory):
+    """Return a FileSystemBytecodeCache in `directory` (created if needed), or None."""
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    return FileSystemBytecodeCache(directory)
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 
 class TemplateEngine:
-    def __init__(self, templates_dir):
-        """Initialize the Jinja2 template environment."""
+    STREAM_BUFFER_SIZE = 8192  # Characters collected per streamed chunk
+
+    def __init__(self, templates_dir, auto_reload=None, bytecode_cache_dir=None):
+        """
+        Initialize the Jinja2 template environment.
+
+        Prefer get_template_engine(), which shares one engine per directory.
+
+        Args:
+            templates_dir (str): The directory containing the templates.
+            auto_reload (bool): Check templates for changes on every render
+                (defaults to the configure_templates() setting).
+            bytecode_cache_dir (str): Directory for compiled template bytecode
+                (defaults to the configure_templates() setting; None disables it).
+        """
+        self.templates_dir = templates_dir
         self.env = Environment(
             loader=FileSystemLoader(templates_dir),
-            autoescape=select_autoescape(['html', 'xml'])
+            autoescape=select_autoescape(['html', 'xml']),
+            extensions=[FragmentCacheExtension],
+            auto_reload=_settings["auto_reload"] if auto_reload is None else auto_reload,
+            bytecode_cache=make_bytecode_cache(bytecode_cache_dir or _settings["bytecode_cache_dir"]),
         )
+        self.env.globals["static_url"] = static_url
+        self.env.filters["static_url"] = static_url
+
+    def precompile(self):
+        """
+        Compile every template under the templates directory into the
+        environment's cache, so that first renders skip the compile step.
+        With a bytecode cache, the compiled code is also written to disk for
+        the next process to load.
+
+        Returns:
+            int: The number of templates compiled.
+        """
+        compiled = 0
+        for template_name in self.env.list_templates():
+            try:
+                self.env.get_template(template_name)
+                compiled += 1
+            except Exception as e:
+                logger.error("Template precompile error in %s: %s", template_name, e)
+        return compiled
 
     def render(self, template_name, context=None):
         """Render a template with the given context."""
@@ -51,9 +126,49 @@ class TemplateEngine:
             template = self.env.get_template(template_name)
             return template.render(context)
         except Exception as e:
-            logging.error(f"Template rendering error: {e}")
+            logger.error("Template rendering error: %s", e)
             raise
 
+    def stream(self, template_name, context=None, buffer_size=None):
+        """
+        Render a template incrementally.
+
+        The template is loaded (and any loading error raised) immediately;
+        the body is rendered as the returned iterator is consumed, so an
+        error while rendering ends the response early instead of replacing it.
+
+        Args:
+            template_name (str): The template to render.
+            context (dict): The template context.
+            buffer_size (int): Characters collected before a chunk is
+                yielded (defaults to STREAM_BUFFER_SIZE); 0 yields every
+                piece Jinja produces.
+
+        Returns:
+            iterator: UTF-8 encoded chunks, suitable as a Response body.
+        """
+        try:
+            template = self.env.get_template(template_name)
+        except Exception as e:
+            logger.error("Template rendering error: %s", e)
+            raise
+        return self._generate(template, context or {}, self.STREAM_BUFFER_SIZE if buffer_size is None else buffer_size)
+
+    def _generate(self, template, context, buffer_size):
+        buffer, size = [], 0
+        try:
+            for piece in template.generate(context):
+                buffer.append(piece)
+                size += len(piece)
+                if size >= buffer_size:
+                    yield "".join(buffer).encode("utf-8")
+                    buffer, size = [], 0
+        except Exception as e:
+            logger.error("Template streaming error in %s: %s", template.name, e)
+            raise
+        if buffer:
+            yield "".join(buffer).encode("utf-8")
+
     def render_template(self, template_name, context=None, status=200, headers=None):
         """Render a template and return a WSGI-compliant response."""
         try:
@@ -63,5 +178,43 @@ class TemplateEngine:
             headers['Content-Type'] = 'text/html'
             return body, status, headers
         except Exception as e:
-            logging.error(f"Template rendering error: {e}")
-            raise
\ No newline at end of file
+            logger.error("Template rendering error: %s", e)
+            raise
+
+
+def get_template_engine(templates_dir):
+    """Return the process-wide TemplateEngine for `templates_dir`, creating it on first use."""
+    key = os.path.realpath(templates_dir)
+    engine = _engines.get(key)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = _engines[key] = TemplateEngine(key)
+    return engine
+
+
+def template_engines():
+    """Return every engine created by get_template_engine()."""
+    return list(_engines.values())
+
+
+def configure_templates(auto_reload=None, bytecode_cache_dir=None):
+    """
+    Set the template settings for all shared engines, existing and future.
+
+    Args:
+        auto_reload (bool): Check templates for changes on every render.
+            Turn this off in production.
+        bytecode_cache_dir (str): Keep compiled template bytecode in this
+            directory, so it survives restarts.
+    """
+    if auto_reload is not None:
+        _settings["auto_reload"] = auto_reload
+    if bytecode_cache_dir is not None:
+        _settings["bytecode_cache_dir"] = bytecode_cache_dir
+    bytecode_cache = make_bytecode_cache(_settings["bytecode_cache_dir"])
+    for engine in template_engines():
+        engine.env.auto_reload = _settings["auto_reload"]
+        if bytecode_cache is not None:
+            engine.env.bytecode_cache = bytecode_cache
@@ -0,0 +1,133 @@
+"""pylone/warmup.py
+
+This module provides a Warmup class that runs a list of warm-up steps before
+the HTTP server starts accepting traffic, so that the first real requests
+after a deploy do not pay for one-off costs such as template compilation,
+opening database connections or loading NLP models.
+
+Key features:
+    - Named warm-up steps with per-step timing.
+    - Template precompilation for one or more TemplateEngine instances.
+    - Synthetic requests issued in-process through the full WSGI stack.
+    - A readiness event that is set only once every step has finished and,
+      when a server runs the warm-up, its listening socket is bound.
+    - Failing steps are logged and skipped; they never prevent startup.
+
+Usage:
+    Register steps while setting up the application:
+    >>> warmup = Warmup()
+    >>> warmup.add_templates()  # Every engine from get_template_engine()
+    >>> warmup.add_step("database", db.prime)
+    >>> warmup.add_requests(wsgi_app, ["/login", "/static/css/style.css"])
+
+    Run them before serving, on the thread that will serve requests:
+    >>> warmup.run()
+    >>> warmup.ready.is_set()
+    True
+
+    A server marks itself ready only once it can accept connections:
+    >>> warmup.run(mark_ready=False)
+    >>> server = make_server(host, port, app)
+    >>> warmup.mark_ready()
+
+    Date Created: October 18, 2026
+    Author: Agile Creative Labs Inc.
+    Copyright: © 2026 Agile Creative Labs Inc.
+"""
+import time
+import logging
+import threading
+
+logger = logging.getLogger("pylone.warmup")
+
+
+class Warmup:
+    def __init__(self):
+        """Initialize an empty list of warm-up steps."""
+        self.steps = []
+        self.timings = []
+        self.ready = threading.Event()
+
+    def add_step(self, name, func):
+        """
+        Register a warm-up step.
+
+        Args:
+            name (str): A short name used in the readiness report.
+            func (callable): Called with no arguments.
+        """
+        self.steps.append((name, func))
+        return self
+
+    def add_templates(self, *template_engines):
+        """
+        Precompile every template of the given TemplateEngine instances, or
+        of every shared engine (pylone.template.template_engines()) when none
+        are given.
+        """
+        def precompile():
+            if template_engines:
+                engines = {id(engine): engine for engine in template_engines}.values()
+            else:
+                from pylone.template import template_engines as shared_engines
+                engines = shared_engines()
+            return sum(engine.precompile() for engine in engines)
+        return self.add_step("templates", precompile)
+
+    def add_requests(self, app, requests):
+        """
+        Issue synthetic requests through a WSGI application.
+
+        Args:
+            app (callable): The WSGI application, including its middlewares.
+            requests (list): Paths to GET, or dicts with "method", "path",
+                "headers" and "body" keys.
+        """
+        def issue():
+            from pylone.bench import build_environ, call_wsgi
+
+            for request in requests:
+                if isinstance(request, str):
+                    request = {"path": request}
+                environ = build_environ(
+                    request.get("method", "GET"),
+                    request["path"],
+                    request.get("headers"),
+                    request.get("body", b""),
+                )
+                environ["pylone.warmup"] = True
+                call_wsgi(app, environ)
+            return len(requests)
+        return self.add_step("requests", issue)
+
+    def run(self, mark_ready=True):
+        """
+        Run every step in order.
+
+        Args:
+            mark_ready (bool): Set the readiness event when done. Servers
+                pass False and call mark_ready() once their listening socket
+                is bound, so readiness checks never pass before then.
+        """
+        started = time.perf_counter()
+        for name, func in self.steps:
+            step_started = time.perf_counter()
+            try:
+                result = func()
+            except Exception as e:
+                logger.warning("Warmup: step '%s' failed -> %s", name, e)
+                result = None
+            elapsed = time.perf_counter() - step_started
+            self.timings.append((name, elapsed))
+            detail = f" ({result})" if isinstance(result, int) and not isinstance(result, bool) else ""
+            logger.info("Warmup: %s%s took %.1f ms", name, detail, elapsed * 1000)
+
+        logger.info("Warmup: finished after %.1f ms", (time.perf_counter() - started) * 1000)
+        if mark_ready:
+            self.mark_ready()
+        return self.timings
+
+    def mark_ready(self):
+        """Set the readiness event."""
+        self.ready.set()
+        logger.info("Warmup: ready")
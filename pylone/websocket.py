@@ -1,8 +1,8 @@
 # pylone/websocket.py
-import asyncio
 import logging
 import re
-from websockets import serve
+
+logger = logging.getLogger("pylone.websocket")
 
 class WebSocketWrapper:
     """Wrapper for handling WebSocket connections."""
@@ -25,7 +25,7 @@ class WebSocketWrapper:
             "pattern": re.compile(f"^{pattern}$"),
             "handler": handler
         }
-        logging.info(f"WebSocket Route Added: {path}")
+        logger.info("WebSocket Route Added: %s", path)
         
     async def handle_connection(self, websocket, path):
         """
@@ -40,7 +40,7 @@ class WebSocketWrapper:
         matched = False
         
         try:
-            logging.info(f"New WebSocket connection: {path}")
+            logger.info("New WebSocket connection: %s", path)
             
             # Match the path to a registered WebSocket route
             for route_path, route_info in self.websocket_routes.items():
@@ -58,11 +58,11 @@ class WebSocketWrapper:
                     break
             
             if not matched:
-                logging.warning(f"No WebSocket handler found for path: {path}")
+                logger.warning("No WebSocket handler found for path: %s", path)
                 await websocket.close(1003, "Path not found")
                 
         except Exception as e:
-            logging.error(f"Error in WebSocket handler: {e}")
+            logger.error("Error in WebSocket handler: %s", e)
         finally:
             # Remove client from the connected clients set
             if websocket in self.clients:
@@ -81,7 +81,7 @@ class WebSocketWrapper:
                 try:
                     await client.send(message)
                 except Exception as e:
-                    logging.error(f"Error broadcasting to client: {e}")
+                    logger.error("Error broadcasting to client: %s", e)
                     
     async def start(self, host="127.0.0.1", port=8001):
         """
@@ -91,7 +91,9 @@ class WebSocketWrapper:
             host (str): Host address to bind to.
             port (int): Port to listen on.
         """
+        import asyncio
+        from websockets import serve  # Deferred so HTTP-only workers never import websockets or asyncio
         async with serve(self.handle_connection, host, port):
-            logging.info(f"WebSocket server started on ws://{host}:{port}")
+            logger.info("WebSocket server started on ws://%s:%s", host, port)
             # Keep the server running
             await asyncio.Future()  # Run forever
\ No newline at end of file
@@ -13,24 +13,31 @@ Usage:
     python3 run.py --no-ws              # Run only HTTP server (no WebSocket)
     python3 run.py -p 9000 -w 9001      # Run HTTP on 9000, WS on 9001
     python3 run.py --debug              # Run with debug logging enabled
+    python3 run.py --log-profile production  # Quiet, low-overhead logging
     python3 run.py --help-info          # Display detailed help information
+    python3 run.py --startup-report     # Break down boot time per module and exit
+    python3 run.py --build-assets       # Precompress and fingerprint static files, then exit
+    python3 run.py bench -c 16 -d 30    # Load-test a running server (closed loop)
+    python3 run.py bench --rate 500 --mix mix.json  # Constant-rate load with a request mix
+    python3 run.py replay --capture capture.jsonl   # Replay captured traffic in-process
 
 Examples:
     Standard web server:      python run.py
     Custom ports:             python run.py -p 5000 -w 5001
     HTTP only:                python run.py --no-ws
     Development mode:         python run.py --debug -p 3000
+    Load test:                python run.py bench -p 8000 --rate 200 --path /ajax/data
 
 Author: Agile Creative Labs Inc.
 License: Apache License
 Copyright: (c) 2025 Agile Creative Labs Inc
 """
 
+import os
 import sys
 import signal
-import logging
 import argparse
-from demo.app import app
+from pylone.log import configure_logging
 
 # Fancy Open-Source Banner
 BANNER = r"""
@@ -67,6 +74,19 @@ SERVER MODES:
      - Runs only the HTTP server, no WebSocket support
      - Example: python run.py --no-ws
 
+  3. Benchmark Mode
+     - Load-tests a running Pylone server over keep-alive HTTP/1.1 connections
+     - Closed loop by default; --rate switches to open-loop constant-rate mode,
+       where latency is measured from each request's scheduled send time
+     - --mix loads a weighted request mix from a JSON file (see pylone/loadgen.py)
+     - Example: python run.py bench -p 8000 -c 32 -d 30 --rate 1000
+
+  4. Replay Mode
+     - Replays traffic recorded with CAPTURE_FILE=capture.jsonl python run.py
+     - In-process through the WSGI stack by default, or over HTTP with --target
+     - Original pacing by default; --speed scales it, --fast disables it
+     - Example: python run.py replay --capture capture.jsonl --fast
+
 PORT CONFIGURATION:
   - Valid port range: 1024-65535 (ports below 1024 require root/admin privileges)
   - HTTP and WebSocket ports must be different
@@ -79,6 +99,31 @@ DEBUGGING:
   - Log level is set to DEBUG instead of INFO
   - Useful for development and troubleshooting
 
+LOGGING PROFILES:
+  --log-profile (or the PYLONE_LOG_PROFILE environment variable) selects how
+  much is logged (see pylone/log.py):
+  - development: INFO, or DEBUG with --debug (default)
+  - production:  framework messages at INFO, everything else at WARNING;
+                 debug detail (headers, cookies, bodies) is never formatted
+  - benchmark:   errors only
+
+STATIC ASSETS:
+  --build-assets content-hashes the static files into demo/static/manifest.json
+  (or $STATIC_MANIFEST). At startup the manifest is loaded and only files whose
+  modification time or size changed are hashed again. Templates link to
+  them with static_url('css/style.css'), which yields
+  /static/css/style.<hash>.css, served with a one-year immutable
+  Cache-Control. Compressible files also get .gz siblings (and .br when the
+  brotli package is installed) when --build-assets runs, served to clients
+  that accept them. Startup only reads files, to stay within the boot budget.
+
+STARTUP PROFILING:
+  --startup-report imports the application in a fresh interpreter with
+  -X importtime and prints the boot time against a 200 ms budget, followed
+  by the slowest packages and modules (import plus module-level init time).
+  Heavy subsystems (spaCy, spell checking, websockets, PDF generation) are
+  loaded on first use, so HTTP-only workers (--no-ws) never import them.
+
 RUNTIME CONTROLS:
   - Press CTRL+C to gracefully shutdown the server
   - The shutdown process will close all active connections properly
@@ -94,11 +139,28 @@ Apache License | Open Source & Free
 
 # Command-line argument parser
 parser = argparse.ArgumentParser(description="Run the Pylone web server.")
+parser.add_argument("mode", nargs="?", choices=["serve", "bench", "replay"], default="serve", help="Serve the application (default), load-test a running server or replay captured traffic")
 parser.add_argument("-p", "--port", type=int, default=8000, help="Port to run the HTTP server on (default: 8000)")
 parser.add_argument("-w", "--ws-port", type=int, default=8001, help="Port to run the WebSocket server on (default: 8001)")
 parser.add_argument("--no-ws", action="store_true", help="Disable WebSocket server")
 parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+parser.add_argument("--log-profile", choices=["development", "production", "benchmark"], default=os.getenv("PYLONE_LOG_PROFILE", "development"), help="Logging profile (default: development, or $PYLONE_LOG_PROFILE)")
 parser.add_argument("--help-info", action="store_true", help="Display detailed help information")
+parser.add_argument("--startup-report", action="store_true", help="Report import and initialization time per module, then exit")
+parser.add_argument("--build-assets", action="store_true", help="Precompress and fingerprint the static files (and compile templates into $TEMPLATE_CACHE_DIR), then exit")
+bench_group = parser.add_argument_group("bench mode")
+bench_group.add_argument("--target", help="Base URL to load-test (default: http://127.0.0.1:<port>)")
+bench_group.add_argument("-c", "--connections", type=int, default=8, help="Concurrent keep-alive connections (default: 8)")
+bench_group.add_argument("-d", "--duration", type=float, default=10.0, help="Test duration in seconds (default: 10)")
+bench_group.add_argument("--rate", type=float, help="Open-loop constant rate in requests/sec (default: closed loop)")
+bench_group.add_argument("--mix", help="JSON file with a weighted request mix")
+bench_group.add_argument("--path", default="/", help="Path to request when no mix file is given (default: /)")
+bench_group.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds (default: 10)")
+bench_group.add_argument("--seed", type=int, help="Random seed for the request mix")
+replay_group = parser.add_argument_group("replay mode")
+replay_group.add_argument("--capture", help="JSON lines capture file to replay")
+replay_group.add_argument("--speed", type=float, default=1.0, help="Pacing multiplier relative to the capture (default: 1.0)")
+replay_group.add_argument("--fast", action="store_true", help="Replay as fast as possible, ignoring the original pacing")
 args = parser.parse_args()
 
 # Display banner
@@ -110,8 +172,70 @@ if args.help_info:
     sys.exit(0)
 
 # Setup logging
-log_level = logging.DEBUG if args.debug else logging.INFO
-logging.basicConfig(level=log_level)
+configure_logging(args.log_profile, debug=args.debug)
+
+# Profile a cold start of the application
+if args.startup_report:
+    from pylone.startup import profile_startup
+
+    report = profile_startup(["pylone", "demo.app"], cwd=os.path.dirname(os.path.abspath(__file__)))
+    print(report.format_report(top=20, budget_ms=200))
+    sys.exit(0)
+
+# Build-time asset step: content-hash every static file into the manifest
+if args.build_assets:
+    from pylone.static import AssetManifest, MANIFEST_NAME, precompress
+
+    static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "demo", "static")
+    manifest_path = os.getenv("STATIC_MANIFEST") or os.path.join(static_dir, MANIFEST_NAME)
+    print(f"Precompressed {precompress(static_dir)} files")
+    manifest = AssetManifest.build(static_dir).save(manifest_path)
+    print(f"Fingerprinted {len(manifest.assets)} files into {manifest_path}")
+    # Compile the templates ahead of time into the bytecode cache, if one is configured
+    template_cache_dir = os.getenv("TEMPLATE_CACHE_DIR")
+    if template_cache_dir:
+        from pylone.template import get_template_engine, configure_templates
+
+        configure_templates(bytecode_cache_dir=template_cache_dir)
+        templates_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "demo", "templates")
+        print(f"Compiled {get_template_engine(templates_dir).precompile()} templates into {template_cache_dir}")
+    sys.exit(0)
+
+# Run the load generator against an already running server
+if args.mode == "bench":
+    from pylone.loadgen import LoadGenerator, RequestSpec, load_mix
+
+    requests = load_mix(args.mix) if args.mix else [RequestSpec("GET", args.path)]
+    target = args.target or f"http://127.0.0.1:{args.port}"
+    mode = f"at {args.rate:g} req/s" if args.rate else "closed loop"
+    print(f"Benchmarking {target} with {args.connections} connections for {args.duration:g}s ({mode})")
+    generator = LoadGenerator(target, requests, args.connections, args.duration, args.rate, args.timeout, args.seed)
+    print(generator.run().format_report())
+    sys.exit(0)
+
+# Replay captured traffic in-process or against a running server
+if args.mode == "replay":
+    from pylone.replay import Replayer, load_capture
+
+    if not args.capture:
+        parser.error("replay mode requires --capture FILE")
+    records = load_capture(args.capture)
+    speed = None if args.fast else args.speed
+    if args.target:
+        replayer = Replayer(records, target=args.target, speed=speed, connections=args.connections, timeout=args.timeout)
+    else:
+        from demo.app import app
+        configure_logging("benchmark")
+        replayer = Replayer(records, app=app, speed=speed)
+    print(f"Replaying {len(records)} requests from {args.capture}")
+    print(replayer.run().format_report())
+    sys.exit(0)
+
+from demo.app import app, warm_chatbot
+
+# Load the chatbot's models during warm-up when WebSockets are served
+if not args.no_ws:
+    app.base_app.warmup.add_step("chatbot", warm_chatbot)
 
 # Validate WebSocket port if WebSocket is enabled
 if not args.no_ws:
@@ -134,7 +258,6 @@ def shutdown_server(signal, frame):
 signal.signal(signal.SIGINT, shutdown_server)
 
 # Start the servers
-# TODO: modify the pylone/app_proxy.py and demo/app.py to support websocket disabling.
 if __name__ == '__main__':
     if args.no_ws:
         # Run only HTTP server if WebSocket is disabled